@@ -0,0 +1,234 @@
+"""Fixtures for the benchmarks of CobraMod
+
+The benchmarks run without network access. Requests are answered by an
+in-process stand-in server, :class:`StandInAdapter`, that replays the
+responses recorded in the test data directory "tests/data". Requests that
+cannot be replayed raise a :class:`requests.ConnectionError`. Alternatively,
+the responses can be replayed from an archive recorded with
+:func:`cobramod.transport.configure_transport`:
+
+    pytest benchmarks --archive responses.zip
+
+The benchmarks use pytest-benchmark. Run them with tox to save the results
+and compare them with the previous run:
+
+    tox -e benchmark
+
+The results are stored in the directory ".benchmarks" together with the
+commit. See the documentation of pytest-benchmark for more comparisons.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import urllib.parse
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+import cobramod.transport as cmod_transport
+from cobramod.core import crossreferences as cmod_crossreferences
+from cobramod.parsing.db_version import DataVersionConfigurator
+
+# Recorded responses
+DATA = Path(__file__).resolve().parents[1].joinpath("tests", "data")
+
+
+class StandInAdapter(BaseAdapter):
+    """
+    Transport for requests that replays the recorded responses of BioCyc,
+    PMN and KEGG from a data directory. MetaNetX is answered with a
+    synthetic identifier for each query.
+    """
+
+    def __init__(self, directory: Path):
+        super().__init__()
+        self.directory = directory
+        self.requests = 0
+
+    def _file(self, url: urllib.parse.SplitResult) -> Optional[Path]:
+        """
+        Returns the recorded file for given URL or None if it is unknown.
+        """
+        query = urllib.parse.parse_qs(url.query)
+
+        if url.path == "/getxml":
+            database, identifier = query["id"][0].split(":", 1)
+            family = "PMN" if url.hostname == "pmn.plantcyc.org" else ""
+            return self.directory.joinpath(
+                family, database, f"{identifier}.xml"
+            )
+
+        if url.path == "/apixml":
+            database, identifier = query["id"][0].split(":", 1)
+            return self.directory.joinpath(
+                database, "GENES", f"{identifier}_genes.xml"
+            )
+
+        if url.hostname == "rest.kegg.jp":
+            _, operation, *arguments = url.path.split("/")
+
+            if operation == "get":
+                return self.directory.joinpath("KEGG", f"{arguments[0]}.txt")
+
+            if operation == "info":
+                return self.directory.joinpath("KEGG", "database_version")
+
+            # The recorded genes of a reaction "R<number>" are replayed
+            # through the KO "K<number>"
+            if operation == "link":
+                identifier = "R" + arguments[-1].removeprefix("ko:K")
+                return self.directory.joinpath(
+                    "KEGG", "GENES", f"{identifier}_genes.txt"
+                )
+
+        return None
+
+    def _metanetx(self, body: str) -> dict:
+        form = urllib.parse.parse_qs(body)
+        sort = form["query_index"][0].upper()[0]
+        answer = {}
+
+        for query in form["query_list"][0].split():
+            number = int(hashlib.sha256(query.encode()).hexdigest()[:6], 16)
+            answer[query] = {"mnx_id": f"MNX{sort}{number}", "xrefs": [query]}
+
+        return answer
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream=False,
+        timeout=None,
+        verify=True,
+        cert=None,
+        proxies=None,
+    ) -> requests.Response:
+        self.requests += 1
+        address = str(request.url)
+        url = urllib.parse.urlsplit(address)
+        response = requests.Response()
+        response.url = address
+        response.request = request
+        response.status_code = 200
+
+        if url.hostname == "www.metanetx.org":
+            response._content = json.dumps(
+                self._metanetx(str(request.body))
+            ).encode()
+            response.headers["Content-Type"] = "application/json"
+            return response
+
+        if url.path == "/credentials/login/":
+            response._content = b""
+            return response
+
+        if url.hostname == "rest.kegg.jp" and url.path.startswith("/link/ko/"):
+            identifier = url.path.rsplit("/", 1)[-1]
+            ko = "K" + identifier.removeprefix("R")
+            response._content = f"rn:{identifier}\tko:{ko}".encode()
+            genes = self.directory.joinpath(
+                "KEGG", "GENES", f"{identifier}_genes.txt"
+            )
+            if not genes.exists():
+                response.status_code = 404
+            return response
+
+        filename = self._file(url)
+        if filename is None:
+            raise requests.ConnectionError(f'No recorded response for "{url}"')
+
+        if filename.exists():
+            response._content = filename.read_bytes()
+            response.headers["Content-Type"] = (
+                "text/xml" if filename.suffix == ".xml" else "text/plain"
+            )
+        else:
+            response._content = b""
+            response.status_code = 404
+
+        return response
+
+    def close(self):
+        pass
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--archive",
+        default=None,
+        help="Replay the responses of this archive instead of the test data",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stand_in(request: pytest.FixtureRequest) -> Iterator[StandInAdapter]:
+    """
+    Replaces the transport of all sessions of requests with the stand-in
+    server. If an archive is given with "--archive", the requests are
+    replayed from it instead, see :mod:`cobramod.transport`.
+    """
+    adapter = StandInAdapter(DATA)
+    archive = request.config.getoption("--archive")
+
+    with pytest.MonkeyPatch.context() as patch:
+        if archive:
+            cmod_transport.configure_transport("replay", archive)
+        else:
+            patch.setattr(
+                requests.Session, "get_adapter", lambda self, url: adapter
+            )
+        patch.setattr(
+            DataVersionConfigurator(), "mismatch_policy", "warn", raising=False
+        )
+        yield adapter
+
+    cmod_transport.configure_transport("live")
+
+
+@pytest.fixture
+def working_directory(tmp_path: Path) -> Iterator[Path]:
+    """
+    Changes into a temporary working directory with the credentials for
+    BioCyc.
+    """
+    tmp_path.joinpath("credentials.txt").write_text("user\npassword\n")
+    previous = Path.cwd()
+    os.chdir(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        os.chdir(previous)
+
+
+@pytest.fixture
+def data_directory(tmp_path: Path) -> Path:
+    """
+    Returns a copy of the test data directory.
+    """
+    directory = tmp_path.joinpath("data")
+    shutil.copytree(DATA, directory)
+    return directory
+
+
+def clear_caches():
+    """
+    Clears the caches of CobraMod that are kept in memory.
+    """
+    DataVersionConfigurator().database_version = None
+    cmod_crossreferences.load_cache_from_disk.cache_clear()
+    cmod_crossreferences.get_reac_prop_with_ec.cache_clear()
+
+
+@pytest.fixture
+def reset_caches() -> Callable[[], None]:
+    """
+    Returns the function that clears the caches in memory for benchmarks
+    with a cold cache. The caches are cleared before the benchmark.
+    """
+    clear_caches()
+    return clear_caches
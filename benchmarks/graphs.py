@@ -0,0 +1,59 @@
+"""Synthetic pathways for the benchmarks
+
+The graphs have the same structure as the attribute "pathway" of
+:class:`cobramod.retrieval.Data`. A key is a parent reaction and the value is
+the child, a tuple of children or None for end-reactions.
+"""
+
+import random
+from typing import Optional, Union
+
+Graph = dict[str, Union[str, tuple[str, ...], None]]
+
+
+def branched_graph(size: int, branching: float = 0.2, seed: int = 0) -> Graph:
+    """
+    Returns a directed graph with given number of reactions. Each reaction
+    follows the previous one, except for new branches that start at a random
+    reaction with the given probability.
+    """
+    generator = random.Random(seed)
+    children: dict[str, list[str]] = {"R0": []}
+    previous = "R0"
+
+    for number in range(1, size):
+        reaction = f"R{number}"
+        parent = previous
+        if generator.random() < branching:
+            parent = f"R{generator.randrange(number)}"
+        children[parent].append(reaction)
+        children[reaction] = []
+        previous = reaction
+
+    graph: Graph = {}
+    for parent, items in children.items():
+        child: Optional[Union[str, tuple[str, ...]]] = None
+        if len(items) == 1:
+            child = items[0]
+        elif items:
+            child = tuple(items)
+        graph[parent] = child
+    return graph
+
+
+def reaction_strings(graph: Graph) -> dict[str, str]:
+    """
+    Returns a reaction string for each reaction of given graph. A child
+    consumes the metabolite produced by its parent.
+    """
+    parents = {"R0": "START_c"}
+    for parent, child in graph.items():
+        if child is None:
+            continue
+        for item in (child,) if isinstance(child, str) else child:
+            parents[item] = f"{parent}_c"
+
+    return {
+        reaction: f"{parents[reaction]} --> {reaction}_c + H_c"
+        for reaction in graph
+    }
@@ -0,0 +1,39 @@
+"""Benchmarks for the cross-references of a whole model
+
+The MetaNetX answers of the stand-in server are synthetic, since the test
+data does not include them. The reaction properties of MetaNetX are not
+retrieved with requests and are always copied from the test data.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from cobramod.core.crossreferences import add_crossreferences
+from cobramod.test import textbook
+
+
+def test_add_crossreferences_cold(
+    benchmark, working_directory, reset_caches, data_directory
+):
+    properties = data_directory.joinpath("XRef", "reac_prop.feather")
+
+    def setup():
+        reset_caches()
+        directory = Path(tempfile.mkdtemp(dir=working_directory))
+        directory.joinpath("XRef").mkdir()
+        shutil.copy(properties, directory.joinpath("XRef"))
+        return (textbook.copy(), directory), {}
+
+    benchmark.pedantic(add_crossreferences, setup=setup, rounds=3)
+
+
+def test_add_crossreferences_warm(
+    benchmark, working_directory, reset_caches, data_directory
+):
+    add_crossreferences(textbook.copy(), data_directory)
+
+    def setup():
+        return (textbook.copy(), data_directory), {}
+
+    benchmark.pedantic(add_crossreferences, setup=setup, rounds=5)
@@ -0,0 +1,41 @@
+"""Benchmarks for the extension of the textbook models"""
+
+import pytest
+
+from cobramod.core.extension import add_pathway
+from cobramod.test import textbook_biocyc, textbook_kegg
+
+PATHWAYS = {
+    "ARA": (textbook_biocyc, "PWY-1187", {}),
+    "META": (textbook_biocyc, "AMMOXID-PWY", {}),
+    "KEGG": (textbook_kegg, "M00001", {"genome": "hsa"}),
+    "ECO": (textbook_kegg, "SALVADEHYPOX-PWY", {}),
+    "BIGG": (
+        textbook_kegg,
+        ["ACALD", "MALS"],
+        {"database": "BIGG", "model_id": "e_coli_core"},
+    ),
+}
+
+
+@pytest.mark.parametrize("case", PATHWAYS)
+def test_add_pathway(benchmark, working_directory, data_directory, case):
+    model, pathway, arguments = PATHWAYS[case]
+    arguments = {"database": case, **arguments}
+
+    def setup():
+        return (model.copy(),), {}
+
+    def extend(copy):
+        add_pathway(
+            model=copy,
+            pathway=pathway,
+            directory=data_directory,
+            compartment="c",
+            show_imbalance=False,
+            **arguments,
+        )
+        return copy
+
+    extended = benchmark.pedantic(extend, setup=setup, rounds=5)
+    assert len(extended.reactions) > len(model.reactions)
@@ -0,0 +1,19 @@
+"""Benchmarks for the ordering of large pathways"""
+
+import copy
+
+import pytest
+from graphs import branched_graph
+
+from cobramod.core.graph import get_graph_dict
+
+
+@pytest.mark.parametrize("size", [100, 1000, 5000])
+def test_get_graph_dict(benchmark, size):
+    graph = branched_graph(size)
+
+    def setup():
+        return (copy.deepcopy(graph),), {}
+
+    result = benchmark.pedantic(get_graph_dict, setup=setup, rounds=5)
+    assert sum(len(path) for path in result) == size
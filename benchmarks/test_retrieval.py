@@ -0,0 +1,41 @@
+"""Benchmarks for the retrieval of data
+
+The data is either retrieved from the stand-in server into an empty
+directory (cold cache) or read from a directory with all files (warm cache).
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from cobramod.retrieval import get_data
+
+IDENTIFIERS = {
+    "META": ["ACETALD", "ADENODEAMIN-RXN", "2PGADEHYDRAT-RXN", "AMMOXID-PWY"],
+    "KEGG": ["C00001", "C00002", "R00200", "M00001"],
+}
+
+
+def retrieve_all(database: str, directory: Path):
+    for identifier in IDENTIFIERS[database]:
+        get_data(identifier, directory, database)
+
+
+@pytest.mark.parametrize("database", IDENTIFIERS)
+def test_get_data_cold(benchmark, working_directory, reset_caches, database):
+    def setup():
+        reset_caches()
+        directory = Path(tempfile.mkdtemp(dir=working_directory))
+        return (database, directory), {}
+
+    benchmark.pedantic(retrieve_all, setup=setup, rounds=10)
+
+
+@pytest.mark.parametrize("database", IDENTIFIERS)
+def test_get_data_warm(
+    benchmark, working_directory, reset_caches, data_directory, database
+):
+    retrieve_all(database, data_directory)
+
+    benchmark(retrieve_all, database, data_directory)
@@ -0,0 +1,31 @@
+"""Benchmarks for the visualization of pathways"""
+
+import pytest
+from graphs import branched_graph, reaction_strings
+
+from cobramod.visualization.converter import JsonDictionary
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def test_visualize(benchmark, tmp_path, size):
+    graph = branched_graph(size)
+    strings = reaction_strings(graph)
+    fluxes = {reaction: float(number) for number, reaction in enumerate(graph)}
+    filepath = tmp_path.joinpath("pathway.html")
+
+    def setup():
+        dictionary = JsonDictionary()
+        dictionary.graph = graph
+        dictionary.reaction_strings = strings
+        dictionary.flux_solution = fluxes
+        return (dictionary,), {}
+
+    def visualize(dictionary: JsonDictionary):
+        dictionary.visualize(
+            filepath=filepath,
+            color=["orange", "green"],
+            custom_integration=True,
+        )
+
+    benchmark.pedantic(visualize, setup=setup, rounds=5)
+    assert filepath.exists()
@@ -9,7 +9,6 @@
 
         let reaction_styles = model.get("reaction_styles");
         let map_name: string = model.get("map_name");
-        let map_json: string = model.get("map_json");
         let reaction_data = model.get("reaction_data");
         let reaction_scale = model.get("reaction_scale");
         let never_ask_before_quit: boolean = model.get("never_ask_before_quit")
@@ -20,24 +19,68 @@
         let height = Math.max(cell.width/2, 350 + cell.width * 0.2 - 34)
         elem.style.height = height.toString()+"px"
 
-        let builder = Builder(
-            JSON.parse(map_json),
-            null,
-            null,
-            elem,
-            {
-                "reaction_styles": reaction_styles,
-                "reaction_data": reaction_data,
-                "reaction_scale": reaction_scale,
-                "never_ask_before_quit": never_ask_before_quit,
-            },
-        )
+        let builder: any = null;
 
+        function create_builder() {
+            let map_json: string | null = model.get("map_json");
+            if (builder || !map_json) {
+                return;
+            }
+            builder = Builder(
+                JSON.parse(map_json),
+                null,
+                null,
+                elem,
+                {
+                    "reaction_styles": reaction_styles,
+                    "reaction_data": reaction_data,
+                    "reaction_scale": reaction_scale,
+                    "never_ask_before_quit": never_ask_before_quit,
+                },
+            )
+            show_frame();
+        }
 
         model.on("change:reaction_scale", () => {
-             builder.options.reaction_scale = model.get("reaction_scale");
+            if (builder) {
+                builder.options.reaction_scale = model.get("reaction_scale");
+            }
         });
 
+        // Frames are a matrix of little-endian float32 (frames x reactions)
+        function show_frame() {
+            let reactions: string[] = model.get("frame_reactions");
+            let buffer: DataView | null = model.get("frame_fluxes");
+            if (!builder || !buffer || reactions.length === 0) {
+                return;
+            }
+            let fluxes = new Float32Array(
+                buffer.buffer, buffer.byteOffset, buffer.byteLength / 4
+            );
+            let n_frames = fluxes.length / reactions.length;
+            let frame: number = Math.min(Math.max(model.get("frame"), 0), n_frames - 1);
+            let offset = frame * reactions.length;
+            let data = {};
+            for (let i = 0; i < reactions.length; i++) {
+                let value = fluxes[offset + i];
+                if (!Number.isNaN(value)) {
+                    data[reactions[i]] = value;
+                }
+            }
+            builder.set_reaction_data(data);
+        }
+
+        model.on("change:frame", show_frame);
+        model.on("change:frame_fluxes", show_frame);
+
+        // The map is created in Python once it is needed
+        model.on("change:map_json", create_builder);
+        if (model.get("map_json")) {
+            create_builder();
+        } else {
+            model.send({type: "load_map"});
+        }
+
     }
 
     export default { render };
\ No newline at end of file
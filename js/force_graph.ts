@@ -1,5 +1,42 @@
 import ForceGraph3D from '3d-force-graph';
 
+// Binary buffers of the widget are received as DataView
+function typed<T>(view: DataView, Type: { new(buffer: ArrayBuffer): T }): T {
+    return new Type(view.buffer.slice(view.byteOffset, view.byteOffset + view.byteLength));
+}
+
+// Creates the graph data from the arrays of GraphArrays
+function graph_data(graph): { nodes: object[], links: object[] } {
+    let ids: string[] = graph.ids || [];
+    if (ids.length === 0) {
+        return {nodes: [], links: []};
+    }
+    let groups = typed(graph.groups, Uint8Array);
+    let source = typed(graph.source, Int32Array);
+    let target = typed(graph.target, Int32Array);
+    let value = typed(graph.value, Float64Array);
+
+    const names = ["metabolite", "reaction", "cluster"];
+    let nodes = ids.map((id, i) => ({id: id, group: names[groups[i]]}));
+    let links = new Array(source.length);
+    for (let i = 0; i < source.length; i++) {
+        links[i] = {source: ids[source[i]], target: ids[target[i]], value: value[i]};
+    }
+
+    // Nodes of a cached layout keep their position
+    if (graph.positions) {
+        let positions = typed(graph.positions, Float64Array);
+        nodes.forEach((n, i) => {
+            if (!Number.isNaN(positions[3 * i])) {
+                n["fx"] = positions[3 * i];
+                n["fy"] = positions[3 * i + 1];
+                n["fz"] = positions[3 * i + 2];
+            }
+        });
+    }
+    return {nodes: nodes, links: links};
+}
+
 function render({model, el}: { model: DOMWidgetModel; el: HTMLElement; }) {
 
     let elem = document.createElement("div");
@@ -12,10 +49,21 @@ function render({model, el}: { model: DOMWidgetModel; el: HTMLElement; }) {
             const width = entry.contentRect.width;
             if (width > 0) {
                 if (!Graph) {
-                    let graph_data = JSON.parse(model.get("_model_rep"))
                     Graph = new ForceGraph3D(elem)
-                        .graphData(graph_data)
+                        .graphData(graph_data(model.get("_graph")))
                         .nodeLabel("id")
+                        // Clusters of a model are bigger and can be expanded
+                        .nodeVal(n => n["group"] === "cluster" ? 8 : 1)
+                        .onNodeClick(n => {
+                            if (n["group"] === "cluster") {
+                                model.send({type: "expand", id: n["id"]});
+                            }
+                        })
+                        .onNodeRightClick(n => {
+                            if (n["group"] === "reaction") {
+                                model.send({type: "collapse", id: n["id"]});
+                            }
+                        })
                         .linkOpacity(1)
                         .linkAutoColorBy("value")
                         .linkDirectionalParticles(1)
@@ -25,11 +73,72 @@ function render({model, el}: { model: DOMWidgetModel; el: HTMLElement; }) {
                         .cooldownTicks(0)
                         .width(width)
                         .height(width / 2)
+                        // Positions are stored if the widget has a layout cache
+                        .onEngineStop(() => {
+                            let key = model.get("_graph").key;
+                            if (key) {
+                                let positions = {};
+                                Graph.graphData().nodes.forEach((n) => {
+                                    positions[n.id] = [n.x, n.y, n.z];
+                                });
+                                model.send({type: "cache_layout", key: key, positions: positions});
+                            }
+                        })
 
-                    model.on("change:_model_rep", () => {
-                        Graph.graphData(JSON.parse(model.get("_model_rep")))
+                    model.on("change:_graph", () => {
+                        Graph.graphData(graph_data(model.get("_graph")))
+                        show_frame()
                     });
 
+                    // Frames are a matrix of little-endian float32
+                    // (frames x reactions). The links of the graph were
+                    // created with a flux of 1 and are scaled per frame.
+                    // Clusters have the sum of the fluxes of their reactions.
+                    const node_id = (n) => typeof n === "object" ? n.id : n;
+
+                    function show_frame() {
+                        let reactions: string[] = model.get("frame_reactions");
+                        let buffer: DataView | null = model.get("frame_fluxes");
+                        if (!buffer || reactions.length === 0) {
+                            return;
+                        }
+                        let fluxes = new Float32Array(
+                            buffer.buffer, buffer.byteOffset, buffer.byteLength / 4
+                        );
+                        let n_frames = fluxes.length / reactions.length;
+                        let frame: number = Math.min(Math.max(model.get("frame"), 0), n_frames - 1);
+                        let offset = frame * reactions.length;
+                        let index = new Map(reactions.map((r, i) => [r, i]));
+
+                        let data = Graph.graphData();
+                        let groups = new Map(data.nodes.map((n) => [n.id, n.group]));
+                        data.links.forEach((link) => {
+                            if (link.base === undefined) {
+                                // Reactions and clusters produce metabolites
+                                let forward = groups.get(node_id(link.source)) !== "metabolite";
+                                link.base = link.value;
+                                link.forward = forward;
+                                link.reaction = forward ? link.source : link.target;
+                                link.metabolite = forward ? link.target : link.source;
+                            }
+                            let i = index.get(node_id(link.reaction));
+                            let flux = i === undefined ? 1 : fluxes[offset + i];
+                            if (Number.isNaN(flux)) {
+                                flux = 1;
+                            }
+                            let swap = link.forward ? flux < 0 : flux <= 0;
+                            let from_reaction = link.forward !== swap;
+                            link.source = from_reaction ? link.reaction : link.metabolite;
+                            link.target = from_reaction ? link.metabolite : link.reaction;
+                            link.value = link.base * Math.abs(flux);
+                        });
+                        Graph.graphData(data);
+                    }
+
+                    show_frame();
+                    model.on("change:frame", show_frame);
+                    model.on("change:frame_fluxes", show_frame);
+
                     model.on("msg:custom", msg => {
                         switch (msg.type) {
                             case "create_layout":
@@ -24,23 +24,48 @@ the pathway and fluxes of that specific class. Some new methods added:
 - visualize: Return a Builder for the representation of the pathway.
 - solution: Filters solution and returns fluxes of only members of the class.
 
-By default, CobraMod creates the file "debug.log", which displays the changes,
-which occurred when running a script. In order to modify the logging, import
-"debug_log" from "cobramod.debug". The default logging level is defined as
-INFO. Read the documentation of logging for more information.
+CobraMod logs the changes, which occurred when running a script, with the
+logger "debug_log" from "cobramod.debug". The default logging level is defined
+as INFO. In order to save the logs in files, call
+:func:`cobramod.debug.configure_logging`. Read the documentation of logging
+for more information.
 
 For a list of databases, load variable :obj:`cobramod.available_databases`
+
+.. versionchanged:: 1.3.1
+    The directory "logs" is only created by
+    :func:`cobramod.debug.configure_logging`.
+    The functions are imported on first use. The visualization and its
+    dependencies are only loaded when :meth:`cobramod.Pathway.visualize` is
+    called.
 """
 
-from cobramod.core.creation import (
-    add_metabolites,
-    add_reactions,
-    create_object,
-)
-from cobramod.core.crossreferences import add_crossreferences
-from cobramod.core.extension import add_pathway, test_non_zero_flux
-from cobramod.core.pathway import Pathway, model_convert
-from cobramod.retrieval import get_data
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cobramod.core.creation import (
+        add_metabolites,
+        add_reactions,
+        create_object,
+    )
+    from cobramod.core.crossreferences import add_crossreferences
+    from cobramod.core.extension import add_pathway, test_non_zero_flux
+    from cobramod.core.pathway import Pathway, model_convert
+    from cobramod.retrieval import get_data
+
+# The modules are only imported when their objects are used for the first time
+_lazy_imports = {
+    "get_data": "cobramod.retrieval",
+    "create_object": "cobramod.core.creation",
+    "add_reactions": "cobramod.core.creation",
+    "add_metabolites": "cobramod.core.creation",
+    "add_pathway": "cobramod.core.extension",
+    "test_non_zero_flux": "cobramod.core.extension",
+    "Pathway": "cobramod.core.pathway",
+    "model_convert": "cobramod.core.pathway",
+    "add_crossreferences": "cobramod.core.crossreferences",
+}
 
 __all__ = [
     "get_data",
@@ -54,4 +79,23 @@ __all__ = [
     "add_crossreferences",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(import_module(module), name)
+    # Following accesses do not call this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __version__ = "1.3.1"
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from contextlib import suppress
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 import cobra.core as cobra_core
 import requests
@@ -47,7 +47,7 @@ def build_metabolite(
         charge=charge,
         compartment=compartment,
     )
-    debug_log.debug(f'Manually curated metabolite "{identifier}" was created.')
+    debug_log.debug('Manually curated metabolite "%s" was created.', identifier)
     return metabolite
 
 
@@ -104,8 +104,8 @@ def metabolite_from_string(
     charge = line[4]
 
     debug_log.debug(
-        f'Metabolite "{identifier}" was identified as a manually. '
-        + "curated metabolite."
+        'Metabolite "%s" was identified as a manually curated metabolite.',
+        identifier,
     )
     return build_metabolite(
         identifier=identifier,
@@ -144,7 +144,7 @@ def metabolite_from_data(
     if not isinstance(metabolite, cobra_core.Metabolite):
         raise AttributeError("Given object is not a Metabolite")
 
-    debug_log.debug(f"Metabolite '{metabolite.id}' created from Data object")
+    debug_log.debug("Metabolite '%s' created from Data object", metabolite.id)
     return metabolite
 
 
@@ -217,6 +217,102 @@ def convert_string_metabolite(
     return new_metabolite
 
 
+def collect_identifiers(line: str, replacement: dict[str, str]) -> set[str]:
+    """
+    Returns the identifiers of the objects that have to be retrieved from a
+    database to build the object of given line. The line can represent either
+    a metabolite or a reaction. Lines of manually-curated metabolites do not
+    need any identifier. The syntax of the line is not verified; this happens
+    once the object is built.
+
+    Args:
+        line (str): string with information of a metabolite or reaction
+        replacement (dict[str, str]): Dictionary with either the new identifier
+            and/or the identifier of an object inside the model
+
+    Returns:
+        set[str]: Identifiers to retrieve
+    """
+    identifiers: set[str] = set()
+
+    # Custom reaction. Metabolites are retrieved without compartment
+    if "|" in line:
+        reaction_str = line.split("|")[-1]
+        position = cmod_utils.get_arrow_position(reaction_str)
+
+        if position == -1:
+            return identifiers
+
+        for side in (reaction_str[:position], reaction_str[position + 3 :]):
+            for pair in side.split("+"):
+                metabolite = pair.strip().split(" ")[-1]
+
+                if len(metabolite) > 2:
+                    metabolite = metabolite[:-2]
+                    identifiers.add(replacement.get(metabolite, metabolite))
+
+        return identifiers
+
+    segments = [part.strip() for part in line.split(",")]
+    if len(segments) == 2:
+        identifiers.add(replacement.get(segments[0], segments[0]))
+
+    return identifiers
+
+
+def prefetch_lines(
+    lines: list[str],
+    directory: Path,
+    database: Optional[str],
+    model_id: Optional[str],
+    replacement: dict[str, str],
+    max_workers: int,
+):
+    """
+    Retrieves concurrently the data needed to build the objects of given
+    lines, so that the objects can be built afterwards in order from local
+    files. The lines are first parsed into the identifiers of the objects to
+    retrieve. Then, these identifiers are retrieved in bulk. The metabolites of
+    reactions from a database are retrieved in a second round.
+
+    Args:
+        lines (list[str]): Lines with information of metabolites or reactions
+        directory (Path): Path to directory where data is located
+        database (str, optional): Name of database. Check
+            :obj:`cobramod.retrieval.available_databases` for a list of names
+        model_id (str, optional): Exclusive for BIGG. Name of model
+        replacement (dict[str, str]): Dictionary with either the new identifier
+            and/or the identifier of an object inside the model
+        max_workers (int): Number of concurrent retrievals. Values smaller
+            than 2 disable the retrieval in bulk
+    """
+    if max_workers < 2:
+        return
+
+    identifiers: set[str] = set()
+    for line in lines:
+        identifiers.update(collect_identifiers(line, replacement))
+
+    files = cmod_retrieval.prefetch_data(
+        identifiers, directory, database, model_id, max_workers
+    )
+
+    compounds: set[str] = set()
+    for identifier, filename in files.items():
+        data = cmod_retrieval.file_to_Data_class(identifier, filename, None)
+
+        if data.mode != "Reaction":
+            continue
+
+        for part in data.attributes["equation"].split(" "):
+            if part and cmod_utils.is_compound(part):
+                compounds.add(replacement.get(part[2:], part[2:]))
+
+    cmod_retrieval.prefetch_data(
+        compounds - identifiers, directory, database, model_id, max_workers
+    )
+
+
 def get_file_metabolites(
     model: cobra_core.Model,
     filename: Path,
@@ -224,6 +320,7 @@ def get_file_metabolites(
     directory: Path,
     database: Optional[str],
     model_id: Optional[str],
+    max_workers: int = 1,
 ) -> list[cobra_core.Metabolite]:
     """
     Return a list with Metabolites from a file. If a metabolite is found in
@@ -249,6 +346,8 @@ def get_file_metabolites(
             :obj:`cobramod.retrieval.available_databases` for a list of names.
             The argument can be None ONLY for manually curated metabolites
         model_id (str, optional): Bigg-specific argument. Name of the model
+        max_workers (int): Number of concurrent retrievals of the metabolites
+            from the database. Defaults to 1 (no concurrent retrieval)
 
     Raises:
         FileNotFoundError: If given file is not found
@@ -264,16 +363,82 @@ def get_file_metabolites(
     # For each line, build and add metabolite. If a Metabolite is no properly
     # created, either raise an Error or use a default.
     with open(filename, "r") as f:
-        new_metabolites: list[cobra_core.Metabolite] = list()
-        for line in cmod_utils.read_lines(f=f):
-            new_metabolites.append(
-                convert_string_metabolite(
-                    line, model, replacement, directory, database, model_id
-                )
+        lines = list(cmod_utils.read_lines(f=f))
+
+    prefetch_lines(
+        lines, directory, database, model_id, replacement, max_workers
+    )
+    new_metabolites: list[cobra_core.Metabolite] = list()
+    for line in lines:
+        new_metabolites.append(
+            convert_string_metabolite(
+                line, model, replacement, directory, database, model_id
             )
+        )
     return new_metabolites
 
 
+def iter_file_metabolites(
+    model: cobra_core.Model,
+    filename: Path,
+    replacement: dict[str, str],
+    directory: Path,
+    database: Optional[str],
+    model_id: Optional[str],
+    chunk_size: int,
+    start: int = 0,
+    max_workers: int = 1,
+) -> Iterator[tuple[int, list[cobra_core.Metabolite]]]:
+    """
+    Returns an iterator of chunks with Metabolites from a file. Each chunk is a
+    tuple with the number of the last line read and a list with at most
+    chunk_size metabolites. The syntax of the file is the same as in
+    :func:`get_file_metabolites`. Chunks are created lazily, thus metabolites
+    added to the model in previous chunks are found in the model. Skipped
+    lines are expected to be in the model already.
+
+    Args:
+        model (Model): Model to get metabolites if available
+        filename (Path): location of the file with metabolites
+        replacement (dict[str, str]): Dictionary with either the new identifier
+            and/or the identifier of object inside the model.
+        directory (Path): Path to directory where data is located.
+        database (str, optional): Name of database. Check
+            :obj:`cobramod.retrieval.available_databases` for a list of names.
+            The argument can be None ONLY for manually curated metabolites
+        model_id (str, optional): Bigg-specific argument. Name of the model
+        chunk_size (int): Maximal number of metabolites in a chunk
+        start (int): Number of lines of the file to skip, e.g. the lines
+            that were added to a saved model before an interruption. Defaults
+            to 0
+        max_workers (int): Number of concurrent retrievals of the metabolites
+            of a chunk from the database. Defaults to 1 (no concurrent
+            retrieval)
+
+    Raises:
+        FileNotFoundError: If given file is not found
+    """
+    if not filename.exists():
+        raise FileNotFoundError(
+            f'Given file in "{str(filename)}" does not exists. '
+            + "Please create the given file or verify that the path is correct"
+        )
+    with open(filename, "r") as f:
+        for number, lines in cmod_utils.read_chunks(f, chunk_size, start):
+            prefetch_lines(
+                lines, directory, database, model_id, replacement, max_workers
+            )
+            yield (
+                number,
+                [
+                    convert_string_metabolite(
+                        line, model, replacement, directory, database, model_id
+                    )
+                    for line in lines
+                ],
+            )
+
+
 def get_reaction(
     data: cmod_retrieval.Data,
     compartment: str,
@@ -539,11 +704,13 @@ def get_file_reactions(
     database: Optional[str],
     model_id: Optional[str],
     genome: Optional[str],
+    max_workers: int = 1,
 ) -> list[cobra_core.Reaction]:
     """
     Returns list with reactions from file. All reactions can be either created
-    manually or retrieved from a database. For each reactions, its always
-    checks for mass balance.
+    manually or retrieved from a database. The mass balance of all reactions
+    is checked together once the file is read. Every unbalanced reaction is
+    reported at once.
 
     Custom reactions:
 
@@ -580,6 +747,9 @@ def get_file_reactions(
             specified model
         genome (str, optional): Exclusive for KEGG. Abbreviation for the
             specie involved. Genes will be obtained from this specie
+        max_workers (int): Number of concurrent retrievals of the reactions
+            and metabolites from the database. Defaults to 1 (no concurrent
+            retrieval)
 
     Raises:
         FileNotFoundError: If file does not exists
@@ -596,22 +766,115 @@ def get_file_reactions(
             + "Check if the given path is correct."
         )
     with open(filename, "r") as f:
-        new_reactions = list()
-        for line in cmod_utils.read_lines(f=f):
-            new_reactions.append(
+        lines = list(cmod_utils.read_lines(f=f))
+
+    prefetch_lines(
+        lines, directory, database, model_id, replacement, max_workers
+    )
+    new_reactions = list()
+    # Mass balance is checked for all reactions at once
+    for line in lines:
+        new_reactions.append(
+            string_to_reaction(
+                line=line,
+                model=model,
+                directory=directory,
+                database=database,
+                stop_imbalance=False,
+                show_imbalance=False,
+                replacement=replacement,
+                model_id=model_id,
+                genome=genome,
+            )
+        )
+
+    cmod_utils.check_imbalances(
+        reactions=new_reactions,
+        stop_imbalance=stop_imbalance,
+        show_imbalance=show_imbalance,
+    )
+    return new_reactions
+
+
+def iter_file_reactions(
+    model: cobra_core.Model,
+    filename: Path,
+    directory: Path,
+    stop_imbalance: bool,
+    show_imbalance: bool,
+    replacement: dict[str, str],
+    database: Optional[str],
+    model_id: Optional[str],
+    genome: Optional[str],
+    chunk_size: int,
+    start: int = 0,
+    max_workers: int = 1,
+) -> Iterator[tuple[int, list[cobra_core.Reaction]]]:
+    """
+    Returns an iterator of chunks with reactions from a file. Each chunk is a
+    tuple with the number of the last line read and a list with at most
+    chunk_size reactions. The syntax of the file is the same as in
+    :func:`get_file_reactions`. The mass balance is checked for each chunk.
+    Chunks are created lazily, thus objects added to the model in previous
+    chunks are found in the model. Skipped lines are expected to be in the
+    model already.
+
+    Args:
+        model (Model): model to check for cross-references
+        filename (Path): location of the file with reaction information
+        directory (Path): Path to directory where data is located
+        stop_imbalance (bool): If unbalanced reaction is found, stop process
+        show_imbalance (bool): If unbalanced reaction is found, show output
+        replacement (dict[str, str]): Dictionary with either the new identifier
+            and/or the identifier of an object inside the model
+        database (str, optional): Name of database. Check
+            :obj:`cobramod.retrieval.available_databases` for a list of names.
+            This argument can be empty ONLY for manually-curated reactions
+        model_id (str, optional): Exclusive for BIGG. Retrieve object from
+            specified model
+        genome (str, optional): Exclusive for KEGG. Abbreviation for the
+            specie involved. Genes will be obtained from this specie
+        chunk_size (int): Maximal number of reactions in a chunk
+        start (int): Number of lines of the file to skip, e.g. the lines
+            that were added to a saved model before an interruption. Defaults
+            to 0
+        max_workers (int): Number of concurrent retrievals of the reactions
+            and metabolites of a chunk from the database. Defaults to 1 (no
+            concurrent retrieval)
+
+    Raises:
+        FileNotFoundError: If file does not exists
+    """
+    if not filename.exists():
+        raise FileNotFoundError(
+            f'File "{filename.name}" does not exist. '
+            + "Check if the given path is correct."
+        )
+    with open(filename, "r") as f:
+        for number, lines in cmod_utils.read_chunks(f, chunk_size, start):
+            prefetch_lines(
+                lines, directory, database, model_id, replacement, max_workers
+            )
+            new_reactions = [
                 string_to_reaction(
                     line=line,
                     model=model,
                     directory=directory,
                     database=database,
-                    stop_imbalance=stop_imbalance,
-                    show_imbalance=show_imbalance,
+                    stop_imbalance=False,
+                    show_imbalance=False,
                     replacement=replacement,
                     model_id=model_id,
                     genome=genome,
                 )
+                for line in lines
+            ]
+            cmod_utils.check_imbalances(
+                reactions=new_reactions,
+                stop_imbalance=stop_imbalance,
+                show_imbalance=show_imbalance,
             )
-    return new_reactions
+            yield number, new_reactions
 
 
 def create_object(
@@ -750,6 +1013,20 @@ def add_metabolites(
             EC numbers should be taken over. These are generally not found in
             other databases. Furthermore, this could result in non-existing
             Brenda IDs being created. The default value is False.
+        chunk_size (int): Only for files. Number of metabolites that are
+            read and added to the model at once. If given, the file is
+            streamed and memory stays bounded. Defaults to 1000 if only a
+            checkpoint is given.
+        checkpoint (Path, str): Only for files. Location of a file that
+            records the last line added to the model. An interrupted import
+            resumes after that line. The checkpoint does not store the model
+            itself, thus the model must be saved before resuming in a new
+            process. A warning is logged if the objects of the last added
+            lines are missing in the model.
+        max_workers (int): Number of concurrent retrievals from the
+            database. If larger than 1, the identifiers of all given lines are
+            collected and retrieved concurrently before the objects are built
+            in order. Defaults to 1 (no concurrent retrieval).
 
     Raises:
         WrongSyntax (from str): If the syntax is not followed correctly as
@@ -767,18 +1044,74 @@ def add_metabolites(
     # Kwargs
     replacement: dict[str, str] = kwargs.pop("replacement", {})
     model_id: str = kwargs.pop("model_id", {})
+    chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+    checkpoint: Optional[Union[Path, str]] = kwargs.pop("checkpoint", None)
+    max_workers: int = kwargs.pop("max_workers", 1)
 
     if isinstance(obj, str):
         obj = Path(obj).absolute()
 
+    if isinstance(checkpoint, str):
+        checkpoint = Path(checkpoint).absolute()
+
+    # Streaming of large files. Each chunk is added before reading the next
+    if isinstance(obj, Path) and (chunk_size or checkpoint):
+        start = 0
+        if checkpoint:
+            start = cmod_utils.read_checkpoint(
+                checkpoint, obj, model.metabolites
+            )
+
+        for number, chunk in iter_file_metabolites(
+            model,
+            obj,
+            replacement,
+            directory,
+            database,
+            model_id,
+            chunk_size or 1000,
+            start,
+            max_workers,
+        ):
+            for metabolite in chunk:
+                crossreferences.add_crossreferences(
+                    object=metabolite,
+                    directory=directory,
+                    include_metanetx_specific_ec=include_metanetx_specific_ec,
+                )
+            cmod_utils.confirm_metabolite(model, chunk)
+
+            if checkpoint:
+                cmod_utils.write_checkpoint(
+                    checkpoint, obj, number, [member.id for member in chunk]
+                )
+            debug_log.info(
+                'Lines up to %s of "%s" were added.', number, obj.name
+            )
+        return
+
     metabolites: list[cobra_core.Metabolite]
     if isinstance(obj, Path):
         metabolites = get_file_metabolites(
-            model, obj, replacement, directory, database, model_id
+            model,
+            obj,
+            replacement,
+            directory,
+            database,
+            model_id,
+            max_workers,
         )
 
     elif isinstance(obj, list):
         metabolites = []
+        prefetch_lines(
+            [item for item in obj if isinstance(item, str)],
+            directory,
+            database,
+            model_id,
+            replacement,
+            max_workers,
+        )
 
         for item in obj:
             if isinstance(item, cobra_core.Metabolite):
@@ -847,8 +1180,10 @@ def find_replacements(
             )
 
         debug_log.debug(
-            f"{obj_type[:-1]} '{identifier}' was found in the model and will "
-            " replace {new_identifier}."
+            "%s '%s' was found in the model and will replace '%s'.",
+            obj_type[:-1],
+            identifier,
+            new_identifier,
         )
         return replacement
     except KeyError:
@@ -916,6 +1251,20 @@ def add_reactions(
             EC numbers should be taken over. These are generally not found in
             other databases. Furthermore, this could result in non-existing
             Brenda IDs being created. The default value is False.
+        chunk_size (int): Only for files. Number of reactions that are read
+            and added to the model at once. If given, the file is streamed,
+            memory stays bounded and the mass balance is checked per chunk.
+            Defaults to 1000 if only a checkpoint is given.
+        checkpoint (Path, str): Only for files. Location of a file that
+            records the last line added to the model. An interrupted import
+            resumes after that line. The checkpoint does not store the model
+            itself, thus the model must be saved before resuming in a new
+            process. A warning is logged if the objects of the last added
+            lines are missing in the model.
+        max_workers (int): Number of concurrent retrievals from the
+            database. If larger than 1, the identifiers of all given lines are
+            collected and retrieved concurrently before the objects are built
+            in order. Defaults to 1 (no concurrent retrieval).
 
     Raises:
         WrongSyntax (from str): If the syntax is not followed correctly as
@@ -933,12 +1282,60 @@ def add_reactions(
         "include_metanetx_specific_ec", False
     )
 
+    chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+    checkpoint: Optional[Union[Path, str]] = kwargs.pop("checkpoint", None)
+    max_workers: int = kwargs.pop("max_workers", 1)
+
     if isinstance(directory, str):
         directory = Path(directory).absolute()
 
     if isinstance(obj, str):
         obj = Path(obj).absolute()
 
+    if isinstance(checkpoint, str):
+        checkpoint = Path(checkpoint).absolute()
+
+    # Streaming of large files. Each chunk is added before reading the next
+    if isinstance(obj, Path) and (chunk_size or checkpoint):
+        start = 0
+        if checkpoint:
+            start = cmod_utils.read_checkpoint(checkpoint, obj, model.reactions)
+
+        for number, chunk in iter_file_reactions(
+            model=model,
+            filename=obj,
+            directory=directory,
+            database=database,
+            replacement=replacement,
+            stop_imbalance=stop_imbalance,
+            show_imbalance=show_imbalance,
+            genome=genome,
+            model_id=model_id,
+            chunk_size=chunk_size or 1000,
+            start=start,
+            max_workers=max_workers,
+        ):
+            for reaction in chunk:
+                if not database:
+                    continue
+
+                crossreferences.add_crossreferences(
+                    object=reaction,
+                    directory=directory,
+                    consider_sub_elements=consider_sub_elements,
+                    include_metanetx_specific_ec=include_metanetx_specific_ec,
+                )
+            cmod_utils.add_reactions_to_model(model=model, reactions=chunk)
+
+            if checkpoint:
+                cmod_utils.write_checkpoint(
+                    checkpoint, obj, number, [member.id for member in chunk]
+                )
+            debug_log.info(
+                'Lines up to %s of "%s" were added.', number, obj.name
+            )
+        return
+
     # In case of a Path
     reactions: list[cobra_core.Reaction]
     if isinstance(obj, Path):
@@ -952,29 +1349,47 @@ def add_reactions(
             show_imbalance=show_imbalance,
             genome=genome,
             model_id=model_id,
+            max_workers=max_workers,
         )
 
     elif isinstance(obj, list):
         reactions = []
+        new_reactions: list[cobra_core.Reaction] = []
+        prefetch_lines(
+            [item for item in obj if isinstance(item, str)],
+            directory,
+            database,
+            model_id,
+            replacement,
+            max_workers,
+        )
 
         for item in obj:
             if isinstance(item, str):
-                reactions.append(
+                # Mass balance is checked for all reactions at once
+                new_reactions.append(
                     string_to_reaction(
                         line=item,
                         model=model,
                         directory=directory,
                         database=database,
                         replacement=replacement,
-                        stop_imbalance=stop_imbalance,
-                        show_imbalance=show_imbalance,
+                        stop_imbalance=False,
+                        show_imbalance=False,
                         genome=genome,
                         model_id=model_id,
                     )
                 )
+                reactions.append(new_reactions[-1])
             if isinstance(item, cobra_core.Reaction):
                 reactions.append(item)
 
+        cmod_utils.check_imbalances(
+            reactions=new_reactions,
+            stop_imbalance=stop_imbalance,
+            show_imbalance=show_imbalance,
+        )
+
     # Raise error if wrong
     else:
         raise cmod_error.WrongDataError(
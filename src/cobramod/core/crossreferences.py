@@ -1,15 +1,18 @@
+import io
 import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Set, Union, List, Any
 
 import pandas as pd
-import requests
 from cobra import Model, Reaction, Metabolite
 from cobra.core import Group
 from requests import HTTPError
 from tqdm import tqdm
 
+import cobramod.profiling as cmod_profiling
+import cobramod.transport as cmod_transport
+import cobramod.utils as cmod_utils
 from cobramod.debug import debug_log
 
 
@@ -49,7 +52,7 @@ def inchikey2pubchem_cid(
         + "/cids/txt"
     )
 
-    response = requests.get(url=url)
+    response = cmod_transport.get(url=url)
     response.raise_for_status()
     value = response.text.rstrip()
 
@@ -60,7 +63,8 @@ def inchikey2pubchem_cid(
     )
     path = directory / "XRef" / str("pubchem" + ".feather")
     path.parent.mkdir(parents=True, exist_ok=True)
-    cache.to_feather(path)
+    with cmod_utils.atomic_file(path) as temporary:
+        cache.to_feather(temporary)
     load_cache_from_disk.cache_clear()
     return value
 
@@ -138,7 +142,7 @@ def get_crossreferences(  # noqa: C901
         "output_format": "json",
     }
 
-    response = requests.post(url=url, data=data)
+    response = cmod_transport.post(url=url, data=data)
     try:
         response.raise_for_status()
     except HTTPError as error:
@@ -192,7 +196,8 @@ def get_crossreferences(  # noqa: C901
         # cache = cache.append({"ID": query, "XRefs": xrefs}, ignore_index=True)
         path = directory / "XRef" / str(sort + ".feather")
         path.parent.mkdir(parents=True, exist_ok=True)
-        cache.to_feather(path)
+        with cmod_utils.atomic_file(path) as temporary:
+            cache.to_feather(temporary)
         load_cache_from_disk.cache_clear()
         crossreferences.update(xrefs)
 
@@ -294,9 +299,11 @@ def get_reac_prop_with_ec(directory: Path) -> pd.DataFrame:
         pass
 
     url = "https://www.metanetx.org/ftp/latest/reac_prop.tsv"
+    response = cmod_transport.get(url)
+    response.raise_for_status()
 
     df = pd.read_csv(
-        url,
+        io.BytesIO(response.content),
         sep="\t",
         comment="#",
         names=[
@@ -312,7 +319,8 @@ def get_reac_prop_with_ec(directory: Path) -> pd.DataFrame:
     df = df[~df["classifs"].isna()].reset_index(drop=True)
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_feather(path)
+    with cmod_utils.atomic_file(path) as temporary:
+        df.to_feather(temporary)
 
     return df
 
@@ -355,6 +363,7 @@ def add2dict_unique(
     return dictionary
 
 
+@cmod_profiling.traced("add_crossreferences")
 def add_crossreferences(  # noqa: C901
     object: Union[Model, Group, Reaction, Metabolite],
     directory: Union[Path, str],
@@ -18,12 +18,13 @@ from typing import Generator, Optional, Union
 import cobra.core as cobra_core
 import cobra.exceptions as cobra_exceptions
 
+import cobramod.profiling as cmod_profiling
 import cobramod.retrieval as cmod_retrieval
 import cobramod.utils as cmod_utils
 from cobramod.core import creation as cmod_core_creation
 from cobramod.core import graph as cmod_core_graph
 from cobramod.core.pathway import Pathway
-from cobramod.core.summary import DataModel
+from cobramod.core.summary import ChangeTracker
 from cobramod.core.summary import summary as summarize
 from cobramod.debug import debug_log
 
@@ -68,7 +69,7 @@ def yield_reaction_from_list(
         Generator: New Reactions objects
     """
 
-    debug_log.debug(f"Obtaining data for following reactions {sequence}.")
+    debug_log.debug("Obtaining data for following reactions %s.", sequence)
     # From given list (which could include None values), retrieve only Reaction
     # Objects.
     for identifier in sequence:
@@ -113,8 +114,9 @@ def find_problem(model: cobra_core.Model, identifier: str) -> list[str]:
     for metabolite in metabolites:
         with suppress(ValueError):
             model.add_boundary(metabolite=metabolite, type="sink")
-            debug_log.debug(f"Sink reaction for {identifier} created.")
+            debug_log.debug("Sink reaction for %s created.", identifier)
 
+    cmod_profiling.count(cmod_profiling.SOLVER_CALLS)
     assert model.slim_optimize() != 0.0
 
     # Test each reaction
@@ -128,10 +130,11 @@ def find_problem(model: cobra_core.Model, identifier: str) -> list[str]:
             continue
 
         model.remove_reactions([sink])
-        debug_log.debug(f"Sink reaction for {identifier} removed.")
+        debug_log.debug("Sink reaction for %s removed.", identifier)
 
         # Find metabolites that are necessary to carry a flux
         try:
+            cmod_profiling.count(cmod_profiling.SOLVER_CALLS)
             value = model.slim_optimize(error_value=None)
 
             if not value:
@@ -143,9 +146,11 @@ def find_problem(model: cobra_core.Model, identifier: str) -> list[str]:
         except cobra_exceptions.OptimizationError:
             model.add_reactions(reaction_list=[sink])
             debug_log.debug(
-                f"Sink reaction for {identifier} added again. Metabolite "
-                f'"{metabolite.id}" must have a sink reaction to make '
-                f'"{identifier}" carry a flux.'
+                'Sink reaction for %s added again. Metabolite "%s" must have a '
+                'sink reaction to make "%s" carry a flux.',
+                identifier,
+                metabolite.id,
+                identifier,
             )
             assert metabolite.id
             problem.append(metabolite.id)
@@ -176,10 +181,11 @@ def recursive_flux_test(
 
     if times == 0:
         debug_log.debug(
-            f'Test to carry non-zero flux for "{identifier}" started.'
+            'Test to carry non-zero flux for "%s" started.', identifier
         )
     # run
     passed: bool
+    cmod_profiling.count(cmod_profiling.SOLVER_CALLS)
     value = model.slim_optimize()
 
     if not value:
@@ -208,13 +214,14 @@ def recursive_flux_test(
                 "simulate their synthesis."
             )
             debug_log.warning(msg)
+            cmod_profiling.count(cmod_profiling.SOLVER_CALLS)
             value = model.slim_optimize()
 
     # Raise only if manual intervention is necessary
     if times == 0:
         if abs(value) > cobra_tolerance:
             debug_log.info(
-                f"Non-zero flux test for reaction '{identifier}' passed."
+                "Non-zero flux test for reaction '%s' passed.", identifier
             )
 
         else:
@@ -226,6 +233,7 @@ def recursive_flux_test(
     return value
 
 
+@cmod_profiling.traced("non_zero_flux", "identifier")
 def non_zero_core(model: cobra_core.Model, identifier: str):
     """
     Performs non-zero flux test. In this test, a reaction is tested to make
@@ -318,7 +326,7 @@ def add_reactions_to_Pathway(
         # Add reaction if not in model
         if reaction not in model.reactions:
             model.add_reactions([reaction])
-            debug_log.info(f'Reaction "{reaction.id}" was added to model.')
+            debug_log.info('Reaction "%s" was added to model.', reaction.id)
 
         # Skip test but include reaction in pathway
         if reaction.id not in ignore_list:
@@ -326,22 +334,23 @@ def add_reactions_to_Pathway(
 
         else:
             debug_log.warning(
-                f'Reaction "{reaction.id}" found in "ignore_list". Skipping '
-                + "non-zero flux test."
+                'Reaction "%s" found in "ignore_list". Skipping non-zero flux '
+                "test.",
+                reaction.id,
             )
 
         # Add to pathway only if reaction was not previously in the model.
         pathway.add_members(new_members=[reaction])
         debug_log.info(
-            f'Reaction "{reaction.id}" added to group "{pathway.id}".'
+            'Reaction "%s" added to group "%s".', reaction.id, pathway.id
         )
 
-    debug_log.debug(f'Reactions added to group "{pathway.id}".')
+    debug_log.debug('Reactions added to group "%s".', pathway.id)
 
     # Only add if there is at least 1 reaction in the group.
     if not model.groups.has_id(pathway.id) and len(pathway.members) > 0:
         model.add_groups(group_list=[pathway])
-        debug_log.info(f'Pathway "{pathway.id}" added to Model.')
+        debug_log.info('Pathway "%s" added to Model.', pathway.id)
 
 
 def remove_avoid_reactions(
@@ -724,6 +733,7 @@ def add_pathway_from_strings(
         pathway.notes["ORDER"] = pathway.graph
 
 
+@cmod_profiling.traced("add_pathway", "pathway", "database")
 def add_pathway(
     model: cobra_core.Model,
     pathway: Union[list[str], str, Path],
@@ -776,9 +786,10 @@ def add_pathway(
     Arguments for summary:
         filename (Path, optional): Location for the summary. Defaults to
             "summary" in the current working directory. The file format is
-            defined by the suffix. The suffixes '.txt', '.csv' and '.xlsx' can
-            be used. If the filename is set to None, no summary will be
-            created.
+            defined by the suffix. The suffixes '.txt', '.csv', '.xlsx',
+            '.jsonl' and '.parquet' can be used. The last two only include
+            the changes and are the fastest. If the filename is set to None,
+            no summary will be created.
 
     Arguments for utilities:
         stop_imbalance (bool, optional): If an unbalanced reaction is found,
@@ -803,90 +814,91 @@ def add_pathway(
             f"Directory '{str(directory)}' not found. Create the data directory"
         )
 
-    # Save information for summary methods
-    old_values = DataModel.from_model(model)
+    # Record the changes for the summary
+    with ChangeTracker(model) as tracker:
+        # Check if identifier
+        if isinstance(pathway, str):
+            identifier = pathway
 
-    # Check if identifier
-    if isinstance(pathway, str):
-        identifier = pathway
+            pathway = Path(pathway).absolute()
 
-        pathway = Path(pathway).absolute()
+            # Identifier found
+            if not pathway.suffix:
+                pathway = identifier
 
-        # Identifier found
-        if not pathway.suffix:
-            pathway = identifier
-
-    if isinstance(pathway, str):
-        data_dict = cmod_retrieval.get_data(
-            directory=directory,
-            identifier=pathway,
-            database=database,
-            model_id=model_id,
-            genome=genome,
-        )
-        if not database:
-            raise AttributeError(
-                "Database argument cannot be empty. Specify the name"
+        if isinstance(pathway, str):
+            data_dict = cmod_retrieval.get_data(
+                directory=directory,
+                identifier=pathway,
+                database=database,
+                model_id=model_id,
+                genome=genome,
+            )
+            if not database:
+                raise AttributeError(
+                    "Database argument cannot be empty. Specify the name"
+                )
+            add_pathway_from_data(
+                model=model,
+                data=data_dict,
+                directory=directory,
+                database=database,
+                compartment=compartment,
+                avoid_list=avoid_list,
+                replacement=replacement,
+                ignore_list=ignore_list,
+                show_imbalance=show_imbalance,
+                stop_imbalance=stop_imbalance,
+                model_id=model_id,
+                genome=genome,
+                group=group,
             )
-        add_pathway_from_data(
-            model=model,
-            data=data_dict,
-            directory=directory,
-            database=database,
-            compartment=compartment,
-            avoid_list=avoid_list,
-            replacement=replacement,
-            ignore_list=ignore_list,
-            show_imbalance=show_imbalance,
-            stop_imbalance=stop_imbalance,
-            model_id=model_id,
-            genome=genome,
-            group=group,
-        )
 
-    elif isinstance(pathway, Path):
-        if not group:
-            group = "custom_group"
+        elif isinstance(pathway, Path):
+            if not group:
+                group = "custom_group"
 
-        add_pathway_from_file(
-            model=model,
-            file=pathway,
-            database=database,
-            ignore_list=ignore_list,
-            genome=genome,
-            model_id=model_id,
-            directory=directory,
-            replacement=replacement,
-            show_imbalance=show_imbalance,
-            stop_imbalance=stop_imbalance,
-            identifier=group,
-        )
+            add_pathway_from_file(
+                model=model,
+                file=pathway,
+                database=database,
+                ignore_list=ignore_list,
+                genome=genome,
+                model_id=model_id,
+                directory=directory,
+                replacement=replacement,
+                show_imbalance=show_imbalance,
+                stop_imbalance=stop_imbalance,
+                identifier=group,
+            )
 
-    elif isinstance(pathway, list):
-        if not group:
-            group = "custom_group"
+        elif isinstance(pathway, list):
+            if not group:
+                group = "custom_group"
 
-        # if not database:
-        #     raise AttributeError(
-        #         "Database argument cannot be empty. Specify the name"
-        #     )
+            # if not database:
+            #     raise AttributeError(
+            #         "Database argument cannot be empty. Specify the name"
+            #     )
 
-        add_pathway_from_strings(
-            model=model,
-            identifier=group,
-            sequence=pathway,
-            compartment=compartment,
-            avoid_list=avoid_list,
-            directory=directory,
-            database=database,
-            replacement=replacement,
-            ignore_list=ignore_list,
-            show_imbalance=show_imbalance,
-            stop_imbalance=stop_imbalance,
-            model_id=model_id,
-            genome=genome,
-        )
-    else:
-        raise ValueError("Argument 'pathway' must be iterable or a identifier")
+            add_pathway_from_strings(
+                model=model,
+                identifier=group,
+                sequence=pathway,
+                compartment=compartment,
+                avoid_list=avoid_list,
+                directory=directory,
+                database=database,
+                replacement=replacement,
+                ignore_list=ignore_list,
+                show_imbalance=show_imbalance,
+                stop_imbalance=stop_imbalance,
+                model_id=model_id,
+                genome=genome,
+            )
+        else:
+            raise ValueError(
+                "Argument 'pathway' must be iterable or a identifier"
+            )
 
-    summarize(model, old_values, filename=filename)
+    summarize(model, tracker, filename=filename)
@@ -5,17 +5,26 @@ a pathway. The vertex represents the reactions and the edges symbolize the
 order of the reactions. I.e. the relationship between reactions. The main
 function of this module:
 
-build_graph: From given dictionary with Parent-reaction:children-reaction,
-return the corresponding non-cyclic directed graph.
-
+get_graph_dict: From given dictionary with Parent-reaction:children-reaction,
+return the mapping of the corresponding non-cyclic directed graph.
+
+The mapping is computed on a reverse index of the graph (child to parents).
+Cycles are found with an iterative version of Tarjan's algorithm for strongly
+connected components and the longest paths of the resulting acyclic graph are
+extracted without recursion. Thus, large graphs do not hit the recursion limit
+of Python. The algorithms run on :class:`CompactGraph`, where the reactions
+are interned to integers and the edges are stored in arrays.
 """
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter
 from contextlib import suppress
 from itertools import chain
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
 
 from cobramod.error import GraphKeyError
 
@@ -287,6 +296,622 @@ def get_mapping(graph: dict, stop_list: list, new: list) -> list:
     return new
 
 
+def get_children(
+    value: Union[str, tuple[str, ...], None],
+) -> tuple[str, ...]:
+    """
+    Returns the children of a node as a tuple. The value of a node can be a
+    single child, a tuple with multiple children or None.
+    """
+    if value is None:
+        return ()
+
+    if isinstance(value, tuple):
+        return value
+
+    return (value,)
+
+
+class CompactGraph:
+    """
+    Directed graph, whose nodes are interned to integers. The children of the
+    node i are stored in CSR format, i.e. in
+    :code:`indices[indptr[i] : indptr[i + 1]]`. This class is used internally
+    by the graph algorithms and can be converted from and into the dictionary
+    format of :attr:`cobramod.pathway.Pathway.graph`.
+
+    Attributes:
+        nodes (list[str]): Identifiers of the nodes. The first "size" nodes
+            are the keys of the dictionary. The rest are children, which are
+            not keys.
+        position (dict[str, int]): Integer of each identifier.
+        size (int): Number of keys.
+        indptr (numpy.ndarray): Offsets of the children of each key.
+        indices (numpy.ndarray): Children of all keys.
+        tuples (numpy.ndarray): Whether the value of a key is a tuple.
+    """
+
+    def __init__(
+        self,
+        nodes: list[str],
+        size: int,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        tuples: np.ndarray,
+    ):
+        self.nodes = nodes
+        self.position = {node: number for number, node in enumerate(nodes)}
+        self.size = size
+        self.indptr = indptr
+        self.indices = indices
+        self.tuples = tuples
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return (
+            f"<CompactGraph with {self.size} nodes and {len(self.indices)} "
+            "edges>"
+        )
+
+    @classmethod
+    def from_dict(cls, graph: dict) -> CompactGraph:
+        """
+        Returns a CompactGraph from a dictionary representing the
+        relationships between nodes. Values can be a single child, a tuple
+        with children or None.
+        """
+        nodes = list(graph.keys())
+        position = {node: number for number, node in enumerate(nodes)}
+        counts = np.zeros(len(nodes) + 1, dtype=np.int64)
+        tuples = np.zeros(len(nodes), dtype=bool)
+        children: list[int] = list()
+
+        for number, value in enumerate(graph.values()):
+            tuples[number] = isinstance(value, tuple)
+
+            for child in get_children(value):
+                try:
+                    children.append(position[child])
+
+                except KeyError:
+                    position[child] = len(nodes)
+                    nodes.append(child)
+                    children.append(position[child])
+
+            counts[number + 1] = len(children)
+
+        return cls(
+            nodes=nodes,
+            size=len(graph),
+            indptr=counts,
+            indices=np.array(children, dtype=np.int64),
+            tuples=tuples,
+        )
+
+    @classmethod
+    def from_adjacency(
+        cls,
+        nodes: list[str],
+        size: int,
+        adjacency: list[list[int]],
+        tuples: np.ndarray,
+    ) -> CompactGraph:
+        """
+        Returns a CompactGraph from the lists with the children of each key.
+        """
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum([len(children) for children in adjacency], out=indptr[1:])
+
+        return cls(
+            nodes=nodes,
+            size=size,
+            indptr=indptr,
+            indices=np.fromiter(
+                chain.from_iterable(adjacency), dtype=np.int64, count=indptr[-1]
+            ),
+            tuples=tuples,
+        )
+
+    def to_dict(self) -> dict[str, Union[str, tuple[str, ...], None]]:
+        """
+        Returns the graph in the dictionary format. Keys without children
+        have None as value, unless their value was a tuple.
+        """
+        graph: dict[str, Union[str, tuple[str, ...], None]] = dict()
+
+        for number, children in enumerate(self.adjacency()):
+            value = tuple(self.nodes[child] for child in children)
+
+            if self.tuples[number]:
+                graph[self.nodes[number]] = value
+
+            elif value:
+                graph[self.nodes[number]] = value[0]
+
+            else:
+                graph[self.nodes[number]] = None
+
+        return graph
+
+    def children(self, node: int) -> np.ndarray:
+        """
+        Returns the children of given node.
+        """
+        if node >= self.size:
+            return self.indices[:0]
+
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def adjacency(self) -> list[list[int]]:
+        """
+        Returns a list with the children of each key. Lists of Python integers
+        are faster than NumPy arrays for algorithms that visit node by node.
+        """
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+
+        return [
+            indices[indptr[number] : indptr[number + 1]]
+            for number in range(self.size)
+        ]
+
+    def reverse(self) -> list[list[int]]:
+        """
+        Returns a list with the parents of each node. The parents follow the
+        order of the keys.
+        """
+        parents: list[list[int]] = [[] for _ in self.nodes]
+
+        for number, children in enumerate(self.adjacency()):
+            for child in children:
+                parents[child].append(number)
+
+        return parents
+
+    def cut(self, nodes: Iterable[int]) -> CompactGraph:
+        """
+        Returns a new CompactGraph, where given keys do not have children. In
+        the dictionary format, their value is None.
+        """
+        adjacency = self.adjacency()
+        tuples = self.tuples.copy()
+
+        for node in nodes:
+            adjacency[node] = []
+            tuples[node] = False
+
+        return CompactGraph.from_adjacency(
+            self.nodes, self.size, adjacency, tuples
+        )
+
+    def filter(self, avoid: Iterable[str]) -> CompactGraph:
+        """
+        Returns a new CompactGraph without given nodes. These nodes are also
+        removed from the children of the remaining keys. Tuples with a single
+        child left become a single child and keys that lose all their children
+        have no children.
+        """
+        removed = {self.position[node] for node in avoid if node in self}
+        kept = [number for number in range(self.size) if number not in removed]
+        adjacency = self.adjacency()
+        tuples = self.tuples.copy()
+
+        for number in kept:
+            children = adjacency[number]
+            remaining = [child for child in children if child not in removed]
+
+            if len(remaining) == len(children):
+                continue
+
+            # Single children are strings. Tuples with repeated children can
+            # be emptied, which results in an empty tuple
+            tuples[number] = len(remaining) > 1 or (
+                tuples[number] and not remaining and len(set(children)) == 1
+            )
+            adjacency[number] = remaining
+
+        # Renumbering of the nodes
+        nodes = [self.nodes[number] for number in kept]
+        extra = [
+            node
+            for number, node in enumerate(self.nodes[self.size :], self.size)
+            if number not in removed
+        ]
+        position = {node: number for number, node in enumerate(nodes + extra)}
+
+        return CompactGraph.from_adjacency(
+            nodes + extra,
+            len(nodes),
+            [
+                [position[self.nodes[child]] for child in adjacency[number]]
+                for number in kept
+            ],
+            tuples[kept],
+        )
+
+    def __contains__(self, node: str) -> bool:
+        number = self.position.get(node)
+        return number is not None and number < self.size
+
+    def components(
+        self, nodes: Optional[Iterable[int]] = None
+    ) -> list[list[int]]:
+        """
+        Returns the strongly connected components of the graph. The components
+        are found with an iterative version of Tarjan's algorithm. Only edges
+        between given keys are considered.
+
+        Args:
+            nodes (Iterable, optional): Keys to consider. Defaults to all keys
+
+        Returns:
+            List: Strongly connected components as lists of nodes.
+        """
+        return _find_components(self.adjacency(), self.size, nodes)
+
+    def cut_cycles(self) -> list[int]:
+        """
+        Returns the keys that have to be cut to remove all cycles. The keys are
+        checked in order and every key, which can reach a cycle, is cut. The
+        result is the same as cutting repeatedly the first cyclic path from
+        :func:`return_cycles`, but the cycles are only searched once.
+        """
+        adjacency = self.adjacency()
+        parents = self.reverse()
+        cyclic: set[int] = set()
+        membership: dict[int, list[int]] = dict()
+
+        for component in _find_components(adjacency, self.size):
+            for node in component:
+                membership[node] = component
+
+            if _is_cyclic(adjacency, component):
+                cyclic.update(component)
+
+        if not cyclic:
+            return []
+
+        reaching: set[int] = set()
+        _update_reaching(
+            adjacency, parents, cyclic, reaching, set(range(self.size))
+        )
+        cut: list[int] = list()
+
+        for key in range(self.size):
+            if key not in reaching:
+                continue
+
+            for child in adjacency[key]:
+                parents[child].remove(key)
+
+            adjacency[key] = []
+            cut.append(key)
+
+            # Only the component of the key can be split
+            if key in cyclic:
+                old_component = membership[key]
+                cyclic.difference_update(old_component)
+
+                for component in _find_components(
+                    adjacency, self.size, old_component
+                ):
+                    for node in component:
+                        membership[node] = component
+
+                    if _is_cyclic(adjacency, component):
+                        cyclic.update(component)
+
+            # Only the nodes that reach the key can change
+            region = {key}
+            queue = [key]
+            while queue:
+                node = queue.pop()
+
+                for parent in parents[node]:
+                    if parent in reaching and parent not in region:
+                        region.add(parent)
+                        queue.append(parent)
+
+            _update_reaching(adjacency, parents, cyclic, reaching, region)
+
+        return cut
+
+    def longest_paths(self) -> list[list[int]]:
+        """
+        Returns the mapping of the graph, which must not contain cycles. The
+        mapping is created by removing repeatedly the longest path from the
+        graph. A path is extended backwards from a key without children by
+        using the first remaining parent in the order of the keys. Ties are
+        solved with the order of the keys. Keys, that are not part of any path,
+        are added at the end as single paths.
+        """
+        adjacency = self.adjacency()
+        parents = self.reverse()
+        ends = [not children for children in adjacency]
+        pointer = [0] * self.size
+        removed = [False] * self.size
+
+        # First remaining parent of each node and its inverse
+        first: list[int] = [-1] * self.size
+        followers: list[list[int]] = [[] for _ in range(self.size)]
+
+        def find_first(node: int) -> int:
+            candidates = parents[node]
+
+            while pointer[node] < len(candidates):
+                parent = candidates[pointer[node]]
+
+                if not removed[parent]:
+                    followers[parent].append(node)
+                    return parent
+
+                pointer[node] += 1
+
+            return -1
+
+        for key in range(self.size):
+            first[key] = find_first(key)
+
+        # Number of nodes in the path that ends with each node. 0 is unknown
+        length = [0] * self.size
+        heap: list[tuple[int, int]] = list()
+
+        def update_length(nodes: Iterable[int]):
+            for node in nodes:
+                chain_nodes = []
+
+                while node != -1 and not length[node]:
+                    chain_nodes.append(node)
+                    node = first[node]
+
+                total = 0 if node == -1 else length[node]
+
+                for member in reversed(chain_nodes):
+                    total += 1
+                    length[member] = total
+
+                    if ends[member]:
+                        heapq.heappush(heap, (-total, member))
+
+        update_length(range(self.size))
+        mapping: list[list[int]] = list()
+
+        while heap:
+            total, end = heapq.heappop(heap)
+
+            if removed[end] or -total != length[end]:
+                continue
+
+            path = [end]
+            parent = first[end]
+
+            while parent != -1:
+                path.append(parent)
+                parent = first[parent]
+
+            path.reverse()
+            mapping.append(path)
+
+            for node in path:
+                removed[node] = True
+
+            # Nodes that followed a removed node need a new parent
+            changed: list[int] = list()
+
+            for node in path:
+                for follower in followers[node]:
+                    if removed[follower] or first[follower] != node:
+                        continue
+
+                    first[follower] = find_first(follower)
+                    changed.append(follower)
+
+            # Lengths of their descendants are recalculated
+            queue = changed
+            affected: list[int] = list()
+
+            while queue:
+                node = queue.pop()
+
+                if not length[node]:
+                    continue
+
+                length[node] = 0
+                affected.append(node)
+
+                for follower in followers[node]:
+                    if not removed[follower] and first[follower] == node:
+                        queue.append(follower)
+
+            update_length(affected)
+
+        mapping.extend([key] for key in range(self.size) if not removed[key])
+        return mapping
+
+
+def _find_components(
+    adjacency: list[list[int]], size: int, nodes: Optional[Iterable[int]] = None
+) -> list[list[int]]:
+    """
+    Iterative version of Tarjan's algorithm. See
+    :meth:`CompactGraph.components`.
+    """
+    members = [nodes is None] * size
+    if nodes is not None:
+        for node in nodes:
+            members[node] = True
+
+    index = [-1] * size
+    low = [0] * size
+    on_stack = [False] * size
+    stack: list[int] = list()
+    components: list[list[int]] = list()
+    counter = 0
+
+    for root in range(size):
+        if not members[root] or index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(adjacency[root]))]
+
+        while work:
+            node, children = work[-1]
+
+            for child in children:
+                if child >= size or not members[child]:
+                    continue
+
+                if index[child] == -1:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, iter(adjacency[child])))
+                    break
+
+                if on_stack[child]:
+                    low[node] = min(low[node], index[child])
+
+            else:
+                # All children visited
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+                if low[node] == index[node]:
+                    component: list[int] = list()
+
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+
+                        if member == node:
+                            break
+
+                    components.append(component)
+
+    return components
+
+
+def _is_cyclic(adjacency: list[list[int]], component: list[int]) -> bool:
+    """
+    Returns whether given strongly connected component contains a cycle. This
+    is the case for components with multiple nodes or nodes that point to
+    themselves.
+    """
+    if len(component) > 1:
+        return True
+
+    return component[0] in adjacency[component[0]]
+
+
+def _update_reaching(
+    adjacency: list[list[int]],
+    parents: list[list[int]],
+    cyclic: set[int],
+    reaching: set[int],
+    region: set[int],
+):
+    """
+    Updates the set of nodes that can reach a cycle for the nodes in given
+    region. Nodes outside of the region are not modified.
+    """
+    reaching.difference_update(region)
+    queue = [
+        node
+        for node in region
+        if node in cyclic
+        or any(
+            child in reaching and child not in region
+            for child in adjacency[node]
+        )
+    ]
+    reaching.update(queue)
+
+    while queue:
+        node = queue.pop()
+
+        for parent in parents[node]:
+            if parent in region and parent not in reaching:
+                reaching.add(parent)
+                queue.append(parent)
+
+
+def find_components(
+    graph: dict, nodes: Optional[Iterable[str]] = None
+) -> list[list[str]]:
+    """
+    Returns the strongly connected components of given graph. Only edges
+    between the given nodes are considered.
+
+    Args:
+        graph (dict): Dictionary representing the relationships between nodes.
+            A node can have several edges, which should be represented in the
+            form of values.
+        nodes (Iterable, optional): Nodes to consider. Defaults to all keys
+            of the graph.
+
+    Returns:
+        List: Strongly connected components as lists of nodes.
+    """
+    compact = CompactGraph.from_dict(graph)
+    numbers = None
+    if nodes is not None:
+        numbers = [compact.position[node] for node in nodes]
+
+    return [
+        [compact.nodes[node] for node in component]
+        for component in compact.components(numbers)
+    ]
+
+
+def cut_cycles(graph: dict):
+    """
+    Cuts the cycles of given graph. The keys are checked in order and every
+    key, which can reach a cycle, is cut (its value is replaced by None). The
+    result is the same as cutting repeatedly the first cyclic path from
+    :func:`return_cycles`, but the cycles are only searched once.
+
+    Args:
+        graph (dict): Dictionary representing the relationships between nodes.
+            A node can have several edges, which should be represented in the
+            form of values. This will be modified.
+    """
+    compact = CompactGraph.from_dict(graph)
+
+    for node in compact.cut_cycles():
+        cut_cycle(graph=graph, key=compact.nodes[node])
+
+
+def get_longest_paths(graph: dict) -> list[list[str]]:
+    """
+    Returns the mapping of given acyclic graph. See
+    :meth:`CompactGraph.longest_paths`.
+
+    Args:
+        graph (dict): Dictionary representing the relationships between nodes.
+            A node can have several edges, which should be represented in the
+            form of values. The graph must not contain cycles.
+
+    Returns:
+        List: Paths from given graph in order of extraction.
+    """
+    compact = CompactGraph.from_dict(graph)
+    return [
+        [compact.nodes[node] for node in path]
+        for path in compact.longest_paths()
+    ]
+
+
 def get_graph_dict(graph: dict[str, Union[str, tuple[str]]]) -> list[list[str]]:
     """
     Returns the mapping for the given graph. The mapping is defined as a list
@@ -305,20 +930,18 @@ def get_graph_dict(graph: dict[str, Union[str, tuple[str]]]) -> list[list[str]]:
     """
     # Check that all values are represented
     find_missing(graph=graph)
-    # its value cannot be None. If single element then go directly to mapping
-    with suppress(KeyError):
-        # Cut parents if needed
-        cut_parents(graph=graph)
-        # Fix cycles if found
-        cycles = return_cycles(graph=graph)
-        # Check until no cycles are found.
-        while cycles:
-            # This is modify graph
-            # TODO: check whether tuples are affected
-            cut_cycle(graph=graph, key=cycles[0][0])  # type: ignore
-            cycles = return_cycles(graph=graph)
-    # This would modify the graph. Use copy
-    mapping = get_mapping(graph=graph.copy(), stop_list=[], new=[])
+    # Cut parents if needed
+    cut_parents(graph=graph)
+    compact = CompactGraph.from_dict(graph)
+    # Fix cycles if found. This modifies the graph
+    cut = compact.cut_cycles()
+    for node in cut:
+        graph[compact.nodes[node]] = None  # type: ignore
+
+    mapping = [
+        [compact.nodes[node] for node in path]
+        for path in compact.cut(cut).longest_paths()
+    ]
     mapping.sort(key=len, reverse=True)
     return mapping
 
@@ -326,30 +949,250 @@ def get_graph_dict(graph: dict[str, Union[str, tuple[str]]]) -> list[list[str]]:
 def filter_graph(graph: dict, avoid_list: list) -> dict:
     """
     Returns a new graph, where items are removed if found in given avoid list.
+    The items are also removed from the values of the remaining keys.
+
+    Args:
+        graph (dict): Dictionary representing the relationships between nodes.
+        avoid_list (list): Nodes to remove.
+
+    Returns:
+        Dict: New graph without given nodes.
     """
-    # TODO: docstrings
-    new_graph = graph.copy()
-    # Remove necessary keys in copy
-    for reaction in avoid_list:
-        with suppress(KeyError):
-            del new_graph[reaction]
-        for key, value in new_graph.items():
-            # Avoid NoneType
+    return CompactGraph.from_dict(graph).filter(avoid_list).to_dict()
+
+
+class MappingCache:
+    """
+    Mapping of a graph, that is updated incrementally. The mapping is the same
+    as the one returned by :func:`get_graph_dict`, but it is computed for each
+    weakly connected component separately. When the graph changes, only the
+    components with modified keys are computed again. The given graphs are not
+    modified.
+
+    Attributes:
+        graph (dict): Copy of the graph from the last update.
+        mapping (list): Mapping of the graph from the last update.
+        cut (set): Keys whose value is replaced by None to obtain a lineal
+            directed graph.
+        matrix (list, optional): Matrix of the mapping. It can be stored by
+            the visualization and it is reset when the mapping changes.
+    """
+
+    def __init__(self):
+        self.graph: dict[str, Union[str, tuple[str, ...], None]] = dict()
+        self.mapping: list[list[str]] = list()
+        self.cut: set[str] = set()
+        self.matrix: Optional[list[list]] = None
+        # Identifier of the component of each key and the components
+        self._membership: dict[str, int] = dict()
+        self._components: dict[int, _Component] = dict()
+        self._counter = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<MappingCache with {len(self.graph)} nodes and "
+            f"{len(self._components)} components>"
+        )
+
+    def _modified(self, graph: dict) -> set[str]:
+        """
+        Returns the keys that were added, removed or changed since the last
+        update, and their children.
+        """
+        modified: set[str] = set()
 
-            if not value:
+        for key, value in graph.items():
+            try:
+                old_value = self.graph[key]
+
+            except KeyError:
+                modified.add(key)
+                modified.update(get_children(value))
+                continue
+
+            if old_value != value:
+                modified.add(key)
+                modified.update(get_children(value))
+                modified.update(get_children(old_value))
+
+        for key in self.graph.keys() - graph.keys():
+            modified.add(key)
+            modified.update(get_children(self.graph[key]))
+
+        return modified
+
+    def update(self, graph: dict) -> bool:
+        """
+        Updates the mapping for given graph. Components that are not affected
+        by the changes keep their paths.
+
+        Args:
+            graph (dict): Dictionary representing the relationships between
+                nodes. A node can have several edges, which should be
+                represented in the form of values.
+
+        Returns:
+            bool: Whether the mapping changed.
+
+        Raises:
+            GraphKeyError: If graph is missing a value.
+        """
+        modified = self._modified(graph)
+        if not modified:
+            return False
+
+        find_missing(graph=graph)
+
+        # Components with modified nodes are removed. The nodes of the new
+        # components can only be found in this region
+        region: set[str] = set()
+        for node in modified:
+            number = self._membership.get(node)
+
+            if number is None:
+                region.add(node)
                 continue
 
-            elif reaction in value and isinstance(value, tuple):
-                new_graph[key] = tuple(
-                    item for item in value if item != reaction
-                )
-                # Transform to str if only one element
-                if len(new_graph[key]) == 1:
-                    new_graph[key] = new_graph[key][0]
-
-            elif reaction == value:
-                new_graph[key] = None
-    return new_graph
+            with suppress(KeyError):
+                region.update(self._components.pop(number).nodes)
+
+        region.intersection_update(graph.keys())
+        for node in region:
+            self._membership.pop(node, None)
+
+        for key in self.graph.keys() - graph.keys():
+            self._membership.pop(key, None)
+
+        self.graph = graph.copy()
+        for nodes in self._split(region):
+            self._counter += 1
+            self._components[self._counter] = _Component(
+                {key: self.graph[key] for key in nodes}
+            )
+
+            for node in nodes:
+                self._membership[node] = self._counter
+
+        self._merge()
+        self.matrix = None
+
+        return True
+
+    def _split(self, region: set[str]) -> list[list[str]]:
+        """
+        Returns the weakly connected components of the nodes in given region.
+        The nodes follow the order of the keys of the graph.
+        """
+        order = [key for key in self.graph.keys() if key in region]
+        position = {key: number for number, key in enumerate(order)}
+        neighbours: dict[str, list[str]] = {node: [] for node in order}
+
+        for node in order:
+            for child in get_children(self.graph[node]):
+                neighbours[node].append(child)
+                neighbours[child].append(node)
+
+        components: list[list[str]] = list()
+        visited: set[str] = set()
+
+        for key in order:
+            if key in visited:
+                continue
+
+            visited.add(key)
+            queue = [key]
+            component = [key]
+
+            while queue:
+                node = queue.pop()
+
+                for neighbour in neighbours[node]:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        component.append(neighbour)
+                        queue.append(neighbour)
+
+            component.sort(key=position.__getitem__)
+            components.append(component)
+
+        return components
+
+    def _merge(self):
+        """
+        Merges the paths of all components in the order, in which
+        :func:`get_graph_dict` extracts them from the complete graph.
+        """
+        position = {key: number for number, key in enumerate(self.graph)}
+
+        def extraction(path: list[str]) -> tuple[int, int]:
+            return (-len(path), position[path[-1]])
+
+        self.cut = set()
+        leftovers: list[list[str]] = list()
+
+        for component in self._components.values():
+            self.cut.update(component.cut)
+            leftovers.extend(component.leftovers)
+
+        # The paths with the longest one at the top of each component are
+        # extracted first
+        self.mapping = list(
+            heapq.merge(
+                *(component.paths for component in self._components.values()),
+                key=extraction,
+            )
+        )
+        leftovers.sort(key=lambda path: position[path[0]])
+        self.mapping.extend(leftovers)
+        self.mapping.sort(key=len, reverse=True)
+
+    def cut_graph(self) -> dict[str, Union[str, tuple[str, ...], None]]:
+        """
+        Returns a copy of the graph from the last update, where the cut keys
+        have None as value.
+        """
+        return {
+            key: None if key in self.cut else value
+            for key, value in self.graph.items()
+        }
+
+
+class _Component:
+    """
+    Paths of a weakly connected component of a graph.
+
+    Attributes:
+        nodes (list): Keys of the component.
+        cut (list): Keys whose value is replaced by None.
+        paths (list): Paths in order of extraction.
+        leftovers (list): Single keys that are not part of any path.
+    """
+
+    __slots__ = ("nodes", "cut", "paths", "leftovers")
+
+    def __init__(self, graph: dict):
+        self.nodes = list(graph.keys())
+        self.cut = [key for key, value in graph.items() if value is not None]
+        cut_parents(graph=graph)
+
+        compact = CompactGraph.from_dict(graph)
+        numbers = compact.cut_cycles()
+        compact = compact.cut(numbers)
+        self.cut = [key for key in self.cut if graph[key] is None]
+        self.cut.extend(compact.nodes[number] for number in numbers)
+
+        self.paths: list[list[str]] = list()
+        self.leftovers: list[list[str]] = list()
+
+        for path in compact.longest_paths():
+            names = [compact.nodes[node] for node in path]
+
+            # Keys with children are only single paths if they are left over
+            if len(path) == 1 and len(compact.children(path[0])):
+                self.leftovers.append(names)
+
+            else:
+                self.paths.append(names)
 
 
 def build_lineal_graph(sequence: list[str]) -> dict[str, Union[str, None]]:
@@ -11,25 +11,23 @@ from __future__ import annotations
 
 import warnings
 from pathlib import Path
-from typing import Any, Optional, Union, Literal
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Optional, Union, Literal
 
 import cobra.core as cobra_core
-
-from cobramod.visualization.escher import EscherIntegration
-from cobramod.visualization.force_graph import ForceGraphIntegration
-
-try:
-    import escher
-
-    _has_escher = True
-except ImportError:
-    _has_escher = False
-
+import numpy as np
 import pandas as pd
 
+from cobramod.core.graph import MappingCache
 from cobramod.debug import debug_log
 from cobramod.error import GraphKeyError
-from cobramod.visualization.converter import JsonDictionary
+
+if TYPE_CHECKING:
+    import escher
+
+    from cobramod.visualization.escher import EscherIntegration
+    from cobramod.visualization.force_graph import ForceGraphIntegration
+    from cobramod.visualization.frames import Frames
 
 
 class Pathway(cobra_core.Group):
@@ -105,6 +103,9 @@ class Pathway(cobra_core.Group):
         # Loop has to be after __init__, otherwise, behavior of class changes.
         self.graph = dict()  # type: ignore
         self.notes: dict[str, Any] = {"ORDER": dict()}
+        # Layout of the graph. Only the modified parts of the graph are
+        # computed again when visualizing
+        self._mapping_cache = MappingCache()
 
         if members:
             for member in members:
@@ -273,11 +274,12 @@ class Pathway(cobra_core.Group):
     def visualize(
         self,
         solution_fluxes: Optional[
-            Union[cobra_core.Solution, dict[str, float]]
+            Union[cobra_core.Solution, dict[str, float], pd.Series, Frames]
         ] = None,
         filename: Optional[Union[str, Path]] = None,
         vis: Literal["escher", "escher-custom", "3d-force"] = "escher",
         never_ask_before_quit: bool = False,
+        directory: Optional[Union[str, Path]] = None,
     ) -> Union[escher.Builder, EscherIntegration, ForceGraphIntegration, None]:
         """
         .. versionchanged:: 1.3.0
@@ -288,6 +290,13 @@ class Pathway(cobra_core.Group):
 
         :param solution_fluxes: Series or Dictionary with fluxes. The values will be then showed in the Builder. Defaults to None.
 
+            .. versionchanged:: 1.3.1
+                Multiple solutions can be passed as a sequence or as a DataFrame with a row for each solution, e.g.
+                from a parameter scan or flux sampling. The map is only built once and the solution shown is defined
+                by the attribute 'frame' of the widget. The color scale covers the fluxes of all solutions. Only
+                supported by "escher-custom" and "3d-force". A two-dimensional array has a row for each solution
+                and a column for each member in the order of the attribute 'members'.
+
         :param filename: Path for the HTML. Defaults to "pathway.html" in the current working directory.
 
         :param vis:
@@ -307,12 +316,39 @@ class Pathway(cobra_core.Group):
             Option to control whether a warning dialog is displayed when the Escher Builder window is closed.
             Only has an effect when using Escher for visualization.
 
+        :param directory:
+            .. versionadded:: 1.3.1
+
+            Directory with the data. If given, the layouts are cached in its folder "Layout" and visualizing an
+            unchanged pathway uses the stored positions. Defaults to None.
+
         """
+        # The visualization and its widgets are only imported when needed
+        from cobramod.visualization.converter import JsonDictionary
+        from cobramod.visualization.force_graph import ForceGraphIntegration
+        from cobramod.visualization.frames import flux_frames
+        from cobramod.visualization.layout import LayoutCache
+
+        frames = None
+        if solution_fluxes is not None and not isinstance(
+            solution_fluxes, (cobra_core.Solution, dict, pd.Series)
+        ):
+            # Columns of arrays follow the order of the members
+            frames = flux_frames(
+                solutions=solution_fluxes,
+                reactions=[member.id for member in self.members]
+                if isinstance(solution_fluxes, np.ndarray)
+                else None,
+            )
 
         if vis == "3d-force":
             widget = ForceGraphIntegration()
+            widget.directory = directory
             widget.model = self
-            widget.solution = solution_fluxes
+            if frames is None:
+                widget.solution = solution_fluxes
+            else:
+                widget.set_frames(frames)
 
             return widget
 
@@ -321,14 +357,28 @@ class Pathway(cobra_core.Group):
             filename = "pathway.html"
 
         # Define solution. If None, nothing will be added. Either dict or
-        # regular solution
-        if solution_fluxes is not None:
-            if isinstance(solution_fluxes, cobra_core.Solution):
-                solution_fluxes = solution_fluxes.fluxes.to_dict()
+        # regular solution. Multiple solutions start with the first one
+        if frames is not None:
+            json_dict.flux_frames = frames
+            if not frames.empty:
+                json_dict.flux_solution = frames.iloc[0].dropna()
+        elif isinstance(solution_fluxes, cobra_core.Solution):
+            json_dict.flux_solution = solution_fluxes.fluxes
+        elif solution_fluxes is not None:
             json_dict.flux_solution = solution_fluxes
 
         # Get graph and add to json_dict
         json_dict.graph = self.graph.copy()
+        # Pathways that were unpickled or copied without __init__ do not have
+        # a cache yet
+        mapping_cache = getattr(self, "_mapping_cache", None)
+        if mapping_cache is None:
+            mapping_cache = self._mapping_cache = MappingCache()
+        json_dict.mapping_cache = mapping_cache
+        if directory is not None:
+            json_dict.layout_cache = LayoutCache(
+                directory=directory, name=self.id
+            )
         reactions: dict[str, str] = {m.id: m.reaction for m in self.members}
         json_dict.reaction_strings = reactions
 
@@ -346,7 +396,7 @@ class Pathway(cobra_core.Group):
             )
             return builder
 
-        if _has_escher:
+        if find_spec("escher") is not None:
             builder = json_dict.visualize(
                 filepath=filename,
                 vertical=self.vertical,
@@ -2,17 +2,90 @@
 
 This module is responsible for the short summary in the command
 line and for other summaries in different formats.
+
+The changes of a model can be identified by comparing two snapshots, see
+:class:`DataModel`, or by recording them while the model is modified, see
+:class:`ChangeTracker`. The tracker also records the changes of the functions
+in :mod:`cobramod.core.creation` if they are called inside its context.
+
+The summary files in the formats JSONL and Parquet only include the changes.
 """
 
 from __future__ import annotations
+
+import csv
+import json
+from functools import partial
+from itertools import zip_longest
 from pathlib import Path
-from typing import Union, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
 import pandas
-from cobra import Model
+from cobra import Model, Reaction
+from cobra.manipulation import remove_genes
+from cobra.medium import find_external_compartment, is_boundary_type
+from cobra.util.context import HistoryManager
 
+import cobramod.profiling as cmod_profiling
 from cobramod.debug import debug_log
 
+# Columns of the summary files and the corresponding attribute of DataModel
+COLUMNS = {
+    "Reactions": "reactions",
+    "Exchange": "exchanges",
+    "Demand": "demands",
+    "Sinks": "sinks",
+    "Metabolites": "metabolites",
+    "Genes": "genes",
+    "Groups": "groups",
+}
+
+# Keys of the records in JSONL and Parquet files
+JOURNAL_FIELDS = ("model", "change", "type", "identifier")
+
+# Attribute of DataModel and the corresponding type for cobra.medium
+BOUNDARY_TYPES = {"exchanges": "exchange", "demands": "demand", "sinks": "sink"}
+
+
+def boundary_types(
+    model: Model, reactions: Optional[Iterable[Reaction]] = None
+) -> dict[str, list[str]]:
+    """
+    Returns the identifiers of the exchange, demand and sink reactions. The
+    result is the same as :attr:`cobra.Model.exchanges`,
+    :attr:`cobra.Model.demands` and :attr:`cobra.Model.sinks` but the external
+    compartment is only searched once and only boundary reactions or reactions
+    with a SBO term are checked.
+
+    .. versionadded:: 1.3.1
+
+    Args:
+        model (Model): Model that defines the external compartment.
+        reactions (Iterable, optional): Reactions to check. Defaults to all
+            reactions of the model.
+    """
+    types: dict[str, list[str]] = {key: [] for key in BOUNDARY_TYPES}
+
+    if reactions is None:
+        reactions = model.reactions
+
+    candidates = [
+        reaction
+        for reaction in reactions
+        if reaction.boundary or "sbo" in reaction.annotation
+    ]
+    if not candidates or not model.boundary:
+        return types
+
+    external = find_external_compartment(model)
+
+    for reaction in candidates:
+        for key, boundary_type in BOUNDARY_TYPES.items():
+            if is_boundary_type(reaction, boundary_type, external):
+                types[key].append(reaction.id)
+
+    return types
+
 
 class DataModel:
     """
@@ -30,12 +103,12 @@ class DataModel:
         self.sinks = lists.get("sinks", [])
 
         # reaction includes only values not already in exchanges or sinks
+        excluded = set(self.sinks).union(self.exchanges)
 
         self.reactions = [
             reaction
             for reaction in lists.get("reactions") or []
-            if reaction not in set(self.sinks)
-            and reaction not in set(self.exchanges)
+            if reaction not in excluded
         ]
 
     @classmethod
@@ -47,24 +120,13 @@ class DataModel:
             model (Model): Model based on which a DataModel object
                 is to be created.
         """
-
-        characteristics = {
-            "reactions": model.reactions,
-            "metabolites": model.metabolites,
-            "demands": model.demands,
-            "exchanges": model.exchanges,
-            "genes": model.genes,
-            "groups": model.groups,
-            "sinks": model.sinks,
+        data = {
+            "reactions": [reaction.id for reaction in model.reactions],
+            "metabolites": [metabolite.id for metabolite in model.metabolites],
+            "genes": [gene.id for gene in model.genes],
+            "groups": [group.id for group in model.groups],
         }
-
-        data = {}
-
-        for identifier, values in characteristics.items():
-            try:
-                data[identifier] = values.list_attr("id")
-            except AttributeError:
-                data[identifier] = []
+        data.update(boundary_types(model))
 
         return cls(data)
 
@@ -147,6 +209,36 @@ class DataModel:
 
         return "".join(output)
 
+    def _columns(
+        self, model: Model = None, additions=None, deletions=None
+    ) -> Iterator[tuple[str, list[str]]]:
+        """
+        Yields the name and the values of each column of the summary. The
+        model is described first and then the modifications. Intended for
+        internal use only.
+
+        Args:
+            model (Model): Model for the extraction of model id and name.
+            additions (DataModel): DataModel that contains the new entities
+                in the model.
+            deletions (DataModel): DataModel that contains the removed entities
+                in the model.
+        """
+        if model is not None:
+            yield "Model identifier", [str(model.id)]
+            yield "Model name", [str(model.name)]
+
+        for prefix, data_model in (
+            ("", self),
+            ("New in ", additions),
+            ("Removed in ", deletions),
+        ):
+            if data_model is None:
+                continue
+
+            for column, attribute in COLUMNS.items():
+                yield prefix + column, getattr(data_model, attribute)
+
     def _to_dataframe(
         self, model: Model = None, additions=None, deletions=None
     ):
@@ -166,66 +258,10 @@ class DataModel:
         dtype = pandas.StringDtype()
 
         dictionary = {
-            "Reactions": pandas.Series(self.reactions, dtype=dtype),
-            "Exchange": pandas.Series(self.exchanges, dtype=dtype),
-            "Demand": pandas.Series(self.demands, dtype=dtype),
-            "Sinks": pandas.Series(self.sinks, dtype=dtype),
-            "Metabolites": pandas.Series(self.metabolites, dtype=dtype),
-            "Genes": pandas.Series(self.genes, dtype=dtype),
-            "Groups": pandas.Series(self.groups, dtype=dtype),
+            column: pandas.Series(values, dtype=dtype)
+            for column, values in self._columns(model, additions, deletions)
         }
 
-        if model is not None:
-            model_identifier = {
-                "Model identifier": pandas.Series(str(model.id), dtype=dtype),
-                "Model name": pandas.Series(str(model.name), dtype=dtype),
-            }
-
-            # Preserving the order so that the original model
-            # comes first and then the modifications
-            model_identifier.update(dictionary)
-            dictionary = model_identifier
-
-        if additions is not None:
-            addition = {
-                "New in Reactions": pandas.Series(
-                    additions.reactions, dtype=dtype
-                ),
-                "New in Exchange": pandas.Series(
-                    additions.exchanges, dtype=dtype
-                ),
-                "New in Demand": pandas.Series(additions.demands, dtype=dtype),
-                "New in Sinks": pandas.Series(additions.sinks, dtype=dtype),
-                "New in Metabolites": pandas.Series(
-                    additions.metabolites, dtype=dtype
-                ),
-                "New in Genes": pandas.Series(additions.genes, dtype=dtype),
-                "New in Groups": pandas.Series(additions.groups, dtype=dtype),
-            }
-            dictionary.update(addition)
-
-        if deletions is not None:
-            deleted = {
-                "Removed in Reactions": pandas.Series(
-                    additions.reactions, dtype=dtype
-                ),
-                "Removed in Exchange": pandas.Series(
-                    additions.exchanges, dtype=dtype
-                ),
-                "Removed in Demand": pandas.Series(
-                    additions.demands, dtype=dtype
-                ),
-                "Removed in Sinks": pandas.Series(additions.sinks, dtype=dtype),
-                "Removed in Metabolites": pandas.Series(
-                    additions.metabolites, dtype=dtype
-                ),
-                "Removed in Genes": pandas.Series(additions.genes, dtype=dtype),
-                "Removed in Groups": pandas.Series(
-                    additions.groups, dtype=dtype
-                ),
-            }
-            dictionary.update(deleted)
-
         return pandas.DataFrame(dictionary)
 
     def to_excl(
@@ -266,8 +302,13 @@ class DataModel:
             in the model.
         """
 
-        save = self._to_dataframe(model, additions, deletions)
-        save.to_csv(path, index=False)
+        columns = dict(self._columns(model, additions, deletions))
+
+        # Rows are written one by one without a DataFrame
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns.keys())
+            writer.writerows(zip_longest(*columns.values(), fillvalue=""))
 
     def to_txt(self, path, model: Model = None, additions=None, deletions=None):
         """
@@ -310,28 +351,240 @@ class DataModel:
             file.writelines(line + "\n" for line in output)
 
 
+class ChangeTracker(HistoryManager):
+    """
+    Records the changes of a model while it is modified. The tracker is
+    registered as the context of the model, thus COBRApy reports each added
+    or removed object to it. Unlike the context of a model, the changes are
+    not reverted. Changes inside a nested context (:code:`with model:`) are
+    not recorded since they are reverted anyway. If the tracker is used
+    inside of a context of the model, the undo operations are passed on to
+    it, thus the changes are still reverted when that context is left.
+
+    Compared to two snapshots with :meth:`DataModel.from_model`, only the
+    changed objects are examined.
+
+    .. versionadded:: 1.3.1
+
+    Attributes:
+        journal (list): The changes in the order they happened. Each entry is
+            a tuple with the change ("added" or "removed"), the type of the
+            object ("reactions", "metabolites" or "genes") and the object.
+
+    Examples:
+        >>> with ChangeTracker(model) as tracker:
+        ...     model.add_reactions([reaction])
+        >>> tracker.additions().reactions
+        ['reaction']
+    """
+
+    def __init__(self, model: Model):
+        """
+        Args:
+            model (Model): Model to track.
+        """
+        super().__init__()
+        self.model = model
+        self.journal: list[tuple[str, str, Any]] = []
+        # Groups are not reported by COBRApy
+        self._groups: list[str] = [group.id for group in model.groups]
+        # Context of the model that was open when entering the tracker
+        self._parent: Optional[HistoryManager] = None
+
+    def __enter__(self) -> ChangeTracker:
+        contexts = self.model._contexts
+        self._parent = contexts[-1] if contexts else None
+        contexts.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.model._contexts.remove(self)
+        self._parent = None
+
+    def __call__(self, operation: Callable[[], Any]):
+        """
+        Records the objects of given undo operation. All other operations are
+        discarded. The operation is passed on to the previous context of the
+        model, if any.
+        """
+        if self._parent is not None:
+            self._parent(operation)
+
+        if not isinstance(operation, partial):
+            return
+
+        function = operation.func
+        model = self.model
+
+        # The undo operation of an addition is the removal and vice versa
+        if function == model.reactions.__isub__:
+            self._record("reactions", operation.args[0], added=True)
+        elif function == model.reactions.add:
+            self._record("reactions", operation.args, added=False)
+        elif function == model.metabolites.__isub__:
+            self._record("metabolites", operation.args[0], added=True)
+        elif function == model.metabolites.__iadd__:
+            self._record("metabolites", operation.args[0], added=False)
+        elif function is remove_genes:
+            self._record("genes", operation.keywords["gene_list"], added=True)
+        elif function == model.genes.add:
+            self._record("genes", operation.args, added=False)
+
+    def _record(self, key: str, objects: Iterable, added: bool):
+        change = "added" if added else "removed"
+        self.journal.extend((change, key, obj) for obj in objects)
+
+    def _replay(self, change: str) -> dict[str, dict[str, Any]]:
+        """
+        Returns the objects of given change after replaying the journal.
+        """
+        objects: dict[str, dict[str, dict[str, Any]]] = {
+            name: {"reactions": {}, "metabolites": {}, "genes": {}}
+            for name in ("added", "removed")
+        }
+
+        for name, key, obj in self.journal:
+            current = objects[name][key]
+            opposite = objects["removed" if name == "added" else "added"][key]
+
+            # An addition and a removal cancel each other out
+            if opposite.pop(obj.id, None) is None:
+                current[obj.id] = obj
+
+        return objects[change]
+
+    def reset(self):
+        """
+        Does nothing. The changes are kept.
+        """
+        pass
+
+    def _to_data_model(self, objects: dict[str, dict[str, Any]]) -> DataModel:
+        data = {key: list(values) for key, values in objects.items()}
+        data.update(boundary_types(self.model, objects["reactions"].values()))
+
+        return DataModel(data)
+
+    def additions(self) -> DataModel:
+        """
+        Returns a DataModel with the objects that were added to the model.
+        """
+        additions = self._to_data_model(self._replay("added"))
+        previous = set(self._groups)
+        additions.groups = [
+            group.id for group in self.model.groups if group.id not in previous
+        ]
+        return additions
+
+    def deletions(self) -> DataModel:
+        """
+        Returns a DataModel with the objects that were removed from the model.
+        """
+        deletions = self._to_data_model(self._replay("removed"))
+        groups = self.model.groups
+        deletions.groups = [
+            group for group in self._groups if not groups.has_id(group)
+        ]
+        return deletions
+
+
+def changes(
+    model: Model, additions: DataModel, deletions: DataModel
+) -> Iterator[dict[str, str]]:
+    """
+    Yields a record for each added or removed entity with the keys "model",
+    "change", "type" and "identifier".
+
+    .. versionadded:: 1.3.1
+    """
+    for change, data_model in (("added", additions), ("removed", deletions)):
+        for key, values in vars(data_model).items():
+            for identifier in values:
+                yield {
+                    "model": str(model.id),
+                    "change": change,
+                    "type": key,
+                    "identifier": identifier,
+                }
+
+
+def to_jsonl(
+    path: Path, model: Model, additions: DataModel, deletions: DataModel
+):
+    """
+    Saves the changes as JSON lines, one record per line, see
+    :func:`changes`. The records are written while they are created.
+
+    .. versionadded:: 1.3.1
+    """
+    with open(path, "w") as file:
+        for record in changes(model, additions, deletions):
+            file.write(json.dumps(record) + "\n")
+
+
+def to_parquet(
+    path: Path, model: Model, additions: DataModel, deletions: DataModel
+):
+    """
+    Saves the changes as a Parquet table with a row per record, see
+    :func:`changes`.
+
+    .. versionadded:: 1.3.1
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pylist(
+        list(changes(model, additions, deletions)),
+        schema=pa.schema([(name, pa.string()) for name in JOURNAL_FIELDS]),
+    )
+    pq.write_table(table, path)
+
+
+# Formats that only include the changes
+JOURNAL_FORMATS: dict[str, Callable] = {
+    ".jsonl": to_jsonl,
+    ".parquet": to_parquet,
+}
+
+
+@cmod_profiling.traced("summary")
 def summary(
-    model: Model, original: DataModel, filename: Optional[Union[str, Path]]
+    model: Model,
+    original: Union[DataModel, ChangeTracker],
+    filename: Optional[Union[str, Path]],
 ):
     """
     Produces the short summary and another one in the defined format.
 
     Args:
         model (Model): model with recent changes.
-        original (DataModel): Object with data from the previous model. Use
-            method :func:`cobramod.summary.DataModel`.
+        original (DataModel, ChangeTracker): Object with data from the
+            previous model. Use method :func:`cobramod.summary.DataModel` or
+            the tracker that recorded the changes. With a tracker, the model
+            is only read again to create the file.
         filename (Path): Location where the summary should be stored.
             The file format is determined by the suffix of the filename.
-            Thus, '.txt', '.csv' or '.xlsx' can be used.
+            Thus, '.txt', '.csv' or '.xlsx' can be used. The formats '.jsonl'
+            and '.parquet' only include the changes, see :func:`changes`.
+
+    .. versionchanged:: 1.3.1
+        Argument "original" can be a :class:`ChangeTracker`. The formats
+        '.jsonl' and '.parquet' were added.
     """
 
     if isinstance(filename, str):
         filename = Path(filename)
 
-    new_values = DataModel.from_model(model)
+    new_values: Optional[DataModel] = None
 
-    deletions = original - new_values
-    additions = new_values - original
+    if isinstance(original, ChangeTracker):
+        deletions = original.deletions()
+        additions = original.additions()
+    else:
+        new_values = DataModel.from_model(model)
+        deletions = original - new_values
+        additions = new_values - original
 
     # check if there are any changes otherwise notify the user
     num_changes = 0
@@ -387,17 +640,26 @@ def summary(
     if filename is None:
         return
 
+    file_format = filename.suffix
+
+    # The changes are enough for these formats
+    if file_format in JOURNAL_FORMATS:
+        JOURNAL_FORMATS[file_format](filename, model, additions, deletions)
+        return
+
+    if file_format not in (".xlsx", ".csv", ".txt"):
+        debug_log.warning(
+            "Unknown format therefore no summary was created. Use '.xlsx', "
+            "'.csv', '.txt', '.jsonl' or '.parquet'."
+        )
+        return
+
+    if new_values is None:
+        new_values = DataModel.from_model(model)
+
     options = {
         ".xlsx": new_values.to_excl,
         ".csv": new_values.to_csv,
         ".txt": new_values.to_txt,
     }
-
-    try:
-        file_format = filename.suffix
-        options[file_format](filename, model, additions, deletions)
-    except KeyError:
-        debug_log.warning(
-            "Unknown format therefore no summary was created."
-            "Use '.xlsx', ',csv' or ',txt'."
-        )
+    options[file_format](filename, model, additions, deletions)
@@ -1,22 +1,42 @@
 """
 Debugging configuration for CobraMod
 
-The logs are saved in the directory 'logs' created in the working directory.
-Cobramod saves the logs by date, i.e, running the commands in different days
-will results in different files. The default level is set to INFO.
+The name of logger variable is `debug_log`. Importing CobraMod only attaches
+a colored stream handler to it and does not create any files. The default
+level is set to INFO.
 
-The name of logger variable is `debug_log`
+The logs can be saved in a directory with :func:`configure_logging`. CobraMod
+saves the logs by date, i.e, running the commands in different days will
+results in different files. The logs of the sub-package visualization are
+saved in separated files of the same directory.
+
+For runs with multiple processes, a :class:`multiprocessing.Queue` can be
+passed to :func:`configure_logging`. The main process then writes all records
+and each worker process forwards its records to the queue, see
+:func:`configure_worker_logging`.
+
+.. versionchanged:: 1.3.1
+    The directory "logs" is not created at import anymore.
 """
 
 import datetime as dt
 import logging
+import os
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Any, List, Optional, Union
 
 import colorlog
 
 debug_log = logging.getLogger("debug_log")
 debug_log.setLevel(logging.INFO)
 
+# Logger of the sub-package visualization. No output until the logging is
+# configured
+visualization_log = logging.getLogger("visualization")
+visualization_log.setLevel(logging.DEBUG)
+visualization_log.addHandler(logging.NullHandler())
+
 format_str = "%(log_color)s%(message)s"
 TIME_STR = "%H:%M:%S"
 
@@ -38,16 +58,151 @@ debug_log.addHandler(stream_handler)
 format_str = "[%(asctime)s] %(levelname)s %(message)s"
 formatter_file = logging.Formatter(format_str, TIME_STR)
 
-log_dir = Path("logs").absolute()
-log_dir.mkdir(exist_ok=True)
-log_path = log_dir.joinpath(
-    f"cobramod_{dt.date.today().strftime('%Y%m%d')}.log"
-)
+# Handlers and listener of the last call of configure_logging
+_handlers: List[logging.Handler] = []
+_listener: Optional[QueueListener] = None
+# Process that added the handlers. Forked processes inherit them
+_owner: Optional[int] = None
+
+
+def _file_handler(directory: Path, name: str) -> logging.FileHandler:
+    """
+    Returns a handler that appends to the file of today for given name.
+    """
+    path = directory.joinpath(
+        f"{name}_{dt.date.today().strftime('%Y%m%d')}.log"
+    )
+    handler = logging.FileHandler(path, mode="a+", delay=True)
+    handler.setFormatter(formatter_file)
+    return handler
+
+
+def _reset_handlers():
+    """
+    Removes the handlers added by :func:`configure_logging` or
+    :func:`configure_worker_logging` and stops the queue listener. Handlers
+    and the listener inherited by a forked process are only dropped, since
+    they still belong to the parent process. Stopping the listener would put
+    its sentinel into the shared queue and stop the listener of the parent.
+    """
+    global _listener, _owner
+
+    owned = _owner == os.getpid()
+    # The listener might have been stopped already by the user
+    if owned and getattr(_listener, "_thread", None) is not None:
+        _listener.stop()  # type: ignore[union-attr]
+    _listener = None
+
+    for logger in (debug_log, visualization_log):
+        for handler in _handlers:
+            logger.removeHandler(handler)
+
+    if owned:
+        for handler in _handlers:
+            handler.close()
+    _handlers.clear()
+    _owner = os.getpid()
+
+
+def configure_logging(
+    directory: Optional[Union[str, Path]] = "logs",
+    level: int = logging.INFO,
+    stream: bool = True,
+    queue: Any = None,
+) -> Optional[QueueListener]:
+    """
+    Configures the logging of CobraMod. The logs are appended to the files
+    "cobramod_<date>.log" and "visualization_<date>.log" in given directory.
+    Calling this function again replaces the previous configuration.
+
+    .. versionadded:: 1.3.1
 
-debug_handler = logging.FileHandler(log_path, mode="a+")
-debug_handler.setFormatter(formatter_file)
+    Args:
+        directory (Path, optional): Directory for the log files. It is created
+            if it does not exist. Defaults to "logs" in the working directory.
+            If None, no files are written.
+        level (int): Logging level of CobraMod. Defaults to INFO.
+        stream (bool): If the colored output in the terminal is shown.
+            Defaults to True.
+        queue (Queue, optional): Queue of a multi-process run, e.g.
+            :class:`multiprocessing.Queue`. The loggers only put the records
+            into the queue and a listener in this process writes them into the
+            files.
+
+    Returns:
+        QueueListener: The started listener if a queue is given, otherwise
+            None. Call :meth:`logging.handlers.QueueListener.stop` to flush
+            the remaining records at the end of the run.
+
+    Examples:
+        >>> import multiprocessing
+        >>> from cobramod.debug import configure_logging
+        >>> queue = multiprocessing.Queue()
+        >>> listener = configure_logging("logs", queue=queue)
+        >>> # Start processes with configure_worker_logging(queue)
+        >>> listener.stop()
+    """
+    global _listener
+
+    _reset_handlers()
+    debug_log.setLevel(level)
+
+    if stream:
+        if stream_handler not in debug_log.handlers:
+            debug_log.addHandler(stream_handler)
+    else:
+        debug_log.removeHandler(stream_handler)
+
+    if directory is None:
+        return None
+
+    path = Path(directory).absolute()
+    path.mkdir(parents=True, exist_ok=True)
+    debug_handler = _file_handler(path, "cobramod")
+    visualization_handler = _file_handler(path, "visualization")
+
+    if queue is None:
+        _handlers.extend((debug_handler, visualization_handler))
+        debug_log.addHandler(debug_handler)
+        visualization_log.addHandler(visualization_handler)
+        return None
+
+    # Records of both loggers share the queue and are routed by name
+    debug_handler.addFilter(logging.Filter(debug_log.name))
+    visualization_handler.addFilter(logging.Filter(visualization_log.name))
+
+    queue_handler = QueueHandler(queue)
+    _handlers.extend((debug_handler, visualization_handler, queue_handler))
+    debug_log.addHandler(queue_handler)
+    visualization_log.addHandler(queue_handler)
+
+    _listener = QueueListener(
+        queue, debug_handler, visualization_handler, respect_handler_level=True
+    )
+    _listener.start()
+    return _listener
+
+
+def configure_worker_logging(queue: Any, level: int = logging.INFO) -> None:
+    """
+    Configures the logging of a worker process in a multi-process run. All
+    records are put into given queue without any output in the worker. The
+    main process must call :func:`configure_logging` with the same queue.
+
+    .. versionadded:: 1.3.1
+
+    Args:
+        queue (Queue): Queue of the multi-process run.
+        level (int): Logging level of CobraMod. Defaults to INFO.
+    """
+    _reset_handlers()
+    debug_log.setLevel(level)
+    debug_log.removeHandler(stream_handler)
 
-debug_log.addHandler(debug_handler)
+    queue_handler = QueueHandler(queue)
+    _handlers.append(queue_handler)
+    debug_log.addHandler(queue_handler)
+    visualization_log.addHandler(queue_handler)
 
 
 def change_to_debug() -> None:
@@ -4,6 +4,8 @@ This module creates special errors for CobraMod. Read each error for their
 explanation.
 """
 
+import requests
+
 from cobramod.debug import debug_log
 
 
@@ -135,3 +137,31 @@ class UnbalancedReaction(Exception):
         )
         debug_log.critical(msg)
         super().__init__(msg)
+
+
+class DatabaseVersionError(Exception):
+    """
+    Simple Error that should be raised if the version of retrieved data does
+    not match the version of the database stored in the data directory.
+
+    .. versionadded:: 1.3.1
+    """
+
+    pass
+
+
+class NotRecordedError(requests.ConnectionError):
+    """
+    Simple Error that should be raised if a request is replayed from an
+    archive that does not include it. See :mod:`cobramod.transport`.
+
+    .. versionadded:: 1.3.1
+    """
+
+    def __init__(self, request: requests.PreparedRequest):
+        """
+        Args:
+            request (PreparedRequest): Request that was not recorded.
+        """
+        msg = f'No response recorded for "{request.method} {request.url}"'
+        super().__init__(msg, request=request)
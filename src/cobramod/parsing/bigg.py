@@ -18,6 +18,7 @@ from typing import Any
 
 import requests
 
+import cobramod.transport as cmod_transport
 import cobramod.utils as cmod_utils
 from cobramod.debug import debug_log
 
@@ -39,7 +40,12 @@ def find_url(model_id: str, query: str) -> tuple[requests.Response, str]:
 
     Raises:
         HTTPError: If identifier is not found in BIGG database.
+
+    .. versionchanged:: 1.3.1
+        The error includes the last response, so that an identifier that is
+        not found can be recognized by its status code 404.
     """
+    response = None
     for object_type in ("reactions", "metabolites"):
         with suppress(requests.HTTPError):
             # Check that status is available
@@ -59,10 +65,10 @@ def find_url(model_id: str, query: str) -> tuple[requests.Response, str]:
             )
             debug_log.debug(f"Searching {url_text} for biochemical data.")
             # Get and check for errors
-            response = requests.get(url_text)
+            response = cmod_transport.get(url_text)
             response.raise_for_status()
 
-            info_response = requests.get(
+            info_response = cmod_transport.get(
                 "http://bigg.ucsd.edu/api/v2/database_version"
             )
             info_response.raise_for_status()
@@ -71,7 +77,8 @@ def find_url(model_id: str, query: str) -> tuple[requests.Response, str]:
             return response, db_version
     # Otherwise
     raise requests.HTTPError(
-        f"Identifier '{query}' not found in BIGG (model: '{model_id}')."
+        f"Identifier '{query}' not found in BIGG (model: '{model_id}').",
+        response=response,
     )
 
 
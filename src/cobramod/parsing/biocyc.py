@@ -19,6 +19,8 @@ from typing import Any
 import requests
 
 import cobramod.error as cmod_error
+import cobramod.storage as cmod_storage
+import cobramod.transport as cmod_transport
 import cobramod.utils as cmod_utils
 from cobramod.debug import debug_log
 
@@ -298,8 +300,7 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
     # GENES directory will depend from the sub-database
     directory = directory.joinpath(database, "GENES")
 
-    if not directory.exists():
-        directory.mkdir()
+    directory.mkdir(exist_ok=True)
 
     # Retrieval of the Gene information
     filename = directory.joinpath(f"{identifier}_genes.xml")
@@ -313,7 +314,7 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
 
         return
 
-    if not filename.exists():
+    if not cmod_storage.exists(filename):
         # This URL will not necessarily raise exception
         encoded_id = urllib.parse.quote(identifier, safe="")
 
@@ -326,7 +327,7 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
         user, pwd = cmod_utils.get_credentials(
             Path.cwd().joinpath("credentials.txt")
         )
-        s = requests.Session()
+        s = cmod_transport.session()
         s.post(
             "https://websvc.biocyc.org/credentials/login/",
             data={"email": user, "password": pwd},
@@ -348,7 +349,9 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
             if element.text == "0":
                 return
 
-            tree.write(str(filename))
+            cmod_storage.write_text(
+                filename, et.tostring(root, encoding="unicode")
+            )
             debug_log.info(
                 f'Object "{identifier}_gene.xml" saved in '
                 f'directory "{database}/GENES".'
@@ -369,7 +372,11 @@ def parse_genes(identifier: str, directory: Path) -> dict:
     genes = dict()
     # Get the information and check if Genes can be found to be parsed
     with suppress(FileNotFoundError):
-        tree = et.parse(directory.joinpath(f"{identifier}_genes.xml")).getroot()
+        tree = et.fromstring(
+            cmod_storage.read_text(
+                directory.joinpath(f"{identifier}_genes.xml")
+            )
+        )
 
         if not isinstance(tree, et.Element):
             raise TypeError("Given root is not a valid Element object")
@@ -5,8 +5,18 @@ This modules includes the class DataVersionConfigurator which is in charge of
 obtaining and comparing the version from the obtained metabolic data.
 It uses the same structure of using a Singleton for the configuration in
 COBRApy
+
+The versions are stored in the file "DatabaseVersions.csv" of the data
+directory. The file is read once and written under a lock, thus multiple
+processes can share the same data directory.
+
+.. versionchanged:: 1.3.1
+    Each database is only checked once per process. The attribute
+    `mismatch_policy` allows to handle different versions without user input.
 """
 
+import csv
+from contextlib import suppress
 from pathlib import Path
 from typing import Optional, Union
 
@@ -14,14 +24,137 @@ import pandas as pd
 from cobra.core.singleton import Singleton
 
 import cobramod.error as cmod_error
+import cobramod.utils as cmod_utils
 from cobramod.debug import debug_log
 
+FILENAME = "DatabaseVersions.csv"
+
+# Options of DataVersionConfigurator.mismatch_policy
+POLICIES = ("ask", "warn", "raise", "refetch")
+
+
+def read_versions(file: Path) -> dict[str, str]:
+    """
+    Returns a dictionary with the databases and their versions from given
+    versioning file. If the file does not exist, the dictionary is empty.
+    """
+    versions: dict[str, str] = {}
+
+    with suppress(FileNotFoundError), open(file, newline="") as f:
+        for row in csv.DictReader(f):
+            database, version = row["orgid"], row["version"]
+
+            if database in versions:
+                debug_log.warning(
+                    'Database "%s" is defined multiple times in "%s". Using '
+                    'version "%s".',
+                    database,
+                    file,
+                    versions[database],
+                )
+                continue
+
+            versions[database] = version
+
+    return versions
+
+
+def write_versions(file: Path, versions: dict[str, str]):
+    """
+    Writes the databases and their versions into given versioning file. The
+    file is replaced at once, thus an interrupted write never leaves a broken
+    file behind.
+    """
+    with cmod_utils.atomic_file(file) as temporary:
+        with open(temporary, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["orgid", "version"])
+            writer.writerows(versions.items())
+
 
 class DataVersionConfigurator(metaclass=Singleton):
+    """
+    Configuration for the versions of the databases.
+
+    Attributes:
+        ignore_db_versions (bool): If True, different versions are only
+            logged. Defaults to False.
+        force_same_version (bool): If True, different versions raise
+            :class:`cobramod.error.DatabaseVersionError`. Defaults to False.
+        mismatch_policy (str): Behaviour for different versions if neither of
+            the attributes above is set. Options:
+
+            - "ask": Asks the user to ignore the mismatch (default).
+            - "warn": Logs a warning once per database.
+            - "raise": Raises :class:`cobramod.error.DatabaseVersionError`.
+            - "refetch": The local file is retrieved again and the version of
+              the new file is stored.
+        versions (dict, optional): The databases and their versions of the
+            loaded data directory.
+    """
+
     def __init__(self):
         self.ignore_db_versions: bool = False
-        self.database_version: Optional[pd.DataFrame] = None
         self.force_same_version: bool = False
+        self.mismatch_policy = "ask"
+        self.versions: Optional[dict[str, str]] = None
+        self._directory: Optional[Path] = None
+        # Versions of the databases that were already checked in each
+        # directory
+        self._checked: dict[tuple[Path, str], str] = {}
+
+    @property
+    def mismatch_policy(self) -> str:
+        return self._mismatch_policy
+
+    @mismatch_policy.setter
+    def mismatch_policy(self, policy: str):
+        if policy not in POLICIES:
+            raise ValueError(
+                f'Policy "{policy}" is not valid. Options: {POLICIES}'
+            )
+        self._mismatch_policy = policy
+
+    @property
+    def database_version(self) -> Optional[pd.DataFrame]:
+        """
+        The loaded versions as a DataFrame with the columns "orgid" and
+        "version". Setting it to None forces a new read of the versioning
+        file.
+        """
+        if self.versions is None:
+            return None
+
+        return pd.DataFrame(
+            {
+                "orgid": list(self.versions.keys()),
+                "version": list(self.versions.values()),
+            }
+        )
+
+    @database_version.setter
+    def database_version(self, versions: Optional[pd.DataFrame]):
+        self._checked.clear()
+
+        if versions is None:
+            self.versions = None
+            self._directory = None
+            return
+
+        self.versions = dict(
+            zip(versions["orgid"], versions["version"].astype(str))
+        )
+
+    def _load(self, directory: Path) -> dict[str, str]:
+        """
+        Returns the versions of given directory. The versioning file is only
+        read if the directory changes.
+        """
+        if self.versions is None or self._directory != directory:
+            self.versions = read_versions(directory / FILENAME)
+            self._directory = directory
+
+        return self.versions
 
     def get_database_version(self, directory: Union[str, Path]) -> pd.DataFrame:
         """
@@ -34,22 +167,13 @@ class DataVersionConfigurator(metaclass=Singleton):
             (pd.DataFrame): A DataFrame containing the orgid and version, at
                 the time of the first retrieval, for all databases used so far.
         """
-        if isinstance(directory, str):
-            directory = Path(directory)
-
-        if self.database_version is not None:
-            return self.database_version
-        try:
-            file = directory / "DatabaseVersions.csv"
-            self.database_version = pd.read_csv(file)
-        except FileNotFoundError:
-            self.database_version = pd.DataFrame(columns=["orgid", "version"])
+        self._load(Path(directory).absolute())
 
-        return self.database_version
+        database_version = self.database_version
+        assert database_version is not None
+        return database_version
 
     def get_local_databases(self, directory: Union[Path, str]) -> pd.Series:
-        if isinstance(directory, str):
-            directory = Path(directory).absolute()
         databases = self.get_database_version(directory)
         databases = databases["orgid"]
 
@@ -57,101 +181,113 @@ class DataVersionConfigurator(metaclass=Singleton):
 
     def check_database_version(
         self, directory: Union[str, Path], database: str, version: Optional[str]
-    ):
+    ) -> bool:
         """
         Function to compare the saved database version with the one
-        of the retrieved data.
+        of the retrieved data. The version of a new database is stored.
 
         Args:
             directory (Path): The folder used for storing data.
             database (str): Identifier of the database.
             version (str): The version of the database.
-        """
-        if isinstance(directory, str):
-            directory = Path(directory).absolute()
 
-        if self.database_version is None:
-            self.get_database_version(directory=directory)
+        Returns:
+            (bool): False if the local file must be retrieved again, see
+                attribute `mismatch_policy`. Otherwise, True.
+
+        Raises:
+            DatabaseVersionError: If the versions differ and different
+                versions are not allowed.
+            UserInterruption: If the user does not ignore the mismatch.
+        """
+        version = "" if version is None else str(version)
+        directory = Path(directory).absolute()
+        key = (directory, database)
 
-        assert isinstance(self.database_version, pd.DataFrame)
-        row = self.database_version.loc[
-            self.database_version["orgid"] == database
-        ]
+        if self._checked.get(key) == version:
+            return True
 
-        if row.shape[0] == 0:
-            return self.set_database_version(directory, database, version)
+        versions = self._load(directory)
 
-        if row.shape[0] > 1:
-            exit()
+        if database not in versions:
+            self.set_database_version(directory, database, version)
+            versions = self._load(directory)
 
         # NOTE: not all version use the same versioning
-        expected_version = str(row["version"].tolist()[0])
+        expected_version = versions[database]
 
-        # row can not be more than one value but python does not know that
-        # => any
+        if expected_version == version:
+            self._checked[key] = version
+            return True
 
-        if expected_version != version:
-            msg = (
-                "Versions of {} do not match. Remote has version {} "
-                "and local version is {}.".format(
-                    database, version, expected_version
-                )
-            )
-            debug_log.warning(msg)
+        msg = (
+            f"Versions of {database} do not match. Remote has version "
+            f"{version} and local version is {expected_version}."
+        )
+        debug_log.warning(msg)
 
-            if self.ignore_db_versions:
-                return
+        if self.ignore_db_versions:
+            self._checked[key] = version
+            return True
 
-            if self.force_same_version:
-                raise Exception(
-                    "DB Configuration: force_same_version is True\n"
-                    "Database differs from local dabatase and retrieved data!"
-                )
-            else:
-                while True:
-                    choice = input("Ignore version mismatch? (Y)es (N)o: ")
+        policy = "raise" if self.force_same_version else self.mismatch_policy
+
+        if policy == "warn":
+            self._checked[key] = version
+            return True
+
+        if policy == "raise":
+            raise cmod_error.DatabaseVersionError(msg)
+
+        if policy == "refetch":
+            return False
+
+        while True:
+            choice = input("Ignore version mismatch? (Y)es (N)o: ")
 
-                    if choice.lower() == "y":
-                        self.ignore_db_versions = True
-                        break
+            if choice.lower() == "y":
+                self.ignore_db_versions = True
+                return True
 
-                    if choice.lower() == "n":
-                        raise cmod_error.UserInterruption(
-                            "Interrupted by user input"
-                        )
+            if choice.lower() == "n":
+                raise cmod_error.UserInterruption("Interrupted by user input")
 
     def set_database_version(
-        self, directory: Union[str, Path], database: str, version: Optional[str]
+        self,
+        directory: Union[str, Path],
+        database: str,
+        version: Optional[str],
+        overwrite: bool = False,
     ) -> bool:
         """
-        Adds the version of a database to the local data versioning file.
+        Adds the version of a database to the local data versioning file. The
+        file is read again under a lock, thus versions that were added by
+        other processes are kept.
 
         Args:
             directory (Path): The folder used for storing data.
             database (str): Identifier of the database.
             version (str): The version of the database.
+            overwrite (bool): If True, a stored version of the database is
+                replaced. Defaults to False.
 
         Returns:
              (bool): Returns True if the addition was successful.
 
         """
-        if isinstance(directory, str):
-            directory = Path(directory).absolute()
-
-        if self.database_version is None:
-            self.get_database_version(directory=directory)
-
-        assert isinstance(self.database_version, pd.DataFrame)
-        self.database_version = pd.concat(
-            [
-                self.database_version,
-                pd.DataFrame({"orgid": [database], "version": [version]}),
-            ],
-            ignore_index=True,
-        )
+        directory = Path(directory).absolute()
+        version = "" if version is None else str(version)
+        file = directory / FILENAME
 
-        self.database_version.to_csv(
-            path_or_buf=str(directory / "DatabaseVersions.csv"), index=False
-        )
+        with cmod_utils.file_lock(directory / f"{FILENAME}.lock"):
+            versions = read_versions(file)
+
+            if overwrite or database not in versions:
+                versions[database] = version
+                write_versions(file, versions)
+
+        self.versions = versions
+        self._directory = directory
+        self._checked.pop((directory, database), None)
 
         return True
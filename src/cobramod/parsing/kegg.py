@@ -18,6 +18,8 @@ from typing import Any, Generator, Optional
 
 import requests
 
+import cobramod.storage as cmod_storage
+import cobramod.transport as cmod_transport
 import cobramod.utils as cmod_utils
 from cobramod.debug import debug_log
 from cobramod.error import WrongParserError
@@ -171,7 +173,7 @@ def ko_generator(identifier: str) -> Generator[str, None, None]:
     """
     url_text = f"http://rest.kegg.jp/link/ko/{identifier}"
     try:
-        response = requests.get(url_text)
+        response = cmod_transport.get(url_text)
         response.raise_for_status()
         return (
             single
@@ -237,34 +239,32 @@ def retrieve_kegg_genes(directory: Path, identifier: str):
 
     directory = directory.joinpath("KEGG", "GENES")
 
-    if not directory.exists():
-        directory.mkdir()
+    directory.mkdir(exist_ok=True)
 
     # Retrieval of the Gene information
     filename = directory.joinpath(f"{identifier}_genes.txt")
 
-    if not filename.exists():
+    if not cmod_storage.exists(filename):
         try:
             string = "+".join(ko_generator(identifier))
             url_text = f"http://rest.kegg.jp/link/genes/{string}"
-            response = requests.get(url_text)
+            response = cmod_transport.get(url_text)
             response.raise_for_status()
 
-            with open(file=filename, mode="w") as file:
-                file.write(response.text)
+            cmod_storage.write_text(filename, response.text)
 
         except requests.ConnectionError:
             # NOTE: Using Generator otherwise, server breaks connection
             generator = ko_generator(identifier)
+            texts: list[str] = []
             while True:
                 try:
                     ko = next(generator)
                     url_text = f"http://rest.kegg.jp/link/genes/{ko}"
-                    response = requests.get(url_text)
+                    response = cmod_transport.get(url_text)
                     response.raise_for_status()
 
-                    with open(file=filename, mode="a+") as file:
-                        file.write(response.text)
+                    texts.append(response.text)
                 except requests.HTTPError:
                     raise requests.HTTPError(
                         f'Gene information for "{identifier}" unavailable'
@@ -272,6 +272,8 @@ def retrieve_kegg_genes(directory: Path, identifier: str):
                 except StopIteration:
                     break
 
+            cmod_storage.write_text(filename, "".join(texts))
+
 
 def parse_genes(
     directory: Path, identifier: str, genome: str
@@ -287,14 +289,15 @@ def parse_genes(
 
     filename = directory.joinpath(f"{identifier}_genes.txt")
     with suppress(FileNotFoundError):
-        with open(file=filename, mode="r") as file:
-            genes_list = parse_ko_to_genes(
-                string=str(file.read()), reaction=identifier, genome=genome
-            )
-            for gene in genes_list:
-                genes[gene] = ""
+        genes_list = parse_ko_to_genes(
+            string=cmod_storage.read_text(filename),
+            reaction=identifier,
+            genome=genome,
+        )
+        for gene in genes_list:
+            genes[gene] = ""
 
-            rule = " or ".join(genes.keys())
+        rule = " or ".join(genes.keys())
 
     if genes:
         rule = " or ".join(genes.keys())
@@ -0,0 +1,190 @@
+"""
+.. versionadded:: 1.3.1
+
+Identifiers that were not found in a database
+
+Identifiers for which a database answered with HTTP 404 are stored in the
+file "MissingIdentifiers.csv" of the data directory, together with the
+database, the BiGG model and the time of the query. Until the entry expires,
+the retrieval raises :exc:`requests.HTTPError` without querying the servers
+again, see :func:`cobramod.retrieval.retrieve_file`.
+
+Entries expire after the attribute `ttl` of :class:`MissingIdentifiers`,
+since databases add identifiers over time. The file is written under a lock,
+thus multiple processes can share the same data directory.
+"""
+
+import csv
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Optional, Union
+
+import requests
+from cobra.core.singleton import Singleton
+
+import cobramod.utils as cmod_utils
+from cobramod.debug import debug_log
+
+FILENAME = "MissingIdentifiers.csv"
+
+# Default time to live of the entries in seconds (one week)
+TTL = 7 * 24 * 60 * 60
+
+Key = tuple[str, str, str]
+
+
+def is_not_found(error: requests.HTTPError) -> bool:
+    """
+    Returns whether given error was caused by an answer with HTTP 404.
+    """
+    return error.response is not None and error.response.status_code == 404
+
+
+def read_misses(file: Path) -> dict[Key, float]:
+    """
+    Returns a dictionary with the database, model and identifier of each
+    entry of given file and the time of its query in seconds since the epoch.
+    If the file does not exist, the dictionary is empty.
+    """
+    misses: dict[Key, float] = {}
+
+    with suppress(FileNotFoundError), open(file, newline="") as f:
+        for row in csv.DictReader(f):
+            key = (row["database"], row["model_id"], row["identifier"])
+            misses[key] = float(row["time"])
+
+    return misses
+
+
+def write_misses(file: Path, misses: dict[Key, float]):
+    """
+    Writes the entries into given file. The file is replaced at once.
+    """
+    with cmod_utils.atomic_file(file) as temporary:
+        with open(temporary, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["database", "model_id", "identifier", "time"])
+            writer.writerows(key + (moment,) for key, moment in misses.items())
+
+
+class MissingIdentifiers(metaclass=Singleton):
+    """
+    Cache of the identifiers that were not found in a database.
+
+    Attributes:
+        ttl (float): Time in seconds after which an entry expires and the
+            identifier is queried again. A value of 0 disables the cache.
+            Defaults to one week.
+    """
+
+    def __init__(self):
+        self.ttl: float = TTL
+        self._misses: dict[Key, float] = {}
+        # Directory and modification time of the loaded file
+        self._loaded: Optional[tuple[Path, int]] = None
+
+    @staticmethod
+    def _key(
+        database: Optional[str], model_id: Optional[str], identifier: str
+    ) -> Key:
+        return (database or "", model_id or "", identifier)
+
+    def _load(self, directory: Path) -> dict[Key, float]:
+        """
+        Returns the entries of given directory. The file is only read again
+        if the directory or the file changes.
+        """
+        file = directory / FILENAME
+        try:
+            modified = file.stat().st_mtime_ns
+        except FileNotFoundError:
+            modified = 0
+
+        if self._loaded != (directory, modified):
+            self._misses = read_misses(file)
+            self._loaded = (directory, modified)
+
+        return self._misses
+
+    def is_missing(
+        self,
+        directory: Union[str, Path],
+        database: Optional[str],
+        model_id: Optional[str],
+        identifier: str,
+    ) -> bool:
+        """
+        Returns whether given identifier was not found in the database within
+        the time to live.
+
+        Args:
+            directory (Path): The folder used for storing data.
+            database (str, optional): Name of the database.
+            model_id (str, optional): BIGG-specific argument. Name of the
+                model.
+            identifier (str): Identifier of the object.
+        """
+        if self.ttl <= 0:
+            return False
+
+        misses = self._load(Path(directory).absolute())
+        moment = misses.get(self._key(database, model_id, identifier))
+
+        return moment is not None and time.time() - moment < self.ttl
+
+    def add(
+        self,
+        directory: Union[str, Path],
+        database: Optional[str],
+        model_id: Optional[str],
+        identifier: str,
+    ):
+        """
+        Stores that given identifier was not found in the database. The file
+        is read again under a lock, thus entries of other processes are kept.
+        Expired entries are removed.
+
+        Args:
+            directory (Path): The folder used for storing data.
+            database (str, optional): Name of the database.
+            model_id (str, optional): BIGG-specific argument. Name of the
+                model.
+            identifier (str): Identifier of the object.
+        """
+        if self.ttl <= 0:
+            return
+
+        directory = Path(directory).absolute()
+        file = directory / FILENAME
+        now = time.time()
+
+        with cmod_utils.file_lock(directory / f"{FILENAME}.lock"):
+            misses = {
+                key: moment
+                for key, moment in read_misses(file).items()
+                if now - moment < self.ttl
+            }
+            misses[self._key(database, model_id, identifier)] = now
+            write_misses(file, misses)
+
+        self._loaded = None
+        debug_log.debug(
+            'Identifier "%s" not found in "%s". It is not queried again for '
+            "%s seconds.",
+            identifier,
+            database,
+            self.ttl,
+        )
+
+    def clear(self, directory: Union[str, Path]):
+        """
+        Removes all entries of given directory, so that the identifiers are
+        queried again.
+        """
+        directory = Path(directory).absolute()
+
+        with cmod_utils.file_lock(directory / f"{FILENAME}.lock"):
+            (directory / FILENAME).unlink(missing_ok=True)
+
+        self._loaded = None
@@ -11,6 +11,8 @@ from typing import Any
 
 import requests
 
+import cobramod.storage as cmod_storage
+import cobramod.transport as cmod_transport
 from cobramod.debug import debug_log
 
 
@@ -30,8 +32,7 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
     # GENES directory will depend from the sub-database
     directory = directory.joinpath(database, "GENES")
 
-    if not directory.exists():
-        directory.mkdir()
+    directory.mkdir(exist_ok=True)
 
     # Retrieval of the Gene information
     filename = directory.joinpath(f"{identifier}_genes.xml")
@@ -45,7 +46,7 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
 
         return
 
-    if not filename.exists():
+    if not cmod_storage.exists(filename):
         # This URL will not necessarily raise exception
         encoded_id = urllib.parse.quote(identifier, safe="")
 
@@ -53,7 +54,7 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
             f"https://pmn.plantcyc.org/apixml?fn=genes-of-reaction&id="
             f"{database}:{encoded_id}&detail=full"
         )
-        response = requests.get(url_text)
+        response = cmod_transport.get(url_text)
         try:
             response.raise_for_status()
             root = et.fromstring(response.text)
@@ -64,7 +65,9 @@ def retrieve_gene_information(directory: Path, identifier: str, database: str):
             if not isinstance(element, et.Element):
                 raise AttributeError("No gene information available")
 
-            tree.write(str(filename))
+            cmod_storage.write_text(
+                filename, et.tostring(root, encoding="unicode")
+            )
             debug_log.info(
                 f'Object "{identifier}_gene.xml" saved in '
                 f'directory "{database}/GENES".'
@@ -0,0 +1,344 @@
+"""
+.. versionadded:: 1.3.1
+
+Instrumentation of CobraMod
+
+The stages of the extension are measured as spans, e.g. the retrieval and
+parsing of data, the creation of COBRApy objects, the non-zero flux test,
+the cross-references or the summary. Each span counts events such as HTTP
+requests, local cache hits, solver calls and created sinks.
+
+The instrumentation is disabled by default and then only costs a check of a
+global variable. It is enabled inside of :func:`profile`::
+
+    from cobramod.profiling import profile
+
+    with profile() as profiler:
+        add_pathway(model, pathway="PWY-1187", ...)
+
+    profiler.report()  # Times and counters for each call of add_pathway
+    profiler.to_json("profile.json")
+    profiler.spans()  # Spans in the format of OpenTelemetry
+
+Spans started in other threads without an open span, e.g. the workers of
+:func:`cobramod.retrieval.prefetch_data`, are stored as separate calls.
+"""
+
+import functools
+import inspect
+import json
+import secrets
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+# Events counted by CobraMod
+HTTP_REQUESTS = "http_requests"
+CACHE_HITS = "cache_hits"
+CACHE_MISSES = "cache_misses"
+SOLVER_CALLS = "solver_calls"
+SINKS = "sinks"
+
+_NULL_CONTEXT = nullcontext()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """
+    Stage of CobraMod with its time, attributes and counted events.
+
+    Attributes:
+        name (str): Name of the stage, e.g. "get_data".
+        attributes (dict): Arguments of the stage, e.g. the identifier.
+        parent (Span, optional): Span in which this span was started.
+        children (list): Spans started in this span.
+        counters (Counter): Events counted directly in this span.
+        start (int): Start in nanoseconds since the epoch.
+        end (int): End in nanoseconds since the epoch or 0 if it is open.
+        trace_id (str): Identifier shared by all spans of the same call.
+        span_id (str): Identifier of this span.
+    """
+
+    def __init__(self, name: str, attributes: dict, parent: Optional["Span"]):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.children: list[Span] = []
+        self.counters: Counter = Counter()
+        self.trace_id: str = (
+            parent.trace_id if parent else secrets.token_hex(16)
+        )
+        self.span_id: str = secrets.token_hex(8)
+        self.start = time.time_ns()
+        self.end = 0
+        self._clock = time.perf_counter_ns()
+        self._elapsed = 0
+
+    def __repr__(self) -> str:
+        return f"<Span {self.name} ({self.duration:.6f} s)>"
+
+    @property
+    def duration(self) -> float:
+        """
+        Duration in seconds. Open spans return the time until now.
+        """
+        elapsed = self._elapsed or time.perf_counter_ns() - self._clock
+        return elapsed / 1e9
+
+    def close(self):
+        self._elapsed = time.perf_counter_ns() - self._clock
+        self.end = self.start + self._elapsed
+
+    def walk(self) -> Iterator["Span"]:
+        """
+        Yields this span and all its descendants.
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def totals(self) -> Counter:
+        """
+        Returns the counted events of this span and its descendants.
+        """
+        total: Counter = Counter()
+        for span in self.walk():
+            total.update(span.counters)
+        return total
+
+
+class Profiler:
+    """
+    Collects the spans and counted events while it is active. See
+    :func:`profile`.
+
+    Attributes:
+        calls (list): Spans that were started without an open span, e.g. a
+            call of :func:`cobramod.add_pathway`.
+        counters (Counter): Events counted without an open span.
+    """
+
+    def __init__(self):
+        self.calls: list[Span] = []
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+        self._current: ContextVar[Optional[Span]] = ContextVar(
+            "span", default=None
+        )
+
+    def __repr__(self) -> str:
+        return f"<Profiler with {len(self.calls)} calls>"
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Context manager that measures the stage with given name. Spans can
+        be nested.
+        """
+        parent = self._current.get()
+        item = Span(name, attributes, parent)
+
+        with self._lock:
+            if parent is None:
+                self.calls.append(item)
+            else:
+                parent.children.append(item)
+
+        token = self._current.set(item)
+        try:
+            yield item
+        finally:
+            item.close()
+            self._current.reset(token)
+
+    def count(self, event: str, value: int = 1):
+        """
+        Adds given value to the counter of an event in the open span.
+        """
+        current = self._current.get()
+        counters = self.counters if current is None else current.counters
+
+        with self._lock:
+            counters[event] += value
+
+    def report(self) -> dict[str, Any]:
+        """
+        Returns the times and events for each call as a dictionary that can be
+        serialized as JSON. Each stage lists how often it was entered and its
+        total time in seconds, including nested stages. The counters include
+        the events of all stages of the call.
+        """
+        calls = []
+        for call in self.calls:
+            stages: dict[str, dict[str, Union[int, float]]] = {}
+
+            for span in call.walk():
+                stage = stages.setdefault(span.name, {"calls": 0, "time": 0.0})
+                stage["calls"] += 1
+                stage["time"] += span.duration
+
+            calls.append(
+                {
+                    "name": call.name,
+                    "attributes": call.attributes,
+                    "time": call.duration,
+                    "counters": dict(call.totals()),
+                    "stages": stages,
+                }
+            )
+        return {"calls": calls, "counters": dict(self.counters)}
+
+    def spans(self) -> list[dict[str, Any]]:
+        """
+        Returns all spans as dictionaries in the format of the JSON exporter
+        of OpenTelemetry. The counted events are stored as attributes with the
+        prefix "cobramod.".
+        """
+        spans = []
+        for call in self.calls:
+            for span in call.walk():
+                attributes = {
+                    key: value
+                    if isinstance(value, (str, bool, int, float))
+                    else str(value)
+                    for key, value in span.attributes.items()
+                }
+                for event, value in span.counters.items():
+                    attributes[f"cobramod.{event}"] = value
+
+                spans.append(
+                    {
+                        "name": span.name,
+                        "context": {
+                            "trace_id": f"0x{span.trace_id}",
+                            "span_id": f"0x{span.span_id}",
+                        },
+                        "parent_id": f"0x{span.parent.span_id}"
+                        if span.parent
+                        else None,
+                        "start_time": _timestamp(span.start),
+                        "end_time": _timestamp(span.end) if span.end else None,
+                        "attributes": attributes,
+                    }
+                )
+        return spans
+
+    def to_json(
+        self, path: Optional[Union[str, Path]] = None, spans: bool = False
+    ) -> str:
+        """
+        Returns the report as JSON and saves it in given file.
+
+        Args:
+            path (str or Path, optional): Location of the JSON file.
+            spans (bool): Whether to export the spans instead of the report.
+                See :meth:`spans`. Defaults to False.
+        """
+        text = json.dumps(
+            self.spans() if spans else self.report(), indent=2, default=str
+        )
+        if path is not None:
+            Path(path).write_text(text)
+        return text
+
+
+def _timestamp(nanoseconds: int) -> str:
+    moment = datetime.fromtimestamp(nanoseconds / 1e9, tz=timezone.utc)
+    return moment.isoformat()
+
+
+# Profiler of the open call of profile
+_profiler: Optional[Profiler] = None
+
+
+@contextmanager
+def profile() -> Iterator[Profiler]:
+    """
+    Context manager that enables the instrumentation and returns the
+    :class:`Profiler` with the results.
+    """
+    global _profiler
+
+    previous = _profiler
+    profiler = _profiler = Profiler()
+    try:
+        yield profiler
+    finally:
+        _profiler = previous
+        # Close spans of other threads that are still open
+        for call in profiler.calls:
+            for item in call.walk():
+                if not item.end:
+                    item.close()
+
+
+def span(name: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+    """
+    Returns a context manager that measures the stage with given name if the
+    instrumentation is enabled. Otherwise, it does nothing.
+    """
+    if _profiler is None:
+        return _NULL_CONTEXT
+    return _profiler.span(name, **attributes)
+
+
+def count(event: str, value: int = 1):
+    """
+    Counts an event in the open span if the instrumentation is enabled.
+    """
+    if _profiler is not None:
+        _profiler.count(event, value)
+
+
+def enabled() -> bool:
+    """
+    Returns whether the instrumentation is enabled.
+    """
+    return _profiler is not None
+
+
+def traced(name: str, *arguments: str) -> Callable[[F], F]:
+    """
+    Decorator that measures each call of a function as a span if the
+    instrumentation is enabled.
+
+    Args:
+        name (str): Name of the span.
+        arguments (str): Names of the arguments that are stored as attributes
+            of the span.
+    """
+
+    def decorator(function: F) -> F:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return function(*args, **kwargs)
+
+            bound = signature.bind_partial(*args, **kwargs).arguments
+            attributes = {
+                argument: bound[argument]
+                for argument in arguments
+                if argument in bound
+            }
+            with _profiler.span(name, **attributes):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
@@ -16,19 +16,26 @@ import json
 import urllib.parse
 import warnings
 import xml.etree.ElementTree as et
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from hashlib import sha256
 from pathlib import Path
-from typing import Any, Literal, Optional, Union
+from typing import Any, Iterable, Literal, Optional, Union
 
 import cobra.core as cobra_core
 import requests
 
+import cobramod.profiling as cmod_profiling
+import cobramod.storage as cmod_storage
+import cobramod.transport as cmod_transport
 import cobramod.utils as cmod_utils
 from cobramod.core import creation, genes
 from cobramod.debug import debug_log
 from cobramod.parsing import bigg, biocyc, kegg, plantcyc, solcyc
 from cobramod.parsing import db_version as cmod_db
+from cobramod.parsing import misses as cmod_misses
 
 db_configuration = cmod_db.DataVersionConfigurator()
+missing_identifiers = cmod_misses.MissingIdentifiers()
 
 BIOCYC = "https://websvc.biocyc.org/getxml?id="
 PMN = "https://pmn.plantcyc.org/getxml?id="
@@ -188,21 +195,21 @@ class Data:
         is_compound = data.get("formulae", data.get("formula", None))
         model_id = path.parent.name
 
-        if path.parents[1].joinpath("database_version").exists():
-            with open(path.parents[1].joinpath("database_version"), "r") as f:
-                version = json.load(f).get("bigg_models_version")
-        else:
-            info_response = requests.get(
+        try:
+            text = cmod_storage.read_text(
+                path.parents[1].joinpath("database_version")
+            )
+            version = json.loads(text).get("bigg_models_version")
+        except FileNotFoundError:
+            info_response = cmod_transport.get(
                 "http://bigg.ucsd.edu/api/v2/database_version"
             )
             info_response.raise_for_status()
 
-            with (
-                path.parents[1]
-                .joinpath("database_version")
-                .open(mode="w+") as f
-            ):
-                f.write(info_response.text)
+            cmod_storage.write_text(
+                path.parents[1].joinpath("database_version"),
+                info_response.text,
+            )
             version = info_response.json().get("bigg_models_version")
 
         if version is None:
@@ -233,15 +240,18 @@ class Data:
         entry_mode = data["ENTRY"][0].split()[-1]
         gene_path = path.parent.joinpath("GENES")
 
-        if path.parent.joinpath("database_version").exists():
-            with open(path.parent.joinpath("database_version"), "r") as f:
-                version = cmod_utils.kegg_info_to_version(f.read())
-        else:
-            info_response = requests.get("http://rest.kegg.jp/info/kegg")
+        try:
+            text = cmod_storage.read_text(
+                path.parent.joinpath("database_version")
+            )
+            version = cmod_utils.kegg_info_to_version(text)
+        except FileNotFoundError:
+            info_response = cmod_transport.get("http://rest.kegg.jp/info/kegg")
             info_response.raise_for_status()
 
-            with path.parent.joinpath("database_version").open(mode="w+") as f:
-                f.write(info_response.text)
+            cmod_storage.write_text(
+                path.parent.joinpath("database_version"), info_response.text
+            )
             version = cmod_utils.kegg_info_to_version(info_response.text)
 
         if version is None:
@@ -306,6 +316,7 @@ class Data:
             )
         return cls(entry, attributes, mode, database, path, "", version)
 
+    @cmod_profiling.traced("create_object", "entry")
     def parse(
         self,
         model: cobra_core.Model,
@@ -458,7 +469,7 @@ def get_response(
 
         return database, response
 
-    s = requests.Session()
+    s = cmod_transport.session()
     if biocyc_credentials:
         # FIXME: find a better way
         user, pwd = cmod_utils.get_credentials(
@@ -485,6 +496,7 @@ def get_response(
     return database, response
 
 
+@cmod_profiling.traced("parse_file", "identifier")
 def file_to_Data_class(
     identifier: str, filename: Path, genome: Optional[str]
 ) -> Data:
@@ -500,9 +512,7 @@ def file_to_Data_class(
     Returns:
         Data
     """
-    f = open(filename, "r")
-    text = f.read()
-    f.close()
+    text = cmod_storage.read_text(filename)
 
     suffix = filename.suffix
     parent = filename.parent.name
@@ -536,6 +546,11 @@ def write(name: str, directory: Path, response: requests.Response) -> Path:
     """
     Finds the content type and writes the data into disk and returns the Path
     of the new file
+
+    .. versionchanged:: 1.3.1
+        The file is replaced at once, so that other processes never read a
+        partial file. Directories with a pack store the file in the pack and
+        the text can be compressed, see :mod:`cobramod.storage`.
     """
 
     header = response.headers.get("Content-Type", "").lower()
@@ -553,9 +568,7 @@ def write(name: str, directory: Path, response: requests.Response) -> Path:
         raise AttributeError("Cannot parse given content type")
 
     filename = directory.joinpath(name + prefix)
-
-    with open(file=filename, mode="w+") as file:
-        file.write(response.text)
+    cmod_storage.write_text(filename, response.text)
 
     return filename
 
@@ -571,33 +584,170 @@ def get_files(directory: Path, identifier: str):
             yield item
 
 
-def get_data(
+def find_file(
     identifier: str,
-    directory: Union[str, Path],
+    directory: Path,
     database: Optional[str],
     model_id: Optional[str] = None,
-    genome: Optional[str] = None,
-) -> Data:
+) -> Optional[tuple[Path, str]]:
     """
-    Retrieves the Data for given identifier. This function either retrieves
-    from the server of the databases or locally.
+    Returns the location of the local file for given identifier and the name
+    of its database or None if the file was not retrieved yet. The directory
+    must include the family of the database, e.g. "PMN". The files are
+    searched with :mod:`cobramod.storage`, which also supports packs.
+
+    .. versionadded:: 1.3.1
+    """
+    names = [identifier + extension for extension in EXTENSIONS]
+
+    if not database:
+        filename = cmod_storage.search(directory, identifier)
+
+    elif model_id:
+        filename = cmod_storage.first(
+            directory.joinpath(database, model_id), names
+        )
+        if filename is not None:
+            return filename, "BIGG"
+
+    else:
+        filename = cmod_storage.first(directory.joinpath(database), names)
+
+    if filename is None:
+        return None
+
+    return filename, filename.parent.name.upper()
+
+
+def fetch_lock(
+    directory: Path,
+    identifier: str,
+    database: Optional[str],
+    model_id: Optional[str] = None,
+) -> Path:
+    """
+    Returns the lock file that processes hold while they retrieve given
+    identifier into the data directory. The identifiers are spread over
+    256 lock files in the folder ".locks".
+
+    .. versionadded:: 1.3.1
+    """
+    key = f"{database}:{model_id}:{identifier}".encode()
+    return directory.joinpath(
+        ".locks", f"fetch-{sha256(key).hexdigest()[:2]}.lock"
+    )
+
+
+def download_file(
+    identifier: str,
+    directory: Path,
+    database: Optional[str],
+    family: str = "",
+    model_id: Optional[str] = None,
+) -> tuple[Path, str]:
+    """
+    Retrieves the file for given identifier from the server of the database
+    and stores it in given directory. Returns the location of the file and the
+    name of the database that answered. The directory must include the family
+    of the database, e.g. "PMN".
+
+    .. versionadded:: 1.3.1
+    """
+    extra: Path
+
+    if not database:
+        response_database, response = get_response(identifier)
+
+        if response_database == "bigg":
+            extra = getattr(response, "extra")
+
+            if not extra:
+                raise AttributeError(
+                    "The 'extra' attribute was not found in the response"
+                )
+            directory = directory.joinpath(extra)
+
+        return write(identifier, directory, response), response_database
+
+    if family:
+        query = f"{family}:{database}:{identifier}"
+
+    else:
+        query = f"{database}:{identifier}"
+
+    response_database, response = get_response(query, model_id)
+
+    if database == "KEGG":
+        kegg.retrieve_kegg_genes(directory, identifier)
+
+    if database != "KEGG" and database != "BIGG":
+        if not family:
+            biocyc.retrieve_gene_information(directory, identifier, database)
+
+        elif family == "PMN":
+            plantcyc.retrieve_gene_information(directory, identifier, database)
+        # NOTE: Deprecation for 2.0.0
+        elif family == "SOL":
+            warnings.warn(
+                "Database Solcyc is being deprecated for next version",
+                DeprecationWarning,
+            )
+            solcyc.retrieve_gene_information(directory, identifier, database)
+
+    if response_database == "BIGG":
+        extra = getattr(response, "extra")
+
+        if not extra:
+            raise AttributeError(
+                "The 'extra' attribute was not found in the response"
+            )
+        directory = directory.joinpath("BIGG", extra)
+        directory.mkdir(exist_ok=True)
+
+    else:
+        directory = directory.joinpath(database)
+
+    return write(identifier, directory, response), response_database
+
+
+def retrieve_file(
+    identifier: str,
+    directory: Path,
+    database: Optional[str],
+    model_id: Optional[str] = None,
+) -> tuple[Path, str]:
+    """
+    Returns the location of the file for given identifier and the name of the
+    database that answered. The file is either found locally or retrieved from
+    the server of the database and stored in given directory. Unlike
+    :func:`get_data`, the file is not parsed and the version of the database is
+    not checked. Thus, this function can be called from multiple threads.
+
+    .. versionchanged:: 1.3.1
+        Processes that share the data directory retrieve each identifier
+        only once. The retrieval holds a lock, see :func:`fetch_lock`, and
+        the files are replaced at once, see :func:`write`. Identifiers that
+        were not found are not queried again until their entry expires, see
+        :class:`cobramod.parsing.misses.MissingIdentifiers`.
 
     Args:
         identifier (str): Name of the object to retrieve
-        dictionary (str or Path): Location of the files to retrieve or store
+        directory (Path): Location of the files to retrieve or store
         database (Optional[str]): Name of the database. Check
             cobramod.retrieval.available_databases for more information
         model_id (Optional[str]): BIGG-specific argument. Name of the model to
             retrieve information
-        genome: (Optional[str]): Name of the genome to retrieve
 
     Returns:
-        Data
-    """
-    if isinstance(directory, str):
-        directory = Path(directory).absolute()
+        tuple[Path, str]: Location of the file and name of the database
 
-    main_dir = directory
+    Raises:
+        HTTPError: If the identifier cannot be retrieved or it was not found
+            in the database before
+    """
+    lock = fetch_lock(directory, identifier, database, model_id)
+    data_directory = directory
+    query_database = database
 
     # Biocyc db families
     family = ""
@@ -607,110 +757,155 @@ def get_data(
 
         directory = directory.joinpath(family)
 
-    if not directory.exists():
-        directory.mkdir()
+    directory.mkdir(exist_ok=True)
+
+    # Create dir if needed
+    if database:
+        directory.joinpath(database).mkdir(exist_ok=True)
+
+        if model_id:
+            directory.joinpath(database, model_id).mkdir(exist_ok=True)
 
-    extra: Path
     # Try first locally and the query databases
-    if not database:
-        try:
-            filename = next(directory.rglob(identifier + "*"))
-            response_database = filename.parent.name.upper()
+    found = find_file(identifier, directory, database, model_id)
 
-        except StopIteration:
-            response_database, response = get_response(identifier)
+    if found is None:
+        if missing_identifiers.is_missing(
+            data_directory, query_database, model_id, identifier
+        ):
+            cmod_profiling.count(cmod_profiling.CACHE_HITS)
+            raise requests.HTTPError(
+                f'Identifier "{identifier}" was not found in database '
+                f'"{query_database}" before. It is queried again when the '
+                "entry expires."
+            )
 
-            if response_database == "bigg":
-                extra = getattr(response, "extra")
+        with cmod_utils.file_lock(lock):
+            # Another process could have retrieved the file in the meantime
+            found = find_file(identifier, directory, database, model_id)
 
-                if not extra:
-                    raise AttributeError(
-                        "The 'extra' attribute was not found in the response"
+            if found is None:
+                cmod_profiling.count(cmod_profiling.CACHE_MISSES)
+                try:
+                    found = download_file(
+                        identifier, directory, database, family, model_id
                     )
-                directory = directory.joinpath(extra)
-
-            filename = write(identifier, directory, response)
+                except requests.HTTPError as error:
+                    if cmod_misses.is_not_found(error):
+                        missing_identifiers.add(
+                            data_directory, query_database, model_id, identifier
+                        )
+                    raise
+            else:
+                cmod_profiling.count(cmod_profiling.CACHE_HITS)
     else:
-        # Create dir if needed
-        if not directory.joinpath(database).exists():
-            directory.joinpath(database).mkdir()
-
-        try:
-            if model_id:
-                if not directory.joinpath(database, model_id).exists():
-                    directory.joinpath(database, model_id).mkdir()
+        cmod_profiling.count(cmod_profiling.CACHE_HITS)
 
-                filename = next(
-                    get_files(
-                        directory.joinpath(database, model_id), identifier
-                    )
-                )
-                response_database = "BIGG"
+    filename, response_database = found
 
-            else:
-                filename = next(
-                    get_files(directory.joinpath(database), identifier)
-                )
-                response_database = filename.parent.name.upper()
+    if family:
+        response_database = f"{family}:{database}"
 
-        except StopIteration:
-            if family:
-                query = f"{family}:{database}:{identifier}"
+    return filename, response_database
 
-            else:
-                query = f"{database}:{identifier}"
 
-            response_database, response = get_response(query, model_id)
+@cmod_profiling.traced("get_data", "identifier", "database")
+def get_data(
+    identifier: str,
+    directory: Union[str, Path],
+    database: Optional[str],
+    model_id: Optional[str] = None,
+    genome: Optional[str] = None,
+) -> Data:
+    """
+    Retrieves the Data for given identifier. This function either retrieves
+    from the server of the databases or locally. The local file is retrieved
+    again if its version differs and the mismatch policy is "refetch", see
+    :class:`cobramod.parsing.db_version.DataVersionConfigurator`.
 
-            if database == "KEGG":
-                kegg.retrieve_kegg_genes(directory, identifier)
+    Args:
+        identifier (str): Name of the object to retrieve
+        dictionary (str or Path): Location of the files to retrieve or store
+        database (Optional[str]): Name of the database. Check
+            cobramod.retrieval.available_databases for more information
+        model_id (Optional[str]): BIGG-specific argument. Name of the model to
+            retrieve information
+        genome: (Optional[str]): Name of the genome to retrieve
 
-            if database != "KEGG" and database != "BIGG":
-                if not family:
-                    biocyc.retrieve_gene_information(
-                        directory, identifier, database
-                    )
+    Returns:
+        Data
+    """
+    if isinstance(directory, str):
+        directory = Path(directory).absolute()
 
-                elif family == "PMN":
-                    plantcyc.retrieve_gene_information(
-                        directory, identifier, database
-                    )
-                # NOTE: Deprecation for 2.0.0
-                elif family == "SOL":
-                    warnings.warn(
-                        "Database Solcyc is being deprecated for next version",
-                        DeprecationWarning,
-                    )
-                    solcyc.retrieve_gene_information(
-                        directory, identifier, database
-                    )
+    filename, response_database = retrieve_file(
+        identifier, directory, database, model_id
+    )
+    data = file_to_Data_class(identifier, filename, genome)
 
-            if response_database == "BIGG":
-                extra = getattr(response, "extra")
+    if not db_configuration.check_database_version(
+        directory, response_database, data.version
+    ):
+        debug_log.info(
+            'Object "%s" is retrieved again because of a different version.',
+            identifier,
+        )
+        cmod_storage.unlink(filename)
+        filename, response_database = retrieve_file(
+            identifier, directory, database, model_id
+        )
+        data = file_to_Data_class(identifier, filename, genome)
+        db_configuration.set_database_version(
+            directory, response_database, data.version, overwrite=True
+        )
 
-                if not extra:
-                    raise AttributeError(
-                        "The 'extra' attribute was not found in the response"
-                    )
-                directory = directory.joinpath("BIGG", extra)
+    return data
 
-                if not directory.exists():
-                    directory.mkdir()
 
-            else:
-                directory = directory.joinpath(database)
+def prefetch_data(
+    identifiers: Iterable[str],
+    directory: Path,
+    database: Optional[str],
+    model_id: Optional[str] = None,
+    max_workers: int = 8,
+) -> dict[str, Path]:
+    """
+    Retrieves the files for given identifiers concurrently and returns a
+    dictionary with the identifiers and the location of their files.
+    Identifiers that cannot be retrieved are skipped, since the functions that
+    build the objects handle them afterwards.
 
-            filename = write(identifier, directory, response)
+    Args:
+        identifiers (Iterable[str]): Names of the objects to retrieve
+        directory (Path): Location of the files to retrieve or store
+        database (Optional[str]): Name of the database. Check
+            cobramod.retrieval.available_databases for more information
+        model_id (Optional[str]): BIGG-specific argument. Name of the model to
+            retrieve information
+        max_workers (int): Number of concurrent retrievals. Defaults to 8
 
-    data = file_to_Data_class(identifier, filename, genome)
+    Returns:
+        dict[str, Path]: Identifiers and the location of their files
+    """
+    files: dict[str, Path] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                retrieve_file, identifier, directory, database, model_id
+            ): identifier
+            for identifier in set(identifiers)
+        }
+        for future in as_completed(futures):
+            identifier = futures[future]
+            try:
+                files[identifier] = future.result()[0]
 
-    if family:
-        response_database = f"{family}:{database}"
+            except Exception as error:
+                debug_log.debug(
+                    'Object "%s" could not be prefetched: %r', identifier, error
+                )
 
-    db_configuration.check_database_version(
-        main_dir, response_database, data.version
-    )
-    return data
+    return files
 
 
 def build_reaction_from_str(
@@ -794,7 +989,7 @@ def build_reaction_from_str(
             metabolite = cobra_core.Metabolite(
                 identifier, name=identifier, compartment=compartment
             )
-            debug_log.debug(f"Curated Metabolite '{metabolite.id}' created")
+            debug_log.debug("Curated Metabolite '%s' created", metabolite.id)
 
         # NOTE: add logs
         if not isinstance(metabolite, cobra_core.Metabolite):
@@ -802,5 +997,5 @@ def build_reaction_from_str(
 
         reaction.add_metabolites({metabolite: coefficient})
         debug_log.debug(
-            f"Metabolite '{metabolite.id}' added to reaction '{reaction.id}'"
+            "Metabolite '%s' added to reaction '%s'", metabolite.id, reaction.id
         )
@@ -0,0 +1,602 @@
+"""
+.. versionadded:: 1.3.1
+
+Storage of the data directory
+
+By default, CobraMod stores each retrieved object as a small file in the data
+directory, e.g. "META/WATER.xml", "KEGG/GENES/R00001_genes.txt" or
+"BIGG/e_coli_core/accoa_c.json". On network file systems, each access to
+these files is slow. Alternatively, the files can be stored in a single
+SQLite database, the pack "DataPack.sqlite" in the data directory.
+
+If the pack exists, all files of the directory and its subdirectories are read
+from and written into the pack. The rest of CobraMod still works with the
+paths of the files, which are the keys of the pack. Other files of the data
+directory, e.g. the versions of the databases or the cross-references, are
+not stored in the pack.
+
+The pack is created from an existing directory and converted back with::
+
+    python -m cobramod.storage import <directory>
+    python -m cobramod.storage export <directory>
+
+or with :func:`import_directory` and :func:`export_directory`. Each folder is
+checked once per process for a pack. Thus, the conversion should not be done
+while CobraMod is running on the same directory in other processes.
+
+New files can be compressed with gzip, see :func:`configure_storage`.
+Compressed files get the suffix ".gz", e.g. "META/WATER.xml.gz", while
+CobraMod still uses the path without it. Compressed content in the pack is
+recognized by its first bytes. Uncompressed and compressed files are both
+read, so existing directories keep working. Existing files are compressed
+with::
+
+    python -m cobramod.storage compress <directory>
+"""
+
+import argparse
+import gzip
+import os
+import sqlite3
+import threading
+from contextlib import suppress
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+import cobramod.utils as cmod_utils
+from cobramod.debug import debug_log
+
+PACK = "DataPack.sqlite"
+
+# Suffixes of the files that are stored in the pack. The versions of KEGG and
+# BiGG are stored in files called "database_version"
+SUFFIXES = (".xml", ".txt", ".json")
+VERSION_FILE = "database_version"
+
+# Seconds that a process waits for other processes that write into the pack
+TIMEOUT = 60
+
+# Compressed files have this suffix after their own, e.g. "WATER.xml.gz"
+GZIP_SUFFIX = ".gz"
+GZIP_MAGIC = b"\x1f\x8b"
+COMPRESSLEVEL = 6
+
+
+class Pack:
+    """
+    SQLite database with the files of a data directory. The paths of the
+    files relative to the data directory are the keys of the table "files".
+    The pack can be used from multiple threads and processes.
+
+    Attributes:
+        path (Path): Location of the SQLite database.
+        root (Path): Data directory of the pack.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).absolute()
+        self.root = self.path.parent
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid = 0
+
+    def __repr__(self) -> str:
+        return f"<Pack in {self.path}>"
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns the connection to the database. Forked processes open a new
+        connection.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path,
+                timeout=TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS files "
+                "(path TEXT PRIMARY KEY, content BLOB NOT NULL)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def key(self, path: Path) -> str:
+        """
+        Returns the key of given path in the pack.
+        """
+        return path.absolute().relative_to(self.root).as_posix()
+
+    def read(self, path: Path) -> bytes:
+        """
+        Returns the content of the file with given path.
+
+        Raises:
+            FileNotFoundError: If the file is not stored in the pack.
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT content FROM files WHERE path = ?",
+                    (self.key(path),),
+                )
+                .fetchone()
+            )
+        if row is None:
+            raise FileNotFoundError(f'File "{path}" is not stored in {self}')
+        return row[0]
+
+    def write(self, path: Path, content: bytes):
+        """
+        Stores the content of the file with given path. A stored file is
+        replaced.
+        """
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO files (path, content) VALUES (?, ?)",
+                (self.key(path), content),
+            )
+
+    def delete(self, path: Path):
+        """
+        Removes the file with given path from the pack.
+
+        Raises:
+            FileNotFoundError: If the file is not stored in the pack.
+        """
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM files WHERE path = ?", (self.key(path),)
+            )
+        if cursor.rowcount == 0:
+            raise FileNotFoundError(f'File "{path}" is not stored in {self}')
+
+    def first(self, paths: Sequence[Path]) -> Optional[Path]:
+        """
+        Returns the first of given paths that is stored in the pack or None.
+        """
+        keys = [self.key(path) for path in paths]
+        with self._lock:
+            found = {
+                row[0]
+                for row in self._connect().execute(
+                    "SELECT path FROM files WHERE path IN "
+                    f"({', '.join('?' * len(keys))})",
+                    keys,
+                )
+            }
+        return next(
+            (path for path, key in zip(paths, keys) if key in found), None
+        )
+
+    def search(self, directory: Path, prefix: str) -> Optional[Path]:
+        """
+        Returns the first file in given directory or its subdirectories whose
+        name starts with given prefix or None.
+        """
+        pattern = self.key(directory.joinpath("*"))
+
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT path FROM files WHERE path GLOB ? ORDER BY path",
+                (pattern,),
+            )
+            names = [row[0] for row in rows]
+
+        for name in names:
+            if name.rsplit("/", 1)[-1].startswith(prefix):
+                return self.root.joinpath(name)
+        return None
+
+    def items(self) -> Iterator[tuple[Path, bytes]]:
+        """
+        Yields the paths and contents of all stored files.
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT path, content FROM files ORDER BY path"
+            )
+            stored = rows.fetchall()
+
+        for key, content in stored:
+            yield self.root.joinpath(key), content
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Folders that were already checked and their pack
+_packs: dict[Path, Optional[Pack]] = {}
+_packs_lock = threading.Lock()
+
+
+# Whether new files are compressed, see configure_storage
+_compression = False
+
+
+def configure_storage(compression: bool = False):
+    """
+    Sets how new files of the data directory are stored. Existing files are
+    read in either format.
+
+    Args:
+        compression (bool): Whether to compress new files with gzip. Files
+            get the additional suffix ".gz" and the content in packs is
+            compressed. Defaults to False.
+    """
+    global _compression
+
+    _compression = compression
+    debug_log.debug("Compression of the data directory set to %s.", compression)
+
+
+def find_pack(path: Path) -> Optional[Pack]:
+    """
+    Returns the pack that stores the file with given path or None if the file
+    is stored in the file system. Each folder is only checked once.
+    """
+    directory = path.absolute().parent
+
+    with _packs_lock:
+        visited = []
+        pack: Optional[Pack] = None
+
+        for folder in (directory, *directory.parents):
+            if folder in _packs:
+                pack = _packs[folder]
+                break
+
+            visited.append(folder)
+            if folder.joinpath(PACK).is_file():
+                pack = Pack(folder.joinpath(PACK))
+                break
+
+        for folder in visited:
+            _packs[folder] = pack
+
+    return pack
+
+
+def clear_packs():
+    """
+    Closes the packs and forgets the checked folders, so that a new or
+    removed pack is found.
+    """
+    with _packs_lock:
+        for pack in set(_packs.values()):
+            if pack is not None:
+                pack.close()
+        _packs.clear()
+
+
+def _compressed(path: Path) -> Path:
+    """
+    Returns the location of the compressed file for given path.
+    """
+    return path.with_name(path.name + GZIP_SUFFIX)
+
+
+def _logical(path: Path) -> Path:
+    """
+    Returns the path that CobraMod uses for given file, i.e. without the
+    suffix of compressed files.
+    """
+    if path.suffix == GZIP_SUFFIX:
+        return path.with_suffix("")
+    return path
+
+
+def _candidates(path: Path) -> tuple[Path, Path]:
+    """
+    Returns the uncompressed and compressed location of given file. The
+    format of the current configuration comes first.
+    """
+    if _compression:
+        return _compressed(path), path
+    return path, _compressed(path)
+
+
+def compress(text: str) -> bytes:
+    """
+    Returns given text compressed with gzip. The output does not depend on
+    the time, so that the same text always gives the same content.
+    """
+    return gzip.compress(text.encode(), compresslevel=COMPRESSLEVEL, mtime=0)
+
+
+def decode(content: bytes) -> str:
+    """
+    Returns the text of given content of the pack. Compressed content is
+    recognized by the magic number of gzip.
+    """
+    if content[:2] == GZIP_MAGIC:
+        content = gzip.decompress(content)
+    return content.decode()
+
+
+def read_text(path: Path) -> str:
+    """
+    Returns the text of given file of the data directory. Compressed files
+    are decompressed.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    pack = find_pack(path)
+    if pack is not None:
+        return decode(pack.read(path))
+
+    for candidate in _candidates(path):
+        with suppress(FileNotFoundError):
+            if candidate.suffix == GZIP_SUFFIX:
+                with gzip.open(candidate, "rt", encoding="utf-8") as f:
+                    return f.read()
+            return candidate.read_text()
+
+    raise FileNotFoundError(f'File "{path}" does not exist')
+
+
+def write_text(path: Path, text: str):
+    """
+    Writes given text into a file of the data directory. Files are replaced
+    at once, see :func:`cobramod.utils.atomic_file`. The text is compressed
+    if enabled with :func:`configure_storage`.
+    """
+    pack = find_pack(path)
+    if pack is not None:
+        pack.write(path, compress(text) if _compression else text.encode())
+
+    elif _compression:
+        with cmod_utils.atomic_file(_compressed(path)) as temporary:
+            temporary.write_bytes(compress(text))
+
+    else:
+        cmod_utils.write_text(path, text)
+
+
+def exists(path: Path) -> bool:
+    """
+    Returns whether given file of the data directory exists.
+    """
+    pack = find_pack(path)
+    if pack is None:
+        return any(candidate.exists() for candidate in _candidates(path))
+    return pack.first([path]) is not None
+
+
+def unlink(path: Path):
+    """
+    Removes given file of the data directory, both compressed and
+    uncompressed.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    pack = find_pack(path)
+    if pack is not None:
+        pack.delete(path)
+        return
+
+    removed = False
+    for candidate in _candidates(path):
+        with suppress(FileNotFoundError):
+            candidate.unlink()
+            removed = True
+
+    if not removed:
+        raise FileNotFoundError(f'File "{path}" does not exist')
+
+
+def first(directory: Path, names: Sequence[str]) -> Optional[Path]:
+    """
+    Returns the path of the first of given file names that exists in the
+    directory or None.
+    """
+    paths = [directory.joinpath(name) for name in names]
+    pack = find_pack(paths[0])
+
+    if pack is not None:
+        return pack.first(paths)
+
+    for path in paths:
+        if any(candidate.is_file() for candidate in _candidates(path)):
+            return path
+    return None
+
+
+def search(directory: Path, prefix: str) -> Optional[Path]:
+    """
+    Returns a file in given directory or its subdirectories whose name starts
+    with given prefix or None.
+    """
+    pack = find_pack(directory.joinpath(prefix))
+
+    if pack is not None:
+        return pack.search(directory, prefix)
+
+    found = next(directory.rglob(prefix + "*"), None)
+    return None if found is None else _logical(found)
+
+
+def is_stored(path: Path) -> bool:
+    """
+    Returns whether given file of the data directory belongs in the pack.
+    Hidden files and folders are not stored.
+    """
+    if any(part.startswith(".") for part in path.parts):
+        return False
+
+    path = _logical(path)
+    return path.suffix in SUFFIXES or path.name == VERSION_FILE
+
+
+def _stored_files(directory: Path) -> list[Path]:
+    """
+    Returns the files of given data directory that belong in the pack.
+    """
+    return [
+        path
+        for path in sorted(directory.rglob("*"))
+        if path.is_file() and is_stored(path.relative_to(directory))
+    ]
+
+
+def import_directory(
+    directory: Union[str, Path], remove_files: bool = False
+) -> int:
+    """
+    Stores the files of given data directory in its pack, which is created if
+    needed. Afterwards, CobraMod uses the pack for this directory. Returns
+    the number of stored files. Compressed files are stored as they are.
+
+    Args:
+        directory (str or Path): Location of the data directory.
+        remove_files (bool): Whether to remove the stored files. Defaults to
+            False.
+    """
+    directory = Path(directory).absolute()
+    pack = Pack(directory.joinpath(PACK))
+    files = _stored_files(directory)
+
+    connection = pack._connect()
+    with connection:
+        connection.execute("BEGIN")
+        connection.executemany(
+            "INSERT OR REPLACE INTO files (path, content) VALUES (?, ?)",
+            ((pack.key(_logical(path)), path.read_bytes()) for path in files),
+        )
+    pack.close()
+
+    if remove_files:
+        for path in files:
+            path.unlink()
+
+    clear_packs()
+    debug_log.info(
+        'Imported %s files into the pack of "%s".', len(files), directory
+    )
+    return len(files)
+
+
+def export_directory(
+    directory: Union[str, Path], remove_pack: bool = False
+) -> int:
+    """
+    Writes the files of the pack in given data directory back into the file
+    system. Returns the number of written files. Compressed content is
+    written into compressed files.
+
+    Args:
+        directory (str or Path): Location of the data directory.
+        remove_pack (bool): Whether to remove the pack afterwards, so that
+            CobraMod uses the files again. Defaults to False.
+
+    Raises:
+        FileNotFoundError: If the directory does not have a pack.
+    """
+    directory = Path(directory).absolute()
+    path = directory.joinpath(PACK)
+
+    if not path.is_file():
+        raise FileNotFoundError(f'Directory "{directory}" does not have a pack')
+
+    pack = Pack(path)
+    number = 0
+
+    for filename, content in pack.items():
+        if content[:2] == GZIP_MAGIC:
+            filename = _compressed(filename)
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        with cmod_utils.atomic_file(filename) as temporary:
+            temporary.write_bytes(content)
+        number += 1
+
+    pack.close()
+
+    if remove_pack:
+        path.unlink()
+
+    clear_packs()
+    debug_log.info(
+        'Exported %s files from the pack of "%s".', number, directory
+    )
+    return number
+
+
+def compress_directory(directory: Union[str, Path]) -> int:
+    """
+    Compresses the uncompressed files of given data directory or of its pack.
+    Returns the number of compressed files.
+
+    Args:
+        directory (str or Path): Location of the data directory.
+    """
+    directory = Path(directory).absolute()
+    path = directory.joinpath(PACK)
+    number = 0
+
+    if path.is_file():
+        pack = Pack(path)
+        for filename, content in pack.items():
+            if content[:2] != GZIP_MAGIC:
+                pack.write(filename, compress(content.decode()))
+                number += 1
+        pack.close()
+
+    else:
+        for filename in _stored_files(directory):
+            if filename.suffix == GZIP_SUFFIX:
+                continue
+
+            with cmod_utils.atomic_file(_compressed(filename)) as temporary:
+                temporary.write_bytes(compress(filename.read_text()))
+            filename.unlink()
+            number += 1
+
+    clear_packs()
+    debug_log.info('Compressed %s files of "%s".', number, directory)
+    return number
+
+
+def main(arguments: Optional[Sequence[str]] = None):
+    """
+    Converts a data directory from the command line. See the description of
+    the module.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m cobramod.storage",
+        description="Converts a data directory of CobraMod into a pack and "
+        "back or compresses its files.",
+    )
+    parser.add_argument("command", choices=("import", "export", "compress"))
+    parser.add_argument("directory", type=Path)
+    parser.add_argument(
+        "--remove",
+        action="store_true",
+        help="remove the files after the import or the pack after the export",
+    )
+    args = parser.parse_args(arguments)
+
+    if args.command == "import":
+        number = import_directory(args.directory, remove_files=args.remove)
+    elif args.command == "export":
+        number = export_directory(args.directory, remove_pack=args.remove)
+    else:
+        number = compress_directory(args.directory)
+
+    print(f"{args.command.capitalize()}ed {number} files.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+.. versionadded:: 1.3.1
+
+Transport of the requests to the databases
+
+All requests of CobraMod are sent with a session of this module, see
+:func:`session`. The transport can be configured with
+:func:`configure_transport` in one of the following modes:
+
+- "live": Requests are sent to the servers. This is the default.
+- "record": Requests are sent to the servers and the responses are stored in
+  an archive.
+- "replay": Responses are only served from an archive. Requests that were
+  not recorded raise :exc:`cobramod.error.NotRecordedError`, which is a
+  :exc:`requests.ConnectionError`.
+
+The archive is a single ZIP file. The content of each response is stored
+once under its SHA-256 hash in "objects/". Each request is stored as a small
+JSON file in "requests/", which is named after the hash of the method, the URL
+and the body of the request. The login to BioCyc is stored without its body
+and response, so that the credentials are neither archived nor needed for a
+replay. Cookies and other headers are not stored.
+
+For example, an archive can be recorded on a computer with internet
+access and then used on a computer without it::
+
+    from cobramod.transport import configure_transport
+
+    configure_transport("record", "responses.zip")
+    # ... retrieve the data
+
+    configure_transport("replay", "responses.zip")
+    # ... the same calls work offline
+"""
+
+import json
+import threading
+import zipfile
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import cobramod.error as cmod_error
+import cobramod.profiling as cmod_profiling
+import cobramod.utils as cmod_utils
+from cobramod.debug import debug_log
+
+MODES = ("live", "record", "replay")
+
+# The bodies of these requests and their responses are not stored, e.g. the
+# credentials
+PRIVATE_PATHS = ("/credentials/login/",)
+
+# Headers of the responses that are stored in the archive
+STORED_HEADERS = ("Content-Type",)
+
+
+class Archive:
+    """
+    Content-addressed archive of responses stored as a ZIP file. Multiple
+    processes can record into the same archive.
+
+    Attributes:
+        path (Path): Location of the ZIP file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path (str or Path): Location of the ZIP file. It is created with
+                the first record.
+        """
+        self.path = Path(path).absolute()
+        self._lock = threading.Lock()
+        self._reader: Optional[zipfile.ZipFile] = None
+
+    def __repr__(self) -> str:
+        return f"<Archive in {self.path}>"
+
+    @staticmethod
+    def is_private(request: requests.PreparedRequest) -> bool:
+        """
+        Returns whether the body of given request and its response must not
+        be stored.
+        """
+        return str(request.url).split("?")[0].endswith(PRIVATE_PATHS)
+
+    @classmethod
+    def key(cls, request: requests.PreparedRequest) -> str:
+        """
+        Returns the hash that identifies given request in the archive.
+        """
+        url = str(request.url)
+        body: Any = request.body or b""
+
+        if isinstance(body, str):
+            body = body.encode()
+
+        if cls.is_private(request):
+            body = b""
+
+        text = f"{request.method} {url}\n".encode() + body
+        return sha256(text).hexdigest()
+
+    def _open(self) -> Optional[zipfile.ZipFile]:
+        """
+        Returns the archive opened for reading or None if it does not exist.
+        """
+        if self._reader is None and self.path.exists():
+            self._reader = zipfile.ZipFile(self.path, mode="r")
+        return self._reader
+
+    def get(self, key: str) -> Optional[tuple[dict[str, Any], bytes]]:
+        """
+        Returns the stored record and the content of the response for given
+        key or None if the request was not recorded.
+        """
+        with self._lock:
+            archive = self._open()
+            if archive is None:
+                return None
+            try:
+                record = json.loads(archive.read(f"requests/{key}.json"))
+            except KeyError:
+                return None
+            content = archive.read(f"objects/{record['content']}")
+        return record, content
+
+    def put(self, key: str, record: dict[str, Any], content: bytes):
+        """
+        Stores the record and the content of a response under given key. A
+        request that was already recorded is not replaced.
+        """
+        digest = sha256(content).hexdigest()
+        record = {**record, "content": digest}
+
+        lock_file = self.path.with_name(f"{self.path.name}.lock")
+        with self._lock, cmod_utils.file_lock(lock_file):
+            self.close()
+            with zipfile.ZipFile(
+                self.path, mode="a", compression=zipfile.ZIP_DEFLATED
+            ) as archive:
+                names = set(archive.namelist())
+
+                if f"requests/{key}.json" in names:
+                    return
+
+                if f"objects/{digest}" not in names:
+                    archive.writestr(f"objects/{digest}", content)
+
+                archive.writestr(f"requests/{key}.json", json.dumps(record))
+
+        debug_log.debug('Response from "%s" recorded.', record["url"])
+
+    def close(self):
+        """
+        Closes the archive if it was opened for reading.
+        """
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+
+class ArchiveAdapter(HTTPAdapter):
+    """
+    Transport adapter for requests that records the responses into an
+    archive or replays them from it.
+
+    Attributes:
+        archive (Archive): Archive with the responses.
+        mode (str): Either "record" or "replay".
+    """
+
+    def __init__(self, archive: Archive, mode: str):
+        super().__init__()
+        self.archive = archive
+        self.mode = mode
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream=False,
+        timeout=None,
+        verify=True,
+        cert=None,
+        proxies=None,
+    ) -> requests.Response:
+        key = self.archive.key(request)
+
+        if self.mode == "replay":
+            stored = self.archive.get(key)
+            if stored is None:
+                raise cmod_error.NotRecordedError(request)
+            return self._build(request, *stored)
+
+        response = super().send(
+            request,
+            stream=False,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+        record = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: response.headers[name]
+                for name in STORED_HEADERS
+                if name in response.headers
+            },
+        }
+        content = b"" if self.archive.is_private(request) else response.content
+        self.archive.put(key, record, content)
+        return response
+
+    @staticmethod
+    def _build(
+        request: requests.PreparedRequest,
+        record: dict[str, Any],
+        content: bytes,
+    ) -> requests.Response:
+        """
+        Returns the response for given request from a stored record.
+        """
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.reason = record["reason"]
+        response.headers = CaseInsensitiveDict(record["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(request.url)
+        response.request = request
+        response._content = content
+        return response
+
+
+# Mode and archive of the last call of configure_transport
+_mode = "live"
+_archive: Optional[Archive] = None
+
+
+def configure_transport(
+    mode: str = "live", archive: Optional[Union[str, Path]] = None
+):
+    """
+    Sets how CobraMod sends its requests. The configuration applies to all
+    sessions created afterwards.
+
+    Args:
+        mode (str): Either "live", "record" or "replay". Defaults to "live".
+        archive (str or Path, optional): Location of the ZIP file with the
+            responses. Required for the modes "record" and "replay".
+
+    Raises:
+        ValueError: If the mode is unknown or the archive is missing.
+        FileNotFoundError: If the archive to replay does not exist.
+    """
+    global _mode, _archive
+
+    if mode not in MODES:
+        raise ValueError(f'Mode "{mode}" is not one of {MODES}')
+
+    if mode != "live" and archive is None:
+        raise ValueError(f'Mode "{mode}" requires an archive')
+
+    if mode == "replay" and not Path(archive).exists():  # type: ignore
+        raise FileNotFoundError(f'Archive "{archive}" does not exist')
+
+    if _archive is not None:
+        _archive.close()
+
+    _mode = mode
+    _archive = Archive(archive) if archive is not None else None
+    debug_log.debug('Transport set to "%s" with archive "%s".', mode, archive)
+
+
+def _count_response(response: requests.Response, *args, **kwargs):
+    cmod_profiling.count(cmod_profiling.HTTP_REQUESTS)
+
+
+def session() -> requests.Session:
+    """
+    Returns a new session that uses the configured transport.
+    """
+    new = requests.Session()
+
+    if cmod_profiling.enabled():
+        new.hooks["response"].append(_count_response)
+
+    if _mode != "live" and _archive is not None:
+        adapter = ArchiveAdapter(_archive, _mode)
+        new.mount("http://", adapter)
+        new.mount("https://", adapter)
+
+    return new
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    Sends a GET request with the configured transport. The arguments are
+    the same as :func:`requests.get`.
+    """
+    with session() as current:
+        return current.get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """
+    Sends a POST request with the configured transport. The arguments are
+    the same as :func:`requests.post`.
+    """
+    with session() as current:
+        return current.post(url, **kwargs)
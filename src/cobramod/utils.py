@@ -5,17 +5,36 @@ to any module. In other words, these functions are general functions. An
 example:
 
  - check_imbalance: Check for unbalanced reactions.
+ - check_imbalances: Check the balance of multiple reactions at once.
+ - read_chunks: Read a file in chunks of lines that can be resumed.
+ - file_lock: Lock a file that is shared between processes.
+ - atomic_file: Replace a file at once after it was written.
 """
 
 import io
+import json
+import os
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from re import match
 from typing import Any, Generator, Iterable, Iterator, Optional, TextIO
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
 import cobra.core as cobra_core
+import numpy as np
 from cobra import DictList, Reaction
+from cobra.core.formula import element_re
 
 import cobramod.error as cmod_error
+import cobramod.profiling as cmod_profiling
 from cobramod.debug import debug_log
 
 ARROWS: dict[str, tuple[int, int]] = {
@@ -83,6 +102,10 @@ def check_imbalance(
     Raises:
         UnbalancedReaction: if given reaction is unbalanced.
     """
+    # Nothing would be done with the result
+    if not stop_imbalance and not show_imbalance:
+        return
+
     dict_balance = reaction.check_mass_balance()
 
     # Will stop if True
@@ -99,6 +122,168 @@ def check_imbalance(
             debug_log.warning(msg)
 
 
+@lru_cache(maxsize=None)
+def parse_formula(formula: Optional[str]) -> Optional[dict[str, float]]:
+    """
+    Returns the element counts of given chemical formula. The parsing follows
+    :attr:`cobra.Metabolite.elements`, but each distinct formula is only parsed
+    once. None is returned if the formula cannot be parsed.
+    """
+    if formula is None:
+        return {}
+
+    formula = str(formula).replace("*", "")
+    if "(" in formula or ")" in formula:
+        return None
+
+    composition: dict[str, float] = {}
+    for element, count in element_re.findall(formula):
+        try:
+            amount = float(count) if count else 1.0
+        except ValueError:
+            return None
+        composition[element] = composition.get(element, 0.0) + amount
+
+    return composition
+
+
+def _add_composition(
+    metabolite: cobra_core.Metabolite,
+    elements: dict[str, int],
+    compositions: list[dict[str, float]],
+) -> Optional[int]:
+    """
+    Appends the elements and the charge of given metabolite to the
+    compositions and returns its position. New elements get the next column.
+    None is returned if the formula cannot be parsed.
+    """
+    composition = parse_formula(metabolite.formula)
+    if composition is None:
+        return None
+
+    composition = composition.copy()
+    if metabolite.charge is not None:
+        composition["charge"] = metabolite.charge
+
+    for element in composition:
+        elements.setdefault(element, len(elements))
+
+    compositions.append(composition)
+    return len(compositions) - 1
+
+
+def check_imbalances(
+    reactions: Iterable[Reaction], stop_imbalance: bool, show_imbalance: bool
+) -> dict[str, dict[str, float]]:
+    """
+    Verifies the mass and charge balance of all given reactions at once. Each
+    distinct formula is parsed into an element vector and the stoichiometry of
+    the reactions is accumulated as sparse (metabolite, reaction, coefficient)
+    entries. The balance of all reactions is then obtained with a single
+    product of both. All unbalanced reactions are reported together.
+
+    Reactions with a formula that cannot be parsed, e.g. "(C5H8O2)n", are
+    skipped. If neither `stop_imbalance` nor `show_imbalance` is set, nothing
+    is examined.
+
+    Args:
+        reactions (Iterable[Reaction]): Reactions to examine.
+        stop_imbalance (bool): If imbalance is found, stop process.
+        show_imbalance (bool): If imbalance is found, show output.
+
+    Returns:
+        dict[str, dict[str, float]]: Unbalanced reactions with the affected
+            atoms. "charge" is treated as an element.
+
+    Raises:
+        UnbalancedReaction: if any of the reactions is unbalanced.
+    """
+    # Nothing would be done with the result
+    if not stop_imbalance and not show_imbalance:
+        return {}
+
+    reactions = list(reactions)
+
+    # Element 0 is always the charge
+    elements: dict[str, int] = {"charge": 0}
+    # Position of the composition of each metabolite or None if its formula
+    # cannot be parsed
+    metabolites: dict[str, Optional[int]] = {}
+    compositions: list[dict[str, float]] = []
+
+    rows: list[int] = []
+    columns: list[int] = []
+    coefficients: list[float] = []
+
+    for column, reaction in enumerate(reactions):
+        entries: list[tuple[int, float]] = []
+
+        for metabolite, coefficient in reaction.metabolites.items():
+            if metabolite.id not in metabolites:
+                metabolites[metabolite.id] = _add_composition(
+                    metabolite, elements, compositions
+                )
+
+            index = metabolites[metabolite.id]
+            if index is None:
+                debug_log.debug(
+                    f'Balance of reaction "{reaction.id}" is not checked. '
+                    f'Formula of metabolite "{metabolite.id}" cannot be '
+                    "parsed."
+                )
+                break
+            entries.append((index, coefficient))
+
+        else:
+            for index, coefficient in entries:
+                rows.append(index)
+                columns.append(column)
+                coefficients.append(coefficient)
+
+    # Metabolites x elements
+    element_matrix = np.zeros((len(compositions), len(elements)))
+    for index, composition in enumerate(compositions):
+        for element, amount in composition.items():
+            element_matrix[index, elements[element]] = amount
+
+    # Reactions x elements, i.e. (elements x metabolites) @ stoichiometry
+    balance = np.zeros((len(reactions), len(elements)))
+    np.add.at(
+        balance,
+        np.array(columns, dtype=np.intp),
+        element_matrix[np.array(rows, dtype=np.intp)]
+        * np.array(coefficients)[:, np.newaxis],
+    )
+
+    names = list(elements)
+    tolerance = cobra_core.Configuration().tolerance
+    unbalanced: dict[str, dict[str, float]] = {}
+
+    for row in np.flatnonzero((np.abs(balance) > tolerance).any(axis=1)):
+        affected = np.flatnonzero(np.abs(balance[row]) > tolerance)
+        unbalanced[reactions[row].id] = {
+            names[element]: float(balance[row, element]) for element in affected
+        }
+
+    if unbalanced:
+        if stop_imbalance:
+            raise cmod_error.UnbalancedReaction(
+                identifier=", ".join(unbalanced),
+                dict_balance=str(unbalanced),
+            )
+        if show_imbalance:
+            lines = "\n".join(
+                f'Reaction "{identifier}" unbalanced: {dict_balance}'
+                for identifier, dict_balance in unbalanced.items()
+            )
+            debug_log.warning(
+                f"{len(unbalanced)} unbalanced reactions were found. "
+                f"Following atoms are affected. Please verify:\n{lines}"
+            )
+
+    return unbalanced
+
+
 def get_key_dict(dictionary: dict, pattern: str) -> str:
     """
     From given pattern, return the first key of the dictionary that matches it
@@ -126,6 +311,222 @@ def read_lines(f: TextIO) -> Iterator:
         yield line
 
 
+def read_chunks(
+    f: TextIO, chunk_size: int, start: int = 0
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Reads Text I/O and returns an iterator of chunks. Each chunk is a tuple
+    with the number of the last line read and a list with at most chunk_size
+    lines that are not comments nor blank spaces. Lines up to the line number
+    start are skipped.
+
+    Args:
+        f (TextIO): File to read.
+        chunk_size (int): Maximal number of lines in a chunk.
+        start (int): Number of lines to skip. Defaults to 0.
+
+    Raises:
+        ValueError: If chunk_size is smaller than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("Argument 'chunk_size' must be a positive integer")
+
+    chunk: list[str] = []
+    number = 0
+    for number, line in enumerate(f, start=1):
+        if number <= start:
+            continue
+
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield number, chunk
+            chunk = []
+
+    if chunk:
+        yield number, chunk
+
+
+def read_checkpoint(
+    checkpoint: Path, filename: Path, objects: Optional[DictList] = None
+) -> int:
+    """
+    Returns the number of the last committed line of given file, which is
+    stored in the checkpoint. If the checkpoint does not exist, 0 is returned.
+    The checkpoint only records lines and not the model. If the objects of the
+    last committed lines are missing in given objects, a warning is logged, as
+    these lines are skipped anyway.
+
+    Args:
+        checkpoint (Path): Location of the checkpoint file.
+        filename (Path): File that is imported.
+        objects (DictList, optional): Objects of the model, where the objects
+            of the committed lines are expected. Defaults to None (No check).
+
+    Raises:
+        ValueError: If the checkpoint belongs to a different file.
+    """
+    if not checkpoint.exists():
+        return 0
+
+    with open(checkpoint, "r") as f:
+        progress = json.load(f)
+
+    if progress["filename"] != str(filename.absolute()):
+        raise ValueError(
+            f'Checkpoint "{checkpoint}" belongs to file '
+            f'"{progress["filename"]}". Please use a different checkpoint.'
+        )
+
+    if objects is not None:
+        missing = [
+            identifier
+            for identifier in progress.get("identifiers", [])
+            if identifier not in objects
+        ]
+        if missing:
+            debug_log.warning(
+                'Checkpoint "%s" skips the first %s lines of "%s", but the '
+                "objects %s of these lines are not in the model. The "
+                "checkpoint does not store the model. Please resume with the "
+                "model that was saved after the interruption.",
+                checkpoint,
+                progress["line"],
+                filename.name,
+                missing,
+            )
+    return int(progress["line"])
+
+
+def write_checkpoint(
+    checkpoint: Path,
+    filename: Path,
+    line: int,
+    identifiers: Optional[list[str]] = None,
+):
+    """
+    Stores the number of the last committed line of given file in the
+    checkpoint. The checkpoint is replaced at once, thus an interrupted write
+    never leaves a broken checkpoint behind.
+
+    Args:
+        checkpoint (Path): Location of the checkpoint file.
+        filename (Path): File that is imported.
+        line (int): Number of the last committed line.
+        identifiers (list[str], optional): Identifiers of the objects of the
+            last committed lines. They are checked when resuming. Defaults to
+            None.
+    """
+    progress = {
+        "filename": str(filename.absolute()),
+        "line": line,
+        "identifiers": identifiers or [],
+    }
+    with atomic_file(checkpoint) as temporary:
+        with open(temporary, "w") as f:
+            json.dump(progress, f)
+
+
+@lru_cache(maxsize=None)
+def _umask() -> int:
+    """
+    Returns the file mode creation mask of the process. It can only be read
+    by setting it, thus it is read once.
+    """
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+@contextmanager
+def atomic_file(path: Path) -> Iterator[Path]:
+    """
+    Context manager that yields a temporary file in the directory of given
+    path. The temporary file replaces the path when the context is left
+    without errors. Otherwise, it is removed. Thus, other processes either see
+    the previous or the complete file, but never a partial one.
+
+    The temporary file starts with a dot, so that it is not found when
+    searching for identifiers in the data directory. The file keeps the
+    permissions of the replaced file. New files get the permissions of
+    :func:`open`, i.e. the permissions allowed by the umask.
+
+    .. versionadded:: 1.3.1
+
+    Args:
+        path (Path): Location of the file to write.
+    """
+    descriptor, name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    os.close(descriptor)
+    temporary = Path(name)
+
+    try:
+        yield temporary
+        # Temporary files are only readable by the owner
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask()
+        os.chmod(temporary, mode)
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def write_text(path: Path, text: str):
+    """
+    Writes given text into a file, which is replaced at once. See
+    :func:`atomic_file`.
+
+    .. versionadded:: 1.3.1
+    """
+    with atomic_file(path) as temporary:
+        temporary.write_text(text)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Context manager that holds an exclusive lock on given lock file. The lock
+    blocks other processes, e.g. workers that share the same data directory,
+    until the context is left. The lock file is created if needed and it is
+    not removed afterwards.
+
+    .. versionadded:: 1.3.1
+
+    Args:
+        path (Path): Location of the lock file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "a+") as f:
+        if sys.platform == "win32":
+            f.seek(0)
+            while True:
+                # LK_LOCK gives up after 10 seconds
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def create_replacement(filename: Path) -> dict:
     """
     Creates a dictionary build from given file. Key are the first word until
@@ -344,6 +745,7 @@ def inform_new_sinks(model: cobra_core.Model, previous_sinks: set[str]):
     sinks: set[str] = {sink.id for sink in model.sinks if sink.id}.difference(
         previous_sinks
     )
+    cmod_profiling.count(cmod_profiling.SINKS, len(sinks))
 
     if sinks:
         for reaction in sinks:
@@ -28,14 +28,17 @@ import fileinput
 import math
 from collections import UserDict, namedtuple
 from contextlib import suppress
-from itertools import cycle
-from json import dumps
+from functools import partial
+from itertools import cycle, islice
+from json import JSONEncoder, dumps
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import webcolors
 
+from cobramod.core.graph import MappingCache
 from cobramod.visualization.escher import EscherIntegration
 
 try:
@@ -45,7 +48,8 @@ except ImportError:
     pass
 
 from cobramod.visualization.debug import debug_log
-from cobramod.visualization.items import Node, Reaction
+from cobramod.visualization.items import Node, Reaction, Segment
+from cobramod.visualization.layout import LayoutCache, layout_key
 from cobramod.visualization.mapping import get_mapping, transpose
 
 Position = namedtuple("Position", ["row", "column"])
@@ -116,75 +120,210 @@ def _color2np_rgb(color: Union[str, List[int], None]) -> np.ndarray:
     return np.array(color, dtype=np.float32)
 
 
+def _flux_array(
+    fluxes: Union[Dict[str, float], pd.Series, None],
+) -> np.ndarray:
+    """
+    Returns the values of given fluxes as a NumPy array. Series from
+    :attr:`cobra.Solution.fluxes` are used directly.
+    """
+    if fluxes is None:
+        return np.empty(shape=0)
+
+    if isinstance(fluxes, pd.Series):
+        return fluxes.to_numpy(dtype=np.float64)
+
+    return np.fromiter(fluxes.values(), dtype=np.float64, count=len(fluxes))
+
+
 def _divide_values(
-    flux: List[float], min_max: Optional[List[float]] = None
-) -> Tuple[List[float], List[float], bool, bool]:
+    flux: Union[np.ndarray, List[float]], min_max: Optional[List[float]] = None
+) -> Tuple[np.ndarray, np.ndarray, bool, bool]:
     """
-    This function divides a list into two, one consisting of the positive
+    This function divides an array into two, one consisting of the positive
     values and one of the negative values.
 
     Args:
-        flux (List[int]): Array that is to be divided into positive and
+        flux (np.ndarray): Array that is to be divided into positive and
             negative values.
         min_max ([int,int]): List consisting of two values. These values
             determine the maximum value and minimum value that are taken into
             account in the distribution. All values outside this interval
             are ignored.
     Returns:
-        This function returns two lists and two bools. The first return is the
-            list consisting of positive values. The second return is the list
-            with negative values. The third return is a bool that indicates
-            whether min_max consists of two positive values. The fourth
-            return describes whether min_max consists of two negative values.
+        This function returns two arrays and two bools. The first return is
+            the array consisting of positive values. The second return is the
+            array with negative values. The third return is a bool that
+            indicates whether min_max consists of two positive values. The
+            fourth return describes whether min_max consists of two negative
+            values.
     """
+    flux = np.asarray(flux, dtype=np.float64)
 
     # if required, take min and max settings into account and add them if
     # not present
-
     both_positive = False
     both_negative = False
 
-    for _ in [0]:
-        if min_max is None:
-            continue
-
-        if min_max[0] > min_max[1]:
-            debug_log.warn(
-                "Set minimum is greater than maximum. Ignoring min_max"
-            )
-            continue
+    if min_max is not None and min_max[0] > min_max[1]:
+        debug_log.warning(
+            "Set minimum is greater than maximum. Ignoring min_max"
+        )
 
+    elif min_max is not None:
         both_positive = min_max[0] > 0 and min_max[1] > 0
         both_negative = min_max[0] < 0 and min_max[1] < 0
 
-        size = len(flux)
-        msg = (
-            f"Due to set min_max values were ignored. Original range "
-            f"was [{min(flux)},{max(flux)}] "
-            f"set is [{min_max[0]},{min_max[1]}]."
+        inside = flux[(min_max[0] < flux) & (flux < min_max[1])]
+        if inside.size < flux.size:
+            debug_log.info(
+                f"Due to set min_max values were ignored. Original range "
+                f"was [{flux.min()},{flux.max()}] "
+                f"set is [{min_max[0]},{min_max[1]}]."
+            )
+
+        extra = [
+            value
+            for value in dict.fromkeys(min_max)
+            if value != 0 and not (inside == value).any()
+        ]
+        flux = np.concatenate((inside, extra))
+
+    # divide positive and negative values
+    return flux[flux > 0], flux[flux < 0], both_positive, both_negative
+
+
+def _color_steps(
+    values: np.ndarray,
+    steps: int,
+    quantile: bool,
+    start: Optional[float],
+    color: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the sorted values of the color steps for one side of the gradient
+    and their colors. The values are either quantiles of given values or
+    equally distributed between the start and the value with the largest
+    magnitude. The colors go from grey for the value closest to zero to given
+    color.
+
+    Args:
+        values (np.ndarray): Values with the same sign.
+        steps (int): Number of color steps.
+        quantile (bool): Whether quantiles are used for the steps.
+        start (float, optional): First value of the steps if they are equally
+            distributed. Defaults to the largest magnitude divided by the steps.
+        color (np.ndarray): RGB representation of the end color.
+
+    Returns:
+        Tuple: Array with the values in ascending magnitude and array with
+            their RGB colors.
+    """
+    if not values.size or steps < 1:
+        return np.empty(shape=0), np.empty(shape=(0, 3))
+
+    if quantile:
+        scale = np.quantile(values, np.linspace(0.0, 1.0, steps))
+    else:
+        extreme = values[np.abs(values).argmax()]
+        if start is None:
+            start = extreme / steps
+        scale = np.linspace(start, extreme, steps)
+
+    # From zero to the extreme
+    scale = np.sort(scale)
+    if scale[-1] < 0:
+        scale = scale[::-1]
+
+    color_intermediate = np.array([220, 220, 220], dtype=np.float64)
+    factors = np.arange(1, steps + 1, dtype=np.float64)[:, np.newaxis] / steps
+    colors = color_intermediate - factors * (color_intermediate - color)
+    return scale, colors
+
+
+def _format_scale(values: np.ndarray, colors: np.ndarray) -> List[dict]:
+    """
+    Returns the entries of the reaction scale for Escher from the given values
+    and RGB colors. The colors are truncated to integers.
+    """
+    return [
+        {"type": "value", "value": value, "color": "rgb(%d,%d,%d)" % tuple(rgb)}
+        for value, rgb in zip(
+            values.tolist(), np.trunc(colors).astype(int).tolist()
         )
+    ]
 
-        flux = [value for value in flux if min_max[0] < value < min_max[1]]
-        if size > len(flux):
-            debug_log.info(msg)
 
-        if min_max[0] != 0 and min_max[0] not in flux:
-            flux.append(min_max[0])
+def interpolate_colors(
+    fluxes: np.ndarray, reaction_scale: List[dict]
+) -> np.ndarray:
+    """
+    Returns the RGB color of each flux for given reaction scale. Colors are
+    linearly interpolated between the values of the scale. Fluxes outside of
+    the scale take the color of the closest value. The front ends color the
+    reactions themselves from the scale, thus this is only needed to color a
+    solution outside of them.
 
-        if min_max[1] != 0 and min_max[1] not in flux:
-            flux.append(min_max[1])
+    Args:
+        fluxes (np.ndarray): Fluxes to color.
+        reaction_scale (list): Reaction scale for Escher with entries of type
+            "value". See :meth:`JsonDictionary.color_grading`.
 
-    # divide positive and negative values
-    positive = list()
-    negative = list()
+    Returns:
+        np.ndarray: Array with shape (number of fluxes, 3) and the RGB values.
+    """
+    fluxes = np.asarray(fluxes, dtype=np.float64)
+    if not reaction_scale:
+        return np.full(shape=(fluxes.size, 3), fill_value=220, dtype=np.uint8)
+
+    values = np.array([step["value"] for step in reaction_scale], dtype=float)
+    colors = np.array(
+        [
+            [int(channel) for channel in step["color"][4:-1].split(",")]
+            for step in reaction_scale
+        ],
+        dtype=np.float64,
+    )
+    order = np.argsort(values, kind="stable")
+    values, colors = values[order], colors[order]
+
+    if values.size == 1:
+        return np.tile(colors[0], (fluxes.size, 1)).astype(np.uint8)
+
+    # Position of each flux in the scale is searched once for all channels
+    upper = np.clip(np.searchsorted(values, fluxes), 1, values.size - 1)
+    lower = upper - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = (fluxes - values[lower]) / (values[upper] - values[lower])
+    weight = np.nan_to_num(np.clip(weight, 0, 1), nan=1.0)[:, np.newaxis]
+
+    return (colors[lower] + weight * (colors[upper] - colors[lower])).astype(
+        np.uint8
+    )
+
+
+def _serialize(obj: Any) -> dict:
+    """
+    Returns the native dictionary of the items of the JsonDictionary. This
+    function is used by the JSON encoder for objects that are not native.
+    """
+    if isinstance(obj, (Node, Reaction, Segment)):
+        return obj.as_dict()
+    if isinstance(obj, UserDict):
+        return obj.data
+    raise TypeError(
+        f"Object of type {obj.__class__.__name__} is not JSON serializable"
+    )
 
-    for value in flux:
-        if value > 0:
-            positive.append(value)
-        elif value < 0:
-            negative.append(value)
 
-    return positive, negative, both_positive, both_negative
+def _write_json(obj: Any, f: TextIO, indent: Optional[int] = None):
+    """
+    Writes given structure of a JsonDictionary as JSON into the file handle
+    in chunks, thus, the complete string is never stored in memory.
+    """
+    encoder = JSONEncoder(indent=indent, default=_serialize)
+    for chunk in encoder.iterencode(obj):
+        f.write(chunk)
 
 
 class JsonDictionary(UserDict):
@@ -249,13 +388,41 @@ class JsonDictionary(UserDict):
         self.R_HEIGHT: float = 450  # 210
         # Data stored about reactions and participants.
         self._overview = dict()
+        # Next free number for nodes, segments and reactions
+        self._counters: Dict[str, int] = dict()
+        # Reactions of each column (False) and row (True), and the nodes of
+        # their products
+        self._lines: Dict[Tuple[bool, int], List[str]] = dict()
+        self._indexed = 0
+        self._shared: Dict[Tuple[bool, int], Dict[str, tuple]] = dict()
         # Default solution
-        self.flux_solution: Dict[str, float] = None
+        self.flux_solution: Union[Dict[str, float], pd.Series, None] = None
+        # Multiple solutions for the same map. See frames.flux_frames
+        self.flux_frames: Optional[pd.DataFrame] = None
         # Dictionary with relationship of reactions
         self.graph: dict = dict()
+        # Mapping of previous visualizations of the graph
+        self.mapping_cache: Optional[MappingCache] = None
+        # Stored layouts of previous visualizations
+        self.layout_cache: Optional[LayoutCache] = None
         self.reaction_strings = dict()
         self.reaction_scale = dict()
 
+    def __setitem__(self, key, item):
+        super().__setitem__(key, item)
+        # Counters have to be synchronized with the new data
+        if key == "reactions":
+            self._counters.pop("segments", None)
+        self._counters.pop(key, None)
+
+    def _reaction_data(self) -> Optional[Dict[str, float]]:
+        """
+        Returns the fluxes as a dictionary for the Escher builder.
+        """
+        if isinstance(self.flux_solution, pd.Series):
+            return self.flux_solution.to_dict()
+        return self.flux_solution
+
     def get_canvas(self) -> dict:
         return {
             "x": self.X,
@@ -264,6 +431,21 @@ class JsonDictionary(UserDict):
             "height": self.CANVAS_HEIGHT,
         }
 
+    def _json_object(self) -> list:
+        """
+        Returns the structure of the JSON. The items are not converted. See
+        :func:`_serialize`.
+        """
+        return [
+            self.data["head"],
+            {
+                "reactions": self.data.get("reactions", {}),
+                "nodes": self.data["nodes"],
+                "text_labels": self.data["text_labels"],
+                "canvas": self.get_canvas(),
+            },
+        ]
+
     def json_dump(self, indent: Optional[int] = None) -> str:
         """
         Returns a string that is the JSON representation of this class.
@@ -272,43 +454,20 @@ class JsonDictionary(UserDict):
             indent (int): Defines the indentation for the JSON.
                 Defaults to None.
         """
-        # Transform into regular dictionaries
-        nodes = {
-            key: dict(**value) for key, value in self.data["nodes"].items()
-        }.copy()
-        # In case of reactions, the objects inside them 'Segment' must be
-        # transformed as well
-        try:
-            reactions = {
-                key: dict(**value)
-                for key, value in self.data["reactions"].items()
-            }.copy()
-            # Each reaction must have its Segment changed to a native dict
-            for reaction in reactions:
-                # if empty, must be changed to regular dictionary
-                if not reactions[reaction]["segments"]:
-                    reactions[reaction]["segments"] = dict()
-                else:
-                    # Change each Segment
-                    temporal_dict = dict()
-                    for key, value in reactions[reaction]["segments"].items():
-                        temporal_dict[key] = dict(**value)
-                    reactions[reaction]["segments"] = temporal_dict
-
-        except KeyError:
-            reactions = {}
-        return dumps(
-            obj=[
-                self.data["head"],
-                {
-                    "reactions": reactions,
-                    "nodes": nodes,
-                    "text_labels": self.data["text_labels"],
-                    "canvas": self.get_canvas(),
-                },
-            ],
-            indent=indent,
-        )
+        return dumps(obj=self._json_object(), indent=indent, default=_serialize)
+
+    def write_json(self, f: TextIO, indent: Optional[int] = None):
+        """
+        Writes the JSON representation of this class into given file handle.
+        The JSON is written in chunks, thus, the complete string is never
+        stored in memory.
+
+        Args:
+            f (TextIO): File handle to write the JSON.
+            indent (int): Defines the indentation for the JSON.
+                Defaults to None.
+        """
+        _write_json(self._json_object(), f, indent=indent)
 
     def _get_set(self, item: str) -> set:
         """
@@ -334,13 +493,25 @@ class JsonDictionary(UserDict):
         """
         Returns the largest number of the keys from either reactions, nodes, or
         segments from each reaction. Options for item: "nodes", "segments",
-        "reactions".
+        "reactions". The keys are only read once. Afterwards, the counter of
+        the item is used.
         """
+        with suppress(KeyError):
+            return self._counters[item]
+
         # Return 0 for first item, otherwise the longest number + 1
         numbers = self._get_set(item=item)
-        if not numbers:
-            return 0
-        return max(numbers) + 1
+        self._counters[item] = max(numbers) + 1 if numbers else 0
+        return self._counters[item]
+
+    def _new_number(self, item: str) -> str:
+        """
+        Returns the next number for either reactions, nodes, or segments and
+        increases the counter of the item.
+        """
+        number = self._get_last_number(item=item)
+        self._counters[item] = number + 1
+        return str(number)
 
     def add_metabolite(
         self,
@@ -368,7 +539,7 @@ class JsonDictionary(UserDict):
                 metabolite, i.e. Node is visually larger.
 
         """
-        number = str(self._get_last_number(item="nodes"))
+        number = self._new_number(item="nodes")
         self.data["nodes"][number] = Node(
             node_type="metabolite",
             x=x,
@@ -396,7 +567,7 @@ class JsonDictionary(UserDict):
             node_type (str): Type of marker. Options: 'midmarker' or
                 'multimarker'.
         """
-        number = str(self._get_last_number(item="nodes"))
+        number = self._new_number(item="nodes")
         self.data["nodes"][number] = Node(node_type=node_type, x=x, y=y)
         debug_log.info(
             f'New {node_type}-node with id "{number}" added to '
@@ -448,19 +619,20 @@ class JsonDictionary(UserDict):
         given position. The position can be from a column or a row. Vertical
         defines the orientation.
         """
-        if not vertical:
-            data = [
-                reaction
-                for reaction in self._overview.keys()
-                if self._overview[reaction]["position"].column == position
-            ]
-        else:
-            data = [
-                reaction
-                for reaction in self._overview.keys()
-                if self._overview[reaction]["position"].row == position
-            ]
-        return data
+        # Index new reactions
+        for reaction in islice(self._overview.keys(), self._indexed, None):
+            found: Position = self._overview[reaction]["position"]
+            self._lines.setdefault((False, found.column), []).append(reaction)
+            self._lines.setdefault((True, found.row), []).append(reaction)
+        self._indexed = len(self._overview)
+
+        attribute = "row" if vertical else "column"
+        return [
+            reaction
+            for reaction in self._lines.get((vertical, position), [])
+            if getattr(self._overview[reaction]["position"], attribute)
+            == position
+        ]
 
     def _get_products(self, reactions: list) -> Dict[str, list]:
         """
@@ -475,8 +647,8 @@ class JsonDictionary(UserDict):
         """
         previous = dict()
         # Find in class for the Reaction object to find their metabolites
-        for reaction in self._overview.keys():
-            if reaction in reactions:
+        for reaction in reactions:
+            if reaction in self._overview:
                 index = self._overview[reaction]["index"]
                 try:
                     reaction_obj: Reaction = self.data["reactions"][index]
@@ -516,6 +688,22 @@ class JsonDictionary(UserDict):
                 break
         return node_number, old_reaction
 
+    def _index_products(self, identifier: str):
+        """
+        Adds the product-nodes of given reaction to the index of its column and
+        its row. For each metabolite, only the first reaction is stored.
+        """
+        position: Position = self._overview[identifier]["position"]
+        products = self._get_products(reactions=[identifier])
+
+        for metabolite in products.get(identifier, []):
+            found = (
+                self._overview[identifier]["nodes"][metabolite],
+                identifier,
+            )
+            for line in ((False, position.column), (True, position.row)):
+                self._shared.setdefault(line, {}).setdefault(metabolite, found)
+
     def map_metabolites(
         self,
         metabolite_dict: dict,
@@ -548,15 +736,11 @@ class JsonDictionary(UserDict):
         position_value = position.column
         if vertical:
             position_value = position.row
-        # Obtains reactions that shared either the previous column or row
-        shared_reactions = self._get_matrix_reactions(
-            vertical=vertical, position=max(position_value - 1, 0)
+        # Obtains product-nodes of reactions that shared either the previous
+        # column or row. Only added reactions are indexed
+        shared_products = self._shared.get(
+            (vertical, max(position_value - 1, 0)), {}
         )
-        # Remove actual identifier
-        filtered = [
-            reaction for reaction in shared_reactions if reaction != identifier
-        ]
-        shared_products = self._get_products(reactions=filtered)
         # Add metabolites from dictionary.
         # TODO: get rid off if-statements
         for metabolite, coefficient in metabolite_dict.items():
@@ -596,8 +780,8 @@ class JsonDictionary(UserDict):
             # Check for shared metabolites only if metabolite is located in
             # reactant side
             if SIDE == 0:
-                shared_node, old_reaction = self._find_shared(
-                    metabolite=metabolite, products=shared_products
+                shared_node, old_reaction = shared_products.get(
+                    metabolite, (str(), str())
                 )
             else:
                 shared_node, old_reaction = str(), str()
@@ -652,9 +836,8 @@ class JsonDictionary(UserDict):
                 coefficients.
             reaction (Reaction): Reaction to extend.
         """
-        # Defining identifier, the last number of segments and the markers
+        # Defining identifier and the markers
         identifier = reaction["bigg_id"]
-        last = self._get_last_number(item="segments") - 1
         marker = {
             "first": self._overview[identifier]["nodes"]["_first"],
             "last": self._overview[identifier]["nodes"]["_last"],
@@ -662,9 +845,8 @@ class JsonDictionary(UserDict):
         }
         # From markers. They will be always 2.
         for node in ("first", "last"):
-            last += 1
             reaction.add_segment(
-                identifier=str(last),
+                identifier=self._new_number(item="segments"),
                 from_node_id=str(marker[node]),
                 to_node_id=str(marker["middle"]),
             )
@@ -672,17 +854,16 @@ class JsonDictionary(UserDict):
             # Two due to the first two segments, and plus one as it represent
             # the actual Segment
             number = self._overview[identifier]["nodes"][metabolite]
-            last += 1
             # Check whether reactant or product
             if coefficient < 0:
                 reaction.add_segment(
-                    identifier=str(last),
+                    identifier=self._new_number(item="segments"),
                     from_node_id=str(number),
                     to_node_id=str(marker["first"]),
                 )
             elif coefficient > 0:
                 reaction.add_segment(
-                    identifier=str(last),
+                    identifier=self._new_number(item="segments"),
                     from_node_id=str(number),
                     to_node_id=str(marker["last"]),
                 )
@@ -763,9 +944,10 @@ class JsonDictionary(UserDict):
         # Add visual segments to reaction
         self.add_segments(reaction=reaction, metabolite_dict=metabolite_dict)
         # Define reaction number
-        number = self._get_last_number(item="reactions")
-        self.data["reactions"].update({str(number): reaction})
-        self._overview[identifier]["index"] = str(number)
+        number = self._new_number(item="reactions")
+        self.data["reactions"].update({number: reaction})
+        self._overview[identifier]["index"] = number
+        self._index_products(identifier=identifier)
         debug_log.info(f'Reaction "{identifier}" added to the JsonDictionary.')
 
     def _reset(self):
@@ -777,6 +959,10 @@ class JsonDictionary(UserDict):
         self.data["reactions"] = {}
         self.data["nodes"] = {}
         self.reaction_scale = dict()
+        self._counters = dict()
+        self._lines = dict()
+        self._indexed = 0
+        self._shared = dict()
 
     def color_grading(
         self,
@@ -809,134 +995,98 @@ class JsonDictionary(UserDict):
                 Sets the number of color steps.
             max_steps(int, optional):
                 Sets the maximum number of color steps.
+
+        .. versionchanged:: 1.3.1
+            If the attribute 'flux_frames' is set, the scale is created from
+            the fluxes of all frames, so that the frames are comparable.
         """
 
         # check if any flux values exist otherwise return
-        if self.flux_solution is None:
+        if self.flux_solution is None and self.flux_frames is None:
             return
 
         # turn int arrays into numpy arrays
         color_positive = _color2np_rgb(color[0])
         color_negative = _color2np_rgb(color[1])
-        color_intermediate = np.array([220, 220, 220], dtype=np.float32)
 
-        try:
-            flux = list(self.flux_solution.values())
-        except AttributeError:
-            flux = []
+        if self.flux_frames is not None:
+            grading = self.flux_frames.to_numpy(dtype=np.float64).ravel()
+            grading = grading[~np.isnan(grading)]
+        else:
+            grading = _flux_array(self.flux_solution)
 
         # divide positive and negative values
         # bools used to handle the situation when both values of min_max are
         # positive or negative
         positive, negative, both_positive, both_negative = _divide_values(
-            flux=flux, min_max=min_max
+            flux=grading, min_max=min_max
         )
 
         # array that will contain the configuration for escher
         reaction_scale = []
 
-        # necessary variables for the loop that processes the positive
-        # variables
-        steps = len(positive)
-        steps = min(steps, max_steps)
-
-        # manually set steps overwrite the calculated steps
-        if n_steps is not None:
-            steps = math.floor(n_steps / 2)
-
-        flux_values: np.ndarray
-
-        try:
-            if quantile:
-                flux_values = np.linspace(0.0, 1.0, steps)
-
-                # throws IndexError if positive == []
-                flux_values = np.quantile(positive, flux_values)
+        for values, color_end, shifted in (
+            (positive, color_positive, both_positive),
+            (negative, color_negative, both_negative),
+        ):
+            # manually set steps overwrite the calculated steps
+            if n_steps is not None:
+                steps = math.floor(n_steps / 2)
             else:
-                maximum = max(positive)
-                start_value = maximum / steps
-
-                # if both min_max values are positive the start is shifted
-                # from zero to the set minimum
-                if both_positive:
-                    assert min_max is not None
-                    start_value = min_max[0]
-
-                flux_values = np.linspace(start_value, maximum, steps)
-
-            with np.errstate(divide="ignore"):
-                step_color = (color_intermediate - color_positive) / steps
-            flux_color = color_intermediate.copy() - step_color
-
-            flux_values.sort()
-        except (ValueError, IndexError):
-            flux_values = np.empty(shape=(0, 0))
-
-        for flux_value in flux_values:
-            reaction_scale.append(
-                {
-                    "type": "value",
-                    "value": flux_value,
-                    "color": "rgb(%d,%d,%d)"
-                    % (flux_color[0], flux_color[1], flux_color[2]),
-                }
-            )
+                steps = min(values.size, max_steps)
 
-            flux_color -= step_color
+            # if both min_max values have the same sign, the start is shifted
+            # from zero to the set value closest to zero
+            start = None
+            if shifted and min_max is not None:
+                start = min_max[0] if values is positive else min_max[1]
 
-        # add the intermediate step
-        if not both_positive and not both_negative:
-            reaction_scale.append(
-                {"type": "value", "value": 0, "color": "rgb(220,220,220)"}
-            )
-
-        # updating of the variables for the negative portion of the flux values
-        steps = len(negative)
-        steps = min(steps, max_steps)
-
-        # manually set steps overwrite the calculated steps
-        if n_steps is not None:
-            steps = math.floor(n_steps / 2)
-
-        try:
-            if quantile:
-                flux_values = np.linspace(0.0, 1.0, steps)
-
-                # throws IndexError if negative == []
-                flux_values = np.quantile(negative, flux_values)
-            else:
-                minimum = min(negative)
-                start_value = minimum / steps
-
-                # if both min_max values are negative the start will be
-                # shifted from zero to the set maximum
-                if both_negative:
-                    assert min_max is not None
-                    start_value = min_max[1]
-                flux_values = np.linspace(start_value, minimum, steps)
-
-            with np.errstate(divide="ignore"):
-                step_color = (color_intermediate - color_negative) / steps
-            flux_color = color_intermediate - step_color
-
-            flux_values.sort()
-        except (ValueError, IndexError):
-            flux_values = np.empty(shape=(0, 0))
-
-        for flux_value in flux_values[::-1]:
-            reaction_scale.append(
-                {
-                    "type": "value",
-                    "value": flux_value,
-                    "color": "rgb(%d,%d,%d)"
-                    % (flux_color[0], flux_color[1], flux_color[2]),
-                }
+            scale, colors = _color_steps(
+                values=values,
+                steps=steps,
+                quantile=quantile,
+                start=start,
+                color=color_end,
             )
+            reaction_scale.extend(_format_scale(values=scale, colors=colors))
 
-            flux_color -= step_color
+            # add the intermediate step
+            if values is positive and not both_positive and not both_negative:
+                reaction_scale.append(
+                    {"type": "value", "value": 0, "color": "rgb(220,220,220)"}
+                )
 
         self.reaction_scale = reaction_scale
 
+    def _create_layout(self, vertical: bool):
+        """
+        Adds the reactions of the graph in the positions of its mapping and
+        defines the size of the canvas.
+        """
+        # Use relationship
+        mapping = get_mapping(graph=self.graph, cache=self.mapping_cache)
+        if vertical:
+            mapping = transpose(matrix=mapping)
+            # Modify Reaction-Box
+            self.R_HEIGHT, self.R_WIDTH = self.R_WIDTH, self.R_HEIGHT
+        # Modify canvas
+        self.CANVAS_HEIGHT = self.R_HEIGHT * len(mapping)
+        self.CANVAS_WIDTH = self.R_WIDTH * len(mapping[0])
+        # Use reaction information
+        for index_j, row in enumerate(mapping):
+            for index_i, reaction in enumerate(row):
+                # Add reactions only not 0
+                if reaction == 0:
+                    continue
+                self.add_reaction(
+                    row=index_j,
+                    column=index_i,
+                    name=reaction,
+                    string=self.reaction_strings[reaction],
+                    identifier=reaction,
+                    vertical=vertical,
+                )
+
     def visualize(
         self,
         filepath: Union[str, Path],
@@ -1000,28 +1150,39 @@ class JsonDictionary(UserDict):
         # Define path
         if isinstance(filepath, str):
             filepath = Path.cwd().joinpath(filepath)
-        # Use relationship
-        mapping = get_mapping(graph=self.graph)
-        if vertical:
-            mapping = transpose(matrix=mapping)
-            # Modify Reaction-Box
-            self.R_HEIGHT, self.R_WIDTH = self.R_WIDTH, self.R_HEIGHT
-        # Modify canvas
-        self.CANVAS_HEIGHT = self.R_HEIGHT * len(mapping)
-        self.CANVAS_WIDTH = self.R_WIDTH * len(mapping[0])
-        # Use reaction information
-        for index_j, row in enumerate(mapping):
-            for index_i, reaction in enumerate(row):
-                # Add reactions only not 0
-                if reaction == 0:
-                    continue
-                self.add_reaction(
-                    row=index_j,
-                    column=index_i,
-                    name=reaction,
-                    string=self.reaction_strings[reaction],
-                    identifier=reaction,
-                    vertical=vertical,
+        # Layouts depend on the structure and size of the reactions
+        key: Optional[str] = None
+        layout: Optional[dict] = None
+        if self.layout_cache is not None:
+            key = layout_key(
+                self.graph,
+                self.reaction_strings,
+                vertical,
+                self.R_WIDTH,
+                self.R_HEIGHT,
+            )
+            layout = self.layout_cache.get(key)
+
+        if layout is not None:
+            if vertical:
+                self.R_HEIGHT, self.R_WIDTH = self.R_WIDTH, self.R_HEIGHT
+            self.data["reactions"] = layout["reactions"]
+            self.data["nodes"] = layout["nodes"]
+            self.CANVAS_WIDTH, self.CANVAS_HEIGHT = layout["canvas"]
+            debug_log.debug(f'Layout "{key}" loaded from the cache.')
+
+        else:
+            self._create_layout(vertical=vertical)
+
+            if self.layout_cache is not None and key is not None:
+                self.layout_cache.set(
+                    key=key,
+                    layout={
+                        "reactions": self.data["reactions"],
+                        "nodes": self.data["nodes"],
+                        "canvas": [self.CANVAS_WIDTH, self.CANVAS_HEIGHT],
+                    },
+                    default=_serialize,
                 )
 
         if color is not None:
@@ -1034,6 +1195,11 @@ class JsonDictionary(UserDict):
             )
 
         if not custom_integration:
+            if self.flux_frames is not None:
+                debug_log.warning(
+                    "Frames are only supported by CobraMod's integration of "
+                    "Escher. Only the attribute 'flux_solution' is shown."
+                )
             builder = escher.Builder(
                 # Check how reaction_styles behaves
                 reaction_styles=["color", "text"],
@@ -1042,8 +1208,9 @@ class JsonDictionary(UserDict):
                 reaction_scale=self.reaction_scale,
             )
 
-            if self.flux_solution:
-                builder.reaction_data = self.flux_solution
+            reaction_data = self._reaction_data()
+            if reaction_data:
+                builder.reaction_data = reaction_data
             builder.save_html(filepath=filepath)
 
             f = fileinput.FileInput(filepath, inplace=True)
@@ -1056,14 +1223,17 @@ class JsonDictionary(UserDict):
             debug_log.info(f'Visualization saved in "{filepath}"')
 
         else:
+            # The JSON of the map is only created if the widget is displayed.
+            # The structure is kept since the data is reset below
             builder = EscherIntegration(
                 # Check how reaction_styles behaves
                 reaction_styles=["color", "text"],
                 map_name=self.data["head"]["map_name"],
-                map_json=self.json_dump(),
                 reaction_scale=self.reaction_scale,
-                reaction_data=self.flux_solution,
+                reaction_data=self._reaction_data(),
                 never_ask_before_quit=never_ask_before_quit,
+                frames=self.flux_frames,
+                write_map=partial(_write_json, self._json_object()),
             )
 
             builder.save_html(filepath=filepath)
@@ -4,14 +4,26 @@
 This module contains an alternative Python integration for `Escher <https://github.com/zakandrewking/escher>`_ .
 """
 
+import io
 from importlib import resources
 from pathlib import Path
-from typing import Any, Optional, Dict, TypedDict, Literal, List, Union
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Dict,
+    TextIO,
+    TypedDict,
+    Literal,
+    List,
+    Union,
+)
 
 import anywidget
 from traitlets import traitlets
 
 from cobramod import static
+from cobramod.visualization.frames import Frames, encode_frames, flux_frames
 
 
 class ReactionScale(TypedDict):
@@ -54,6 +66,8 @@ class EscherIntegration(anywidget.AnyWidget):
         reaction_scale: Optional[List[ReactionScale]] = None,
         reaction_styles: Optional[List[Any]] = None,
         never_ask_before_quit: bool = False,
+        frames: Optional[Frames] = None,
+        write_map: Optional[Callable[[TextIO], None]] = None,
     ):
         """
 
@@ -69,16 +83,27 @@ class EscherIntegration(anywidget.AnyWidget):
                 This list must consist of at least two ReactionScales when it is used.
             reaction_styles: Style options for the reactions see `Escher's JavaScript API <https://escher.readthedocs.io/en/latest/javascript_api.html#escher.Builder.options.reaction_styles>`_ for options and formatting.
             never_ask_before_quit: Option to control whether a warning dialog is displayed when the Escher Builder window is closed. See `Escher's JavaScript API <https://escher.readthedocs.io/en/latest/javascript_api.html#escher.Builder.options.never_ask_before_quit>`_ for reference.
+            frames: Multiple flux distributions to be shown on the same map. See
+                :py:meth:`~cobramod.visualization.escher.EscherIntegration.set_frames`.
+            write_map: Function that writes the JSON of the map into the given file handle. It replaces 'map_json',
+                which is only created when the widget is displayed or the attribute is read. Thus, saving the HTML
+                with :py:meth:`save_html` never keeps the complete JSON in memory.
         """
+        # Needed before the state is sent in the constructor of the widget
+        self._write_map = write_map if map_json is None else None
         super().__init__()
 
         self.map_name = map_name
-        self.map_json = map_json
+        if self._write_map is None:
+            self.map_json = map_json
         self.reaction_scale = reaction_scale
         self.reaction_data = reaction_data
         self.reaction_styles = reaction_styles
         self.never_ask_before_quit = never_ask_before_quit
 
+        if frames is not None:
+            self.set_frames(frames)
+
     reaction_styles: Optional[List[Any]] = traitlets.List(allow_none=True).tag(
         sync=True
     )  # type: ignore
@@ -89,9 +114,91 @@ class EscherIntegration(anywidget.AnyWidget):
         allow_none=True
     ).tag(sync=True)  # type: ignore
     never_ask_before_quit = traitlets.Bool(allow_none=False).tag(sync=True)
+    # Frames are sent as a binary buffer. See set_frames
+    frame_reactions = traitlets.List(trait=traitlets.Unicode()).tag(sync=True)
+    frame_fluxes = traitlets.Bytes(allow_none=True).tag(sync=True)
+    frame = traitlets.Int(0).tag(sync=True)
 
     _esm = resources.read_text(static, "escher.mjs")
 
+    @traitlets.default("map_json")
+    def _default_map_json(self) -> Optional[str]:
+        if self._write_map is None:
+            return None
+
+        buffer = io.StringIO()
+        self._write_map(buffer)
+        return buffer.getvalue()
+
+    def _map_pending(self) -> bool:
+        """
+        Returns whether the map is given by 'write_map' and was not created
+        yet.
+        """
+        return self._write_map is not None and not self.trait_has_value(
+            "map_json"
+        )
+
+    def get_state(self, key=None):
+        # A pending map is only sent when the widget is displayed
+        if key is None and self._map_pending():
+            key = [name for name in self.keys if name != "map_json"]
+        return super().get_state(key=key)
+
+    def _send_map(self):
+        """
+        Creates a pending map and sends it to the front end.
+        """
+        if self._map_pending():
+            self.send_state("map_json")
+
+    def _repr_mimebundle_(self, **kwargs):
+        self._send_map()
+        return super()._repr_mimebundle_(**kwargs)
+
+    def _handle_custom_msg(self, data: dict, buffers: Any):
+        # Views without a map, e.g. inside of a container, request it
+        if data["type"] == "load_map":
+            self._send_map()
+
+    @property
+    def n_frames(self) -> int:
+        """
+        .. versionadded:: 1.3.1
+
+        The number of frames of the widget.
+        """
+        if not self.frame_fluxes or not self.frame_reactions:
+            return 0
+        return len(self.frame_fluxes) // (4 * len(self.frame_reactions))
+
+    def set_frames(
+        self, solutions: Frames, reactions: Optional[List[str]] = None
+    ):
+        """
+        .. versionadded:: 1.3.1
+
+        Sets multiple flux distributions for the map, e.g. from a parameter
+        scan or from flux sampling. The map is not rebuilt. Only the fluxes are
+        sent to the front end as a binary buffer and the attribute 'frame'
+        defines the flux distribution that is shown.
+
+        Args:
+            solutions: A sequence of :py:class:`cobra.Solution`, Series or
+                dictionaries, a DataFrame with a row for each frame or a
+                two-dimensional array. See
+                :py:func:`~cobramod.visualization.frames.flux_frames`.
+            reactions: The reaction IDs of the frames. These are required
+                for arrays.
+        """
+        frame_reactions, frame_fluxes = encode_frames(
+            flux_frames(solutions=solutions, reactions=reactions)
+        )
+        with self.hold_sync():
+            self.frame = 0
+            self.frame_reactions = frame_reactions
+            self.frame_fluxes = frame_fluxes
+
     @property
     def model_data(self):
         return "null"
@@ -111,17 +218,26 @@ class EscherIntegration(anywidget.AnyWidget):
             else "false",
         }
 
-    def save_html(self, filepath: Union[str, Path]):
+    def save_html(
+        self,
+        filepath: Union[str, Path],
+        write_map: Optional[Callable[[TextIO], None]] = None,
+    ):
         """
         This method creates a standalone HTML file that contains all the data of the
-        Escher map and loads it automatically when it is opened.
+        Escher map and loads it automatically when it is opened. The HTML is written
+        directly into the file.
 
         Args:
             filepath: The file in which the HTML file is to be saved.
+            write_map: Function that writes the JSON of the map into the given file
+                handle, e.g. :py:meth:`~cobramod.visualization.converter.JsonDictionary.write_json`.
+                This avoids keeping an extra copy of the map in memory. Defaults to
+                writing 'map_json'.
 
         """
 
-        html_rep = f"""
+        html_head = """
         <!DOCTYPE html>
         <html lang="en">
           <head>
@@ -137,7 +253,8 @@ class EscherIntegration(anywidget.AnyWidget):
         
             <script>
              escher.Builder(
-                {self.map_json}, 
+                """
+        html_tail = f""", 
                 {self.model_data}, 
                 {self.embedded_css},
                 escher.libs.d3_select('#map-container'), 
@@ -150,5 +267,13 @@ class EscherIntegration(anywidget.AnyWidget):
         if isinstance(filepath, str):
             filepath = Path(filepath)
 
+        if write_map is None and self._map_pending():
+            write_map = self._write_map
+
         with open(filepath, "w") as f:
-            f.write(html_rep)
+            f.write(html_head)
+            if write_map is None:
+                f.write(f"{self.map_json}")
+            else:
+                write_map(f)
+            f.write(html_tail)
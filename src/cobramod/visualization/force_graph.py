@@ -4,26 +4,45 @@
 This module contains the logic to create a three-dimensional representation
 from a :py:class:`cobra.core.Group` or a :py:class:`cobra.Reaction`
 using `3d-force-graph <https://github.com/vasturiano/3d-force-graph>`_ .
+
+.. versionchanged:: 1.3.1
+    Complete :py:class:`cobra.Model` objects can be represented. Groups and
+    subsystems are shown as clusters and hub metabolites are removed.
 """
 
 import csv
 from dataclasses import dataclass, field
 from importlib import resources
 from pathlib import Path
-from typing import Union, Literal, Type, Optional, Any
+from typing import Union, Literal, Type, Optional, Any, Iterable, List
 
 import anywidget
-from cobra import Metabolite, Reaction, Solution
+import numpy as np
+import pandas as pd
+from cobra import Metabolite, Model, Reaction, Solution
 from cobra.core import Group
 from traitlets import traitlets
 
 from cobramod import static
+from cobramod.visualization.frames import Frames, encode_frames, flux_frames
+from cobramod.visualization.layout import LayoutCache, layout_key
+
+
+# Metabolites in more reactions are removed from the graph of a model
+HUB_DEGREE = 20
+
+# Position defines the code of each group in GraphArrays
+GROUPS: tuple[Literal["metabolite", "reaction", "cluster"], ...] = (
+    "metabolite",
+    "reaction",
+    "cluster",
+)
 
 
 @dataclass(frozen=True)
 class Nodes:
     id: str
-    group: Literal["metabolite", "reaction"]
+    group: Literal["metabolite", "reaction", "cluster"]
 
     def to_json(self) -> str:
         return f"""{{"id":"{self.id}", "group":"{self.group}"}}"""
@@ -81,97 +100,330 @@ class GraphData:
         return {"nodes": [self.nodes], "links": [self.links]}
 
 
-def _reac2dict(reaction: Reaction, flux: float = 1) -> GraphData:
+@dataclass()
+class GraphArrays:
     """
-    Function that generates a :py:class:`GraphData` object from a Cobra.Reaction.
-
-    Args:
-        reaction: A :py:class:`cobra.Reaction` that is to be converted into a :py:class:`GraphData` object.
-        flux: The flux of this reaction.
+    .. versionadded:: 1.3.1
 
-    Returns: A :py:class:`GraphData` object that contains the definition for the passed reaction.
+    Graph as NumPy arrays. The nodes are referenced by their position in
+    'ids'. The arrays are sent to the front end as binary buffers, see
+    :py:meth:`to_buffers`.
 
+    Args:
+        ids: Identifiers of the nodes.
+        groups: Group of each node as the position in :py:data:`GROUPS`.
+        source: Position of the source node of each link.
+        target: Position of the target node of each link.
+        value: Value of each link.
+        positions: Optional array with the x, y and z coordinates of each node.
+            Unknown coordinates are NaN.
+        key: Optional hash of the structure of the graph. It identifies the
+            layout in the cache.
     """
 
-    nodes: set[Nodes] = set()
-    links: set[Links] = set()
+    ids: list[str] = field(default_factory=list)
+    groups: np.ndarray = field(
+        default_factory=lambda: np.empty(shape=0, dtype=np.uint8)
+    )
+    source: np.ndarray = field(
+        default_factory=lambda: np.empty(shape=0, dtype=np.int32)
+    )
+    target: np.ndarray = field(
+        default_factory=lambda: np.empty(shape=0, dtype=np.int32)
+    )
+    value: np.ndarray = field(default_factory=lambda: np.empty(shape=0))
+    positions: Optional[np.ndarray] = None
+    key: Optional[str] = None
+
+    def to_buffers(self) -> dict[str, Any]:
+        """
+        Returns the graph for the front end. The identifiers are a list and
+        the arrays little-endian bytes.
+        """
+        buffers: dict[str, Any] = {
+            "ids": self.ids,
+            "groups": self.groups.astype(np.uint8).tobytes(),
+            "source": self.source.astype("<i4").tobytes(),
+            "target": self.target.astype("<i4").tobytes(),
+            "value": self.value.astype("<f8").tobytes(),
+        }
+        if self.positions is not None:
+            buffers["positions"] = self.positions.astype("<f8").tobytes()
+        if self.key is not None:
+            buffers["key"] = self.key
+        return buffers
+
+    def structure_key(self) -> str:
+        """
+        Returns a hash of the nodes and of the connections between them. The
+        direction and the value of the links are not considered, so that
+        different solutions share the same layout.
+        """
+        return layout_key(
+            self.ids,
+            self.groups.tolist(),
+            np.minimum(self.source, self.target).tolist(),
+            np.maximum(self.source, self.target).tolist(),
+        )
+
+    def set_positions(self, positions: dict[str, list[float]]):
+        """
+        Sets the positions of the nodes from a dictionary with the node
+        identifiers and their coordinates. Missing nodes have NaN as
+        coordinates.
+        """
+        self.positions = np.array(
+            [
+                positions.get(identifier, [np.nan] * 3)
+                for identifier in self.ids
+            ],
+            dtype=np.float64,
+        ).reshape(len(self.ids), 3)
+
+    def to_graph_data(self) -> GraphData:
+        """
+        Returns the graph as a :py:class:`GraphData` object.
+        """
+        groups = [GROUPS[code] for code in self.groups.tolist()]
+        return GraphData(
+            nodes={
+                Nodes(id=identifier, group=group)
+                for identifier, group in zip(self.ids, groups)
+            },
+            links={
+                Links(
+                    source=self.ids[source],
+                    target=self.ids[target],
+                    value=value,
+                )
+                for source, target, value in zip(
+                    self.source.tolist(),
+                    self.target.tolist(),
+                    self.value.tolist(),
+                )
+            },
+        )
+
+
+def _collect_members(
+    model: Union[Group, Reaction, Model],
+    reactions: dict[str, Reaction],
+    metabolites: dict[str, Metabolite],
+):
+    """
+    Adds the reactions and metabolites of given Group, Reaction or Model into
+    the dictionaries. Nested groups are included.
+    """
+    if isinstance(model, Reaction):
+        reactions[model.id] = model
+        return
 
-    nodes.add(Nodes(id=reaction.id, group="reaction"))
+    if isinstance(model, Model):
+        reactions.update(
+            (reaction.id, reaction) for reaction in model.reactions
+        )
+        return
 
-    for metabolite in reaction.metabolites:
-        nodes.add(Nodes(id=metabolite.id, group="metabolite"))
+    for member in model.members:
+        if type(member) is Group:
+            _collect_members(member, reactions, metabolites)
 
-        stoichiometry = reaction.get_coefficient(metabolite_id=metabolite.id)
-        link: Links
+        elif type(member) is Reaction:
+            reactions[member.id] = member
 
-        if stoichiometry * flux < 0:
-            link = Links(
-                source=metabolite.id,
-                target=reaction.id,
-                value=-stoichiometry * flux,
-            )
+        elif type(member) is Metabolite:
+            metabolites[member.id] = member
 
         else:
-            link = Links(
-                source=reaction.id,
-                target=metabolite.id,
-                value=stoichiometry * flux,
-            )
-
-        links.add(link)
-
-    data: GraphData = GraphData(nodes=nodes, links=links)
-
-    return data
+            raise TypeError
 
 
-def _group2dict(
-    group: Group, solution: Union[Solution, dict] = None
-) -> GraphData:
+def get_clusters(model: Model, expanded: Iterable[str] = ()) -> dict[str, str]:
     """
-    Function that generates a :py:class:`GraphData` object from a :py:class:`cobra.Reaction`.
-
-    Args:
-        group: A :py:class:`cobra.Reaction` that is to be converted into a :py:class:`GraphData` object.
-        solution: The flux of this reaction.
+    .. versionadded:: 1.3.1
 
-    Returns:
-        A :py:class:`GraphData` object that contains the definition for the passed reaction.
+    Returns a dictionary with the reaction identifiers as keys and the
+    cluster of each reaction as values. The clusters are the groups of the
+    model, e.g. :py:class:`~cobramod.Pathway` objects, and for reactions
+    outside of the groups, their subsystem. Reactions without any of them do
+    not belong to a cluster.
 
+    Args:
+        model: The model with the groups and reactions.
+        expanded: Clusters to be ignored. Their reactions are shown
+            individually unless they belong to another cluster.
     """
+    expanded = set(expanded)
+    clusters: dict[str, str] = {}
 
-    data: GraphData = GraphData()
+    for group in model.groups:
+        if group.id in expanded:
+            continue
 
-    if solution is not None:
-        if isinstance(solution, Solution):
-            solution = solution.fluxes.to_dict()
+        reactions: dict[str, Reaction] = {}
+        _collect_members(group, reactions, {})
+        for identifier in reactions:
+            clusters.setdefault(identifier, group.id)
 
-    result: GraphData
+    for reaction in model.reactions:
+        if reaction.subsystem and reaction.subsystem not in expanded:
+            clusters.setdefault(reaction.id, reaction.subsystem)
 
-    for member in group.members:
-        if type(member) is Group:
-            result = _group2dict(group=member, solution=solution)
+    return clusters
 
-        elif type(member) is Reaction:
-            if solution is not None:
-                flux = solution.get(member.id, 1)
-            else:
-                flux = 1
 
-            result = _reac2dict(reaction=member, flux=flux)
+def _graph_arrays(
+    model: Union[Group, Reaction, Model],
+    solution: Optional[dict] = None,
+    max_degree: Optional[int] = None,
+    clusters: Optional[dict[str, str]] = None,
+) -> GraphArrays:
+    """
+    Function that generates a :py:class:`GraphArrays` object from a
+    :py:class:`cobra.core.Group`, :py:class:`cobra.Reaction` or
+    :py:class:`cobra.Model`. The links are the entries of the sparse
+    stoichiometric matrix of the reactions scaled by their fluxes. A link
+    points from the reaction to the metabolite if the scaled coefficient is
+    not negative.
 
-        elif type(member) is Metabolite:
-            node = set()
-            node.add(Nodes(id=member.id, group="metabolite"))
+    Reactions of a cluster are merged into one node and their links to the
+    same metabolite are added up. Metabolites that are only linked to one
+    cluster are hidden inside of it.
 
-            result = GraphData(nodes=node)
-        else:
-            raise TypeError
+    Args:
+        model: The Group, Reaction or Model to be converted.
+        solution: The fluxes of the reactions. Reactions that are not found
+            have a flux of 1.
+        max_degree: Metabolites that take part in more reactions are
+            removed. Defaults to keeping all metabolites.
+        clusters: Dictionary with reaction identifiers and their clusters.
+            See :py:func:`get_clusters`.
 
-        data.nodes.update(result.nodes)
-        data.links.update(result.links)
+    Returns:
+        A :py:class:`GraphArrays` object with the reactions, the clusters and
+        the metabolites in this order.
+    """
+    reactions: dict[str, Reaction] = {}
+    metabolites: dict[str, Metabolite] = {}
+    _collect_members(model, reactions, metabolites)
+
+    # Coordinates of the sparse stoichiometric matrix
+    rows: list[int] = []
+    columns: list[int] = []
+    coefficients: list[float] = []
+    position: dict[str, int] = {}
+
+    for column, reaction in enumerate(reactions.values()):
+        for metabolite, coefficient in reaction.metabolites.items():
+            row = position.setdefault(metabolite.id, len(position))
+            rows.append(row)
+            columns.append(column)
+            coefficients.append(coefficient)
+
+    # Metabolites without reactions
+    for identifier in metabolites:
+        position.setdefault(identifier, len(position))
+
+    fluxes = np.ones(shape=len(reactions))
+    if solution is not None:
+        fluxes = np.fromiter(
+            (solution.get(identifier, 1) for identifier in reactions),
+            dtype=np.float64,
+            count=len(reactions),
+        )
+
+    metabolite_rows = np.array(rows, dtype=np.int64)
+    reaction_columns = np.array(columns, dtype=np.int64)
+    scaled = np.array(coefficients, dtype=np.float64) * fluxes[reaction_columns]
+    visible = np.ones(shape=len(position), dtype=bool)
+
+    if max_degree is not None:
+        degree = np.bincount(metabolite_rows, minlength=len(position))
+        visible &= degree <= max_degree
+
+    # Node of each reaction. Clustered reactions share the node
+    if clusters is None:
+        clusters = {}
+    reaction_ids = [
+        identifier for identifier in reactions if identifier not in clusters
+    ]
+    cluster_ids = list(
+        dict.fromkeys(
+            clusters[identifier]
+            for identifier in reactions
+            if identifier in clusters
+        )
+    )
+    nodes = {identifier: index for index, identifier in enumerate(reaction_ids)}
+    for index, identifier in enumerate(cluster_ids, start=len(reaction_ids)):
+        nodes[identifier] = index
+    n_nodes = len(nodes)
+    column_nodes = np.fromiter(
+        (
+            nodes[clusters.get(identifier, identifier)]
+            for identifier in reactions
+        ),
+        dtype=np.int64,
+        count=len(reactions),
+    )
+
+    # Links to the same metabolite are added up
+    pairs, inverse = np.unique(
+        metabolite_rows * n_nodes + column_nodes[reaction_columns],
+        return_inverse=True,
+    )
+    net = np.bincount(inverse.ravel(), weights=scaled, minlength=pairs.size)
+    pair_rows = pairs // n_nodes if n_nodes else pairs
+    pair_nodes = pairs % n_nodes if n_nodes else pairs
+
+    # Metabolites with a single link to a cluster are inside of it
+    n_links = np.bincount(pair_rows, minlength=len(position))
+    internal = (n_links[pair_rows] == 1) & (pair_nodes >= len(reaction_ids))
+    visible[pair_rows[internal]] = False
+
+    keep = visible[pair_rows]
+    metabolite_nodes = np.cumsum(visible)[pair_rows[keep]] - 1 + n_nodes
+    pair_nodes, net = pair_nodes[keep], net[keep]
+    consumed = net < 0
+
+    groups = np.zeros(shape=n_nodes + int(visible.sum()), dtype=np.uint8)
+    groups[: len(reaction_ids)] = GROUPS.index("reaction")
+    groups[len(reaction_ids) : n_nodes] = GROUPS.index("cluster")
+
+    return GraphArrays(
+        ids=reaction_ids
+        + cluster_ids
+        + [
+            identifier
+            for identifier, shown in zip(position, visible.tolist())
+            if shown
+        ],
+        groups=groups,
+        source=np.where(consumed, metabolite_nodes, pair_nodes),
+        target=np.where(consumed, pair_nodes, metabolite_nodes),
+        value=np.abs(net),
+    )
+
+
+def _cluster_frames(
+    frames: pd.DataFrame, clusters: dict[str, str]
+) -> pd.DataFrame:
+    """
+    Returns the frames with an additional column for each cluster. Its value
+    is the sum of the fluxes of the reactions of the cluster in the frame.
+    Frames without fluxes for the reactions of a cluster have the value NaN.
+    """
+    members = [column for column in frames.columns if column in clusters]
+    if not members:
+        return frames
 
-    return data
+    sums = (
+        frames[members]
+        .T.groupby([clusters[column] for column in members], sort=False)
+        .sum(min_count=1)
+        .T
+    )
+    return pd.concat([frames, sums.astype(np.float32)], axis=1)
 
 
 class ForceGraphIntegration(anywidget.AnyWidget):
@@ -184,28 +436,128 @@ class ForceGraphIntegration(anywidget.AnyWidget):
     def __init__(self):
         """ """
         super().__init__()
+        self._expanded = set()
+        self._clusters = {}
         self.on_msg(self._handle_custom_msg)
 
-    _model: Union[Type[Group], Type[Reaction], None] = None
+    _model: Union[Type[Group], Type[Reaction], Type[Model], None] = None
     _solution: Optional[dict] = None
-
-    # _model_rep is the data basis for the widget
-    # Changes update the front end
-    _model_rep: str = """{"nodes": [], "links": []}"""
-    _model_rep = traitlets.Unicode().tag(sync=True)  # type: ignore
+    _max_degree: Optional[int] = None
+    _directory: Optional[Path] = None
+    # Clusters of a model that are shown as single reactions
+    _expanded: set[str]
+    # Cluster of each reaction in the current graph
+    _clusters: dict[str, str]
+    # Frames without the values of the clusters. See set_frames
+    _frames: Optional[pd.DataFrame] = None
+
+    _data: GraphArrays = GraphArrays()
+
+    # _graph is the data basis for the widget. The arrays are sent as binary
+    # buffers. Changes update the front end
+    _graph = traitlets.Dict().tag(sync=True)
+
+    # Frames are sent as a binary buffer. See set_frames
+    frame_reactions = traitlets.List(trait=traitlets.Unicode()).tag(sync=True)
+    frame_fluxes = traitlets.Bytes(allow_none=True).tag(sync=True)
+    frame = traitlets.Int(0).tag(sync=True)
 
     @property
-    def model(self) -> Optional[Union[Type[Group], Type[Reaction]]]:
+    def model(
+        self,
+    ) -> Optional[Union[Type[Group], Type[Reaction], Type[Model]]]:
         """
         The Model to be represented. It can ether be a :py:class:`cobra.core.group.Group` or :py:class:`cobra.Reaction`.
         It is set to None upon initialization.
+
+        .. versionchanged:: 1.3.1
+            A :py:class:`cobra.Model` can be represented. Its groups and subsystems are shown as clusters that can be
+            expanded with a click and metabolites with more reactions than 'max_degree' are removed.
         """
 
         return self._model
 
     @model.setter
-    def model(self, value: Union[Type[Group], Type[Reaction]]):
+    def model(self, value: Union[Type[Group], Type[Reaction], Type[Model]]):
         self._model = value
+        self._expanded = set()
+        self._create_model_rep()
+
+    @property
+    def max_degree(self) -> Optional[int]:
+        """
+        .. versionadded:: 1.3.1
+
+        Metabolites that take part in more reactions than this value are removed from the graph, e.g. protons, water
+        or ATP. These hub metabolites link most of the reactions and make large graphs unreadable. If None, all
+        metabolites are kept for groups and reactions, and a threshold of :py:data:`HUB_DEGREE` is used for models.
+        """
+        return self._max_degree
+
+    @max_degree.setter
+    def max_degree(self, value: Optional[int]):
+        self._max_degree = value
+        self._create_model_rep()
+
+    @property
+    def directory(self) -> Optional[Path]:
+        """
+        .. versionadded:: 1.3.1
+
+        Data directory for the layout cache. The positions of the nodes are stored in the folder "Layout" when the
+        simulation of the front end stops, and they are used again for the same structure. If the structure changes,
+        the nodes of the latest layout keep their positions and only new nodes are positioned. If None, no layouts are
+        stored. It is set to None upon initialization.
+        """
+        return self._directory
+
+    @directory.setter
+    def directory(self, value: Optional[Union[str, Path]]):
+        self._directory = None if value is None else Path(value)
+        self._create_model_rep()
+
+    def _layout_cache(self) -> Optional[LayoutCache]:
+        if self._directory is None or self._model is None:
+            return None
+        return LayoutCache(
+            directory=self._directory, name=self._model.id, kind="force-graph"
+        )
+
+    def expand(self, cluster: str):
+        """
+        .. versionadded:: 1.3.1
+
+        Shows the reactions of given cluster individually. Only has an effect when representing a model.
+        Clicking a cluster in the front end calls this method.
+
+        Args:
+            cluster: Identifier of the group or subsystem.
+        """
+        self._expanded.add(cluster)
+        self._create_model_rep()
+
+    def collapse(self, identifier: str):
+        """
+        .. versionadded:: 1.3.1
+
+        Merges the reactions of an expanded cluster into one node again. Right-clicking a reaction in the front end
+        calls this method.
+
+        Args:
+            identifier: Identifier of the expanded cluster or of one of its reactions.
+        """
+        if (
+            isinstance(self._model, Model)
+            and identifier in self._model.reactions
+        ):
+            reaction = self._model.reactions.get_by_id(identifier)
+            self._expanded.discard(reaction.subsystem)
+            self._expanded.difference_update(
+                group.id
+                for group in self._model.get_associated_groups(reaction)
+            )
+
+        self._expanded.discard(identifier)
         self._create_model_rep()
 
     @property
@@ -225,33 +577,110 @@ class ForceGraphIntegration(anywidget.AnyWidget):
             value = value.fluxes.to_dict()
 
         self._solution = value
-        self._create_model_rep()
+        self._frames = None
+        with self.hold_sync():
+            self.frame_reactions = []
+            self.frame_fluxes = b""
+            self._create_model_rep()
+
+    @property
+    def n_frames(self) -> int:
+        """
+        .. versionadded:: 1.3.1
+
+        The number of frames of the widget.
+        """
+        if not self.frame_fluxes or not self.frame_reactions:
+            return 0
+        return len(self.frame_fluxes) // (4 * len(self.frame_reactions))
+
+    def set_frames(
+        self, solutions: Frames, reactions: Optional[List[str]] = None
+    ):
+        """
+        .. versionadded:: 1.3.1
+
+        Sets multiple flux distributions, e.g. from a parameter scan or from
+        flux sampling. The graph is created once with a flux of 1 and the
+        front end scales the links of the frame defined in the attribute
+        'frame'. Only the fluxes are sent as a binary buffer. This replaces
+        the attribute 'solution'.
+
+        The links of a cluster are scaled by the sum of the fluxes of its
+        reactions in the frame. Since a single value is sent for each
+        cluster, this approximates the links of a graph created with the
+        fluxes of the frame.
+
+        Args:
+            solutions: A sequence of :py:class:`cobra.Solution`, Series or
+                dictionaries, a DataFrame with a row for each frame or a
+                two-dimensional array. See
+                :py:func:`~cobramod.visualization.frames.flux_frames`.
+            reactions: The reaction IDs of the frames. These are required
+                for arrays.
+        """
+        self._frames = flux_frames(solutions=solutions, reactions=reactions)
+        self._solution = None
+        with self.hold_sync():
+            self.frame = 0
+            if self._model is None:
+                self._send_frames()
+            else:
+                self._create_model_rep()
+
+    def _send_frames(self):
+        """
+        Sends the frames with the values of the clusters of the current
+        graph. Expanding or collapsing a cluster sends them again.
+        """
+        if self._frames is None:
+            return
+
+        self.frame_reactions, self.frame_fluxes = encode_frames(
+            _cluster_frames(self._frames, self._clusters)
+        )
 
     def _create_model_rep(self):
         """
         Function to create a representation whenever a model and/or a solution are assigned.
         This representation is used as a data basis for 3d-force-graph.
-        The representation is assigned to 'self._model_rep'.
+        The arrays are assigned to 'self._data' and sent as buffers with 'self._graph'.
         """
 
         if self._model is None:
             return
 
-        if isinstance(self._model, Group):
-            data = _group2dict(self._model, solution=self._solution)
-
-        elif isinstance(self._model, Reaction):
-            if self._solution is not None:
-                flux = self._solution.get(self._model.id, 1)
-            else:
-                flux = 1
+        if isinstance(self._model, Model):
+            max_degree = (
+                HUB_DEGREE if self._max_degree is None else self._max_degree
+            )
+            clusters = get_clusters(self._model, expanded=self._expanded)
 
-            data = _reac2dict(self._model, flux=flux)
+        elif isinstance(self._model, (Group, Reaction)):
+            max_degree = self._max_degree
+            clusters = None
 
         else:
             raise TypeError
 
-        self._model_rep = data.to_json()
+        self._data = _graph_arrays(
+            self._model,
+            solution=self._solution,
+            max_degree=max_degree,
+            clusters=clusters,
+        )
+
+        cache = self._layout_cache()
+        if cache is not None:
+            self._data.key = self._data.structure_key()
+            layout = cache.get(self._data.key) or cache.latest()
+            if layout is not None:
+                self._data.set_positions(layout)
+
+        self._clusters = clusters or {}
+        with self.hold_sync():
+            self._graph = self._data.to_buffers()
+            self._send_frames()
 
     def save_layout(self, file: Union[str, Path]):
         """
@@ -296,7 +725,18 @@ class ForceGraphIntegration(anywidget.AnyWidget):
         self.send({"type": "load_layout", "positions": positions})
 
     def _handle_custom_msg(self, data: dict, buffers: Any):
-        if data["type"] == "layout":
+        if data["type"] == "expand":
+            self.expand(data["id"])
+
+        elif data["type"] == "collapse":
+            self.collapse(data["id"])
+
+        elif data["type"] == "cache_layout":
+            cache = self._layout_cache()
+            if cache is not None and data["key"] == self._data.key:
+                cache.set(key=data["key"], layout=data["positions"])
+
+        elif data["type"] == "layout":
             positions: dict[str, dict[Literal["x", "y", "z"], float]] = data[
                 "positions"
             ]
@@ -0,0 +1,83 @@
+"""
+.. versionadded:: 1.3.1
+
+This module converts multiple flux distributions into frames for the
+visualizations. A frame is a single flux distribution, e.g. a step of a
+parameter scan or a sample of :func:`cobra.sampling.sample`. All frames share
+the same map and are stored as one matrix, where each row is a frame and each
+column a reaction.
+
+The widgets only receive the matrix as a binary buffer, see
+:func:`encode_frames`.
+"""
+
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from cobra import Solution
+
+Frames = Union[
+    pd.DataFrame,
+    np.ndarray,
+    Iterable[Union[Solution, pd.Series, dict]],
+]
+
+
+def flux_frames(
+    solutions: Frames, reactions: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Returns a DataFrame where each row represents a frame and each column a
+    reaction. Reactions that are missing in a frame have the value NaN.
+
+    Args:
+        solutions: The flux distributions. This can be a sequence of
+            :class:`cobra.Solution`, Series or dictionaries, a DataFrame with
+            a row for each frame, e.g. the result of
+            :func:`cobra.sampling.sample`, or a two-dimensional array.
+        reactions (list, optional): Identifiers of the reactions. These are
+            the columns of the frames and they are required for arrays.
+            Defaults to all reactions found in the solutions.
+
+    Returns:
+        DataFrame: Frames with float values.
+
+    Raises:
+        ValueError: If an array is given without reactions or the shape of
+            the array does not match the reactions.
+    """
+    if isinstance(solutions, np.ndarray):
+        if reactions is None:
+            raise ValueError("Reactions must be given for an array of fluxes")
+
+        matrix = np.atleast_2d(solutions)
+        if matrix.ndim != 2 or matrix.shape[1] != len(reactions):
+            raise ValueError(
+                f"Array with shape {solutions.shape} does not match the "
+                f"{len(reactions)} given reactions"
+            )
+        return pd.DataFrame(data=matrix, columns=reactions, dtype=np.float32)
+
+    if not isinstance(solutions, pd.DataFrame):
+        solutions = pd.DataFrame(
+            [
+                item.fluxes if isinstance(item, Solution) else pd.Series(item)
+                for item in solutions
+            ]
+        ).reset_index(drop=True)
+
+    if reactions is not None:
+        solutions = solutions.reindex(columns=reactions)
+
+    return solutions.astype(np.float32)
+
+
+def encode_frames(frames: pd.DataFrame) -> Tuple[List[str], bytes]:
+    """
+    Returns the reaction identifiers and the fluxes of given frames as a
+    buffer with little-endian 32-bit floats in row-major order. The buffer is
+    sent to the front end without JSON encoding.
+    """
+    matrix = np.ascontiguousarray(frames.to_numpy(dtype="<f4"))
+    return [str(column) for column in frames.columns], matrix.tobytes()
@@ -3,7 +3,8 @@
 This modules has all the JSON objects that can be seen in the original JSON
 schema for Escher.
 
-The classes retain their original JSON names and attributes.
+The classes retain their original JSON names and attributes. They behave like
+dictionaries, but store their keys as slots.
 - Node: Represents the nodes. They can be a metabolite or markers. They give
 the position of all dots in the canvas.
 - Segment: Represents the connections between nodes.
@@ -11,16 +12,65 @@ the position of all dots in the canvas.
 visualization of the pathway.
 """
 
-from contextlib import suppress
-from collections import UserDict
-from typing import Any, Optional
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional
 
 from cobramod.error import NodeAttributeError
 from cobramod.visualization.pair import PairDictionary
 from cobramod.visualization.debug import debug_log
 
 
-class Node(UserDict):
+class _Item(MutableMapping):
+    """
+    Record for the JSON schema of Escher. The keys of the JSON are stored as
+    slots, which use less memory than dictionaries. Keys, that are not set,
+    do not appear in the record. Like dictionaries, the keys keep the order of
+    the JSON schema.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(
+                f'Key "{key}" is not part of {self.__class__.__name__}'
+            )
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.as_dict()})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns a native dictionary with the keys of the record. Values are
+        not copied.
+        """
+        return {key: getattr(self, key) for key in self}
+
+
+class Node(_Item):
     """
     Simple class that represent a node for the JSON schema of Escher. The
     node type can be either a 'metabolite', 'midmarker' or a 'multimarker'.
@@ -29,6 +79,25 @@ class Node(UserDict):
     corresponding arguments.
     """
 
+    __slots__ = (
+        "node_type",
+        "x",
+        "y",
+        "label_x",
+        "label_y",
+        "bigg_id",
+        "name",
+        "node_is_primary",
+    )
+    node_type: str
+    x: float
+    y: float
+    label_x: float
+    label_y: float
+    bigg_id: str
+    name: str
+    node_is_primary: bool
+
     def __init__(
         self: Any,
         node_type: str,
@@ -61,16 +130,20 @@ class Node(UserDict):
             node_is_primary (bool, optional): If the metabolite is a primary
                 compound.
         """
-        # Using a copy of locals, without self and the kwargs
-        kwargs = {
-            key: value
-            for key, value in locals().copy().items()
-            if key not in ("kwargs", "__class__", "self")
-        }
-        for method in (self.metabolite, self.marker):
-            with suppress(NodeAttributeError):
-                method(**kwargs)
-        if "node_type" not in self.data.keys():
+        if node_type in ("midmarker", "multimarker"):
+            self.marker(node_type=node_type, x=x, y=y)
+        elif node_type == "metabolite":
+            self.metabolite(
+                node_type=node_type,
+                x=x,
+                y=y,
+                label_x=label_x,  # type: ignore
+                label_y=label_y,  # type: ignore
+                bigg_id=bigg_id,
+                name=name,
+                node_is_primary=node_is_primary,
+            )
+        else:
             raise NodeAttributeError(
                 "Wrong attributes. Check 'node_types' and fix the arguments."
             )
@@ -81,9 +154,10 @@ class Node(UserDict):
         midmarker or multimarker. Arguments specified in __init__.
         """
         # The kwargs is just to get rid of arguments that do not belong here
-        # Must be yield, otherwise, the for loop wont work
         if node_type in ("midmarker", "multimarker"):
-            super().__init__(self, node_type=node_type, x=x, y=y)
+            self.node_type = node_type
+            self.x = x
+            self.y = y
         else:
             raise NodeAttributeError(
                 "Given node type does not represent a marker"
@@ -101,24 +175,25 @@ class Node(UserDict):
         node_is_primary: bool = False,
     ):
         """
-        Returns a dictionary with the arguments if node_type correspond to
+        Sets the attributes of the dictionary if node_type correspond to
         metabolite. Arguments specified in __init__,
         """
-        # Must be yield, otherwise, the for loop wont work
         if node_type == "metabolite":
-            kwargs = {
-                key: value
-                for key, value in locals().copy().items()
-                if key not in ("kwargs", "__class__", "self")
-            }
-            super().__init__(self, **kwargs)
+            self.node_type = node_type
+            self.x = x
+            self.y = y
+            self.label_x = label_x
+            self.label_y = label_y
+            self.bigg_id = bigg_id
+            self.name = name
+            self.node_is_primary = node_is_primary
         else:
             raise NodeAttributeError(
                 "Given node type does not represent a metabolite"
             )
 
 
-class Segment(UserDict):
+class Segment(_Item):
     """
     Build a segment for th reaction object for JsonCobramod, which can be
     later parsed into a proper JSON for Escher. A segment needs a starting
@@ -134,24 +209,27 @@ class Segment(UserDict):
         shapes the arrow.
     """
 
+    __slots__ = ("from_node_id", "to_node_id", "b1", "b2")
+    from_node_id: str
+    to_node_id: str
+    b1: Optional[dict]
+    b2: Optional[dict]
+
     def __init__(self, *args, **kwargs):
         """
         Build a segment for the reactionn object that will be included in
         JsonCobramod. Check, documentation of the class for arguments of this
         method.
         """
-        super().__init__(self, *args, **kwargs)
-        for key in ("from_node_id", "to_node_id", "b1", "b2"):
-            try:
-                self.data[key]
-            except KeyError:
-                if key in ("from_node_id", "to_node_id"):
-                    raise ValueError(f"Argument '{key}' missing")
-                elif key in ("b1", "b2"):
-                    self.data[key] = None
-
-
-class Reaction(UserDict):
+        self.update(*args, **kwargs)
+        for key in ("from_node_id", "to_node_id"):
+            if key not in self:
+                raise ValueError(f"Argument '{key}' missing")
+        for key in ("b1", "b2"):
+            self.setdefault(key, None)
+
+
+class Reaction(_Item):
     """
     Simple class that represent a reaction for the JSON schema for Escher. A
     Reaction have the Segment that give the position of the reaction in the
@@ -177,45 +255,43 @@ class Reaction(UserDict):
             the connections between nodes.
     """
 
+    __slots__ = (
+        "name",
+        "bigg_id",
+        "reversibility",
+        "label_x",
+        "label_y",
+        "gene_reaction_rule",
+        "genes",
+        "segments",
+        "metabolites",
+    )
+    name: str
+    bigg_id: str
+    reversibility: bool
+    label_x: float
+    label_y: float
+    gene_reaction_rule: str
+    genes: list
+    segments: PairDictionary
+    metabolites: list
+
     def __init__(self, *args, **kwargs):
         """
         Creates an object with the information for the representation of a
         reaction in Escher. All keyword arguments are located in the docstring
         of the class
         """
-        super().__init__(self, *args, **kwargs)
-        for key in (
-            "name",
-            "bigg_id",
-            "reversibility",
-            "label_x",
-            "label_y",
-            "gene_reaction_rule",
-            "genes",
-            "metabolites",
-            "segments",
-        ):
-            try:
-                self.data[key]
-            except KeyError:
-                # Arguments must be passed this way, otherway UserDict loses
-                # its functionalities.
-                if key in (
-                    "name",
-                    "bigg_id",
-                    "reversibility",
-                    "label_x",
-                    "label_y",
-                ):
-                    # Obligatory arguments
-                    raise ValueError(f"Argument '{key}' missing")
-                elif key == "gene_reaction_rule":
-                    self.data[key] = ""
-                elif key in ("genes", "metabolites"):
-                    self.data[key] = list()
-                elif key == "segments":
-                    self.data[key] = PairDictionary()
-        debug_log.debug(f'New Reaction "{self.data["bigg_id"]}" created.')
+        self.update(*args, **kwargs)
+        # Obligatory arguments
+        for key in ("name", "bigg_id", "reversibility", "label_x", "label_y"):
+            if key not in self:
+                raise ValueError(f"Argument '{key}' missing")
+        self.setdefault("gene_reaction_rule", "")
+        self.setdefault("genes", list())
+        self.setdefault("segments", PairDictionary())
+        self.setdefault("metabolites", list())
+        debug_log.debug(f'New Reaction "{self.bigg_id}" created.')
 
     def add_metabolite(self, bigg_id: str, coefficient: float):
         """
@@ -228,12 +304,10 @@ class Reaction(UserDict):
             coefficient (float): Coefficient of the metabolite for the
                 reaction.
         """
-        self.data["metabolites"].append(
-            dict(bigg_id=bigg_id, coefficient=coefficient)
-        )
+        self.metabolites.append(dict(bigg_id=bigg_id, coefficient=coefficient))
         debug_log.debug(
             f"Metabolite information added to Reaction "
-            f'"{self.data["bigg_id"]}"'
+            f'"{self.bigg_id}"'
             f' with id "{bigg_id}". Coefficient: {coefficient}.'
         )
 
@@ -249,7 +323,7 @@ class Reaction(UserDict):
             to_node_id (str): json data identifier, that represents the last
                 node for the segment.
         """
-        self.data["segments"].update(
+        self.segments.update(
             {
                 identifier: Segment(
                     from_node_id=from_node_id, to_node_id=to_node_id
@@ -257,6 +331,6 @@ class Reaction(UserDict):
             }
         )
         debug_log.debug(
-            f'New Segment "{self.data["bigg_id"]}" in Reaction '
+            f'New Segment "{self.bigg_id}" in Reaction '
             f'"{identifier}" From: {from_node_id}, to {to_node_id}'
         )
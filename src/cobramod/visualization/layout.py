@@ -0,0 +1,131 @@
+"""
+.. versionadded:: 1.3.1
+
+This module caches the layouts of the visualizations in the data directory.
+A layout is stored as a JSON file in the folder "Layout" and it is identified
+by a hash of the structure that is visualized, see :func:`layout_key`. Each
+kind of visualization and each pathway or model has its own sub-folder, so
+that the latest layout can be used as a starting point when the structure
+changes. Only the newest layouts of each sub-folder are kept.
+"""
+
+import json
+import urllib.parse
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Union
+
+import cobramod.utils as cmod_utils
+from cobramod.visualization.debug import debug_log
+
+# Number of layouts that are kept for each pathway or model
+MAX_LAYOUTS = 20
+
+
+def layout_key(*parts: Any) -> str:
+    """
+    Returns a hash for given parts, e.g. the graph and the reaction strings
+    of a pathway. The parts must be serializable as JSON. Tuples and lists
+    are considered equal.
+    """
+    text = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return sha256(text.encode()).hexdigest()
+
+
+class LayoutCache:
+    """
+    Layouts stored as JSON files in the directory "Layout/<kind>/<name>" of
+    the data directory.
+
+    Attributes:
+        path (Path): Directory with the layouts.
+        max_layouts (int): Number of layouts that are kept. Storing a layout
+            removes the oldest ones.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        name: str,
+        kind: str = "escher",
+        max_layouts: int = MAX_LAYOUTS,
+    ):
+        """
+        Args:
+            directory (Path): Directory to store and retrieve local data.
+            name (str): Identifier of the pathway or model.
+            kind (str, optional): Visualization of the layouts, e.g.
+                "escher" or "force-graph". Layouts of different kinds are
+                stored separately. Defaults to "escher".
+            max_layouts (int, optional): Number of layouts that are kept.
+                Defaults to :data:`MAX_LAYOUTS`.
+        """
+        self.path = Path(directory).joinpath(
+            "Layout", kind, urllib.parse.quote(name, safe="")
+        )
+        self.max_layouts = max_layouts
+
+    def __repr__(self) -> str:
+        return f"<LayoutCache in {self.path}>"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns the layout for given key or None if it is not stored.
+        """
+        with suppress(FileNotFoundError, json.JSONDecodeError):
+            with open(self.path.joinpath(f"{key}.json")) as file:
+                return json.load(file)
+        return None
+
+    def _files(self) -> List[Path]:
+        """
+        Returns the files of the layouts from the newest to the oldest. Files
+        that are removed by other processes in the meantime are skipped.
+        """
+        files = []
+        for file in self.path.glob("*.json"):
+            with suppress(FileNotFoundError):
+                files.append((file.stat().st_mtime_ns, file))
+        files.sort(reverse=True)
+        return [file for _, file in files]
+
+    def latest(self) -> Optional[dict]:
+        """
+        Returns the layout that was stored last or None if the directory is
+        empty.
+        """
+        for file in self._files():
+            layout = self.get(file.stem)
+            if layout is not None:
+                return layout
+        return None
+
+    def set(
+        self,
+        key: str,
+        layout: dict,
+        default: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Stores the layout under given key. The file is replaced at once and
+        the oldest layouts beyond the attribute 'max_layouts' are removed.
+
+        Args:
+            key (str): Hash of the layout. See :func:`layout_key`.
+            layout (dict): Data of the layout.
+            default (Callable, optional): Function that converts objects that
+                are not serializable as JSON. See :func:`json.dump`.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        cmod_utils.write_text(
+            self.path.joinpath(f"{key}.json"),
+            json.dumps(layout, default=default),
+        )
+        debug_log.debug(f'Layout "{key}" saved in "{self.path}".')
+
+        # The stored layout is kept even if other files have the same time
+        files = [file for file in self._files() if file.stem != key]
+        for file in files[max(self.max_layouts - 1, 0) :]:
+            file.unlink(missing_ok=True)
+            debug_log.debug(f'Layout "{file.stem}" removed from the cache.')
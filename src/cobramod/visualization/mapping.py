@@ -7,10 +7,11 @@ is lineal and creates the representation in a matrix. In case of cyclic path,
 it will cut it.
 """
 
+from collections import deque
 from itertools import chain
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 
-from cobramod.core.graph import get_graph_dict
+from cobramod.core.graph import CompactGraph, MappingCache, get_graph_dict
 
 
 def get_all_values(dictionary: dict, keys: list) -> set:
@@ -39,44 +40,53 @@ def get_all_values(dictionary: dict, keys: list) -> set:
     return set_values
 
 
-def child_map(mapping: list, dictionary: dict) -> dict:
+def child_map(
+    mapping: list, dictionary: Union[dict, CompactGraph]
+) -> Dict[str, list]:
     """
     Returns the relation parent: children as a dictionary. A key represent the
     parent and the key their corresponding children
 
     Args:
         mapping (list): Paths from given graph
-        dictionary (dict): Original dictionary of directed graph.
+        dictionary (dict, CompactGraph): Original dictionary of directed graph.
 
     Returns:
         Dict: Relation of parent and children.
     """
+    if not isinstance(dictionary, CompactGraph):
+        dictionary = CompactGraph.from_dict(dictionary)
+
+    adjacency = dictionary.adjacency()
+    # Paths that start with each node
+    starts: Dict[int, List[int]] = dict()
+    for index, path in enumerate(mapping):
+        starts.setdefault(dictionary.position[path[0]], []).append(index)
+
     relation: Dict[str, list] = dict()
     for index, path in enumerate(mapping):
-        # TODO: check if this condition is necesary
-        # if len(path) == 1:
-        #     continue
-        # Check for each path
-        path_2: list
-        for index_2, path_2 in enumerate(mapping):
-            if path_2 == path:
-                continue
-            # check if the first item is in the original path to check
-            values = get_all_values(dictionary=dictionary, keys=path)
-            if path_2[0] in values:
-                try:
-                    relation[str(index)].append(str(index_2))
-                except KeyError:
-                    relation[str(index)] = [str(index_2)]
+        children = {
+            child
+            for node in path
+            for child in adjacency[dictionary.position[node]]
+        }
+        found = sorted(
+            index_2
+            for child in children
+            for index_2 in starts.get(child, [])
+            if mapping[index_2] != path
+        )
+        if found:
+            relation[str(index)] = [str(index_2) for index_2 in found]
     return relation
 
 
-def get_index(dictionary: dict, path: list, value) -> int:
+def get_index(dictionary: Union[dict, CompactGraph], path: list, value) -> int:
     """
     Return index of item in a path, whose value is found.
 
     Args:
-        dictionary (dict): Original dictionary of directed graph
+        dictionary (dict, CompactGraph): Original dictionary of directed graph
         path (list): A list with the name of nodes to be searched.
         value (Any): Value to find in path
 
@@ -86,24 +96,35 @@ def get_index(dictionary: dict, path: list, value) -> int:
     Raises:
         Warning: If value is not found.
     """
+    if not isinstance(dictionary, CompactGraph):
+        dictionary = CompactGraph.from_dict(dictionary)
+
+    number = dictionary.position.get(value)
     for index, item in enumerate(path):
-        values = get_all_values(dictionary=dictionary, keys=[item])
-        if value in values:
+        if number in dictionary.children(dictionary.position[item]):
             return index
     # TODO: add error
     raise Warning(f'Value "{value}" not found.')
 
 
-def unformatted_matrix(graph: dict) -> List[list]:
+def unformatted_matrix(
+    graph: dict, mapping: Optional[List[list]] = None
+) -> List[list]:
     """
     Returns an unformatted matrix from a graph. The matrix represent the
     locations of the nodes and their relationships. Graph will be cut if
     cyclic. Unrelated nodes will be appended separately at the end. The matrix
     have 0 in empty positions.
 
+    .. versionchanged:: 1.3.1
+        Each path is placed once, after its first parent. Paths without
+        parents start new rows, even if they are not the first path.
+
     Args:
         graph (dict): Dictionary with relationship between nodes. A node can
             have multiple edges, which should be presented as values.
+        mapping (list, optional): Mapping of the graph, if already computed.
+            In this case, the graph must be already cut. Defaults to None.
     Returns
         List[list]: Representation of matrix
 
@@ -111,46 +132,53 @@ def unformatted_matrix(graph: dict) -> List[list]:
         KeyError: If keys in graph are missing
     """
     # If graph cyclic, it will be modified
-    mapping = get_graph_dict(graph=graph)
+    if mapping is None:
+        mapping = get_graph_dict(graph=graph)
     if not mapping:
         return [[]]
-    # By default firsts item
-    longest = mapping[0]
     # TODO: change defaults of height
-    relation = child_map(mapping=mapping, dictionary=graph)
+    compact = CompactGraph.from_dict(graph)
+    relation = child_map(mapping=mapping, dictionary=compact)
     # If path is completely unrelated
     if not relation:
         return mapping
-    matrix = [[0] * len(longest)]
-    matrix[0] = longest  # type: ignore
+    matrix: List[list] = []
     # dictionary for start positions
-    start_position = {"0": 0}
-    for index, keys in relation.items():
-        # child = item, parent = index
-        item: str
-        for item in keys:
-            # Should not raised an error since we have the relation
-            position_j = get_index(
-                dictionary=graph,
-                path=mapping[int(index)],
-                # Always look for the first item
-                value=mapping[int(item)][0],
-            )
-            # Use the start position from parent or define new start
-            try:
-                start = start_position[str(index)]
-            except KeyError:
-                start = 0
-            # add 0's and extend
-            start_position[item] = start + position_j + 1
-            row = [0] * start_position[item]
-            row.extend(mapping[int(item)])  # type: ignore
-            matrix.append(row)
+    start_position: Dict[str, int] = dict()
+    # Paths without parents come first. The first path is always the top row
+    children = set(chain.from_iterable(relation.values()))
+    roots = ["0"] + sorted(
+        relation, key=lambda index: (index in children, int(index))
+    )
+    for root in roots:
+        if root in start_position:
+            continue
+        start_position[root] = 0
+        matrix.append(mapping[int(root)])
+        # Each path is placed once, next to its first placed parent
+        queue = deque([root])
+        while queue:
+            index = queue.popleft()
+            item: str
+            for item in relation.get(index, []):
+                if item in start_position:
+                    continue
+                # Should not raised an error since we have the relation
+                position_j = get_index(
+                    dictionary=compact,
+                    path=mapping[int(index)],
+                    # Always look for the first item
+                    value=mapping[int(item)][0],
+                )
+                # add 0's and extend
+                start_position[item] = start_position[index] + position_j + 1
+                row = [0] * start_position[item]
+                row.extend(mapping[int(item)])  # type: ignore
+                matrix.append(row)
+                queue.append(item)
     # Add unrelated paths
-    for index, line in enumerate(mapping):
-        if str(index) not in relation.keys() and str(index) not in list(
-            chain.from_iterable(relation.values())
-        ):
+    for number, line in enumerate(mapping):
+        if str(number) not in start_position:
             matrix.append(line)  # type: ignore
     return matrix
 
@@ -173,6 +201,11 @@ def format_matrix(matrix: List[list], max_length: int) -> List[list]:
     Formats given matrix and returns, if possible, a reduced matrix. Matrix
     will be filled with 0's if needed.
 
+    .. versionchanged:: 1.3.1
+        Rows that are longer than given length, e.g. branches that start at
+        the end of their parent, extend the length of all rows. Rows are only
+        merged if the nodes do not overlap.
+
     Args:
         matrix (List[list]): Matrix to fill
         max_length (int): Desired length.
@@ -180,12 +213,14 @@ def format_matrix(matrix: List[list], max_length: int) -> List[list]:
     # TODO: check if sorting is necessary
     # Sort and fill missing 0
     matrix.sort(key=len, reverse=True)
+    if matrix:
+        max_length = max(max_length, len(matrix[0]))
     fill_matrix(matrix=matrix, length=max_length)
     # Squeeze rows with 0s if possible
     # new_matrix: List[list] = matrix.copy()
     for index_j, row in enumerate(matrix):
-        # Find row with 0s
-        if 0 not in row:
+        # Find row with 0s. The first row has nothing above
+        if 0 not in row or index_j == 0:
             # new_matrix.append(row)
             continue
         # Check if non-zero values can be appended above
@@ -196,8 +231,8 @@ def format_matrix(matrix: List[list], max_length: int) -> List[list]:
         }
         # check if all positions above are non-zero
         positions = {index_i for index_i, item in enumerate(row) if item != 0}
-        # if position is in previous then there is no space
-        if positions.issubset(previous):
+        # if any position is in previous then there is no space
+        if not positions.isdisjoint(previous):
             # new_matrix.append(row)
             continue
         previous_row: list = matrix[index_j - 1].copy()
@@ -212,24 +247,46 @@ def format_matrix(matrix: List[list], max_length: int) -> List[list]:
     return matrix
 
 
-def get_mapping(graph: dict) -> List[list]:
+def get_mapping(
+    graph: dict, cache: Optional[MappingCache] = None
+) -> List[list]:
     """
     Returns a matrix for the representation of given graph.
 
     Args:
         graph (dict): Dictionary with relationship between nodes. A node can
             have multiple edges, which should be presented as values.
+        cache (MappingCache, optional): Mapping of previous calls. Only the
+            components of the graph, that changed since then, are computed
+            again. If the graph did not change, the stored matrix is used.
+            Defaults to None.
     Returns
         List[list]: Representation of matrix
 
     Raises:
         KeyError: If keys in graph are missing
     """
-    # If graph is cyclic, it will be modified. Work with copy
-    matrix = unformatted_matrix(graph=graph.copy())
+    if cache is None:
+        # If graph is cyclic, it will be modified. Work with copy
+        matrix = unformatted_matrix(graph=graph.copy())
+
+    else:
+        cache.update(graph=graph)
+
+        if cache.matrix is not None:
+            return [row.copy() for row in cache.matrix]
+
+        # Rows of the matrix are filled with 0's. Work with copies
+        matrix = unformatted_matrix(
+            graph=cache.cut_graph(),
+            mapping=[path.copy() for path in cache.mapping],
+        )
     # Fill with 0 and merge rows if needed
     longest = len(matrix[0])
     matrix = format_matrix(matrix=matrix, max_length=longest)
+
+    if cache is not None:
+        cache.matrix = [row.copy() for row in matrix]
     return matrix
 
 
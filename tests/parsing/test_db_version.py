@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import shutil
 import tempfile
 import unittest
@@ -9,11 +10,16 @@ from unittest.mock import patch
 import pandas as pd
 from pandas._testing import assert_frame_equal, assert_series_equal
 
-from cobramod.parsing.db_version import DataVersionConfigurator
+from cobramod.error import DatabaseVersionError
+from cobramod.parsing.db_version import DataVersionConfigurator, read_versions
 
 data_conf = DataVersionConfigurator()
 
 
+def add_version(directory: str, database: str):
+    DataVersionConfigurator().set_database_version(directory, database, "1")
+
+
 class DataVersion(unittest.TestCase):
     directory: str
 
@@ -38,6 +44,7 @@ class DataVersion(unittest.TestCase):
         shutil.rmtree(cls.directory)
         # Removing metadata
         data_conf.database_version = None
+        data_conf.mismatch_policy = "ask"
 
     def test_get_database_version(self):
         database = data_conf.get_database_version(self.directory)
@@ -117,3 +124,85 @@ class DataVersion(unittest.TestCase):
 
         database = data_conf.get_database_version(self.directory)
         assert_frame_equal(database, self.versions)
+
+    def test_mismatch_policy(self):
+        data_conf.force_same_version = False
+
+        # CASE: Warning only once per database
+        data_conf.mismatch_policy = "warn"
+        with self.assertLogs(level=logging.WARNING) as cm:
+            for _ in range(3):
+                self.assertTrue(
+                    data_conf.check_database_version(
+                        self.directory, "bigg", "2.0.0"
+                    )
+                )
+        self.assertEqual(len(cm.output), 1)
+
+        # CASE: Error
+        data_conf.database_version = None
+        data_conf.mismatch_policy = "raise"
+        with self.assertLogs(level=logging.WARNING):
+            self.assertRaises(
+                DatabaseVersionError,
+                data_conf.check_database_version,
+                self.directory,
+                "bigg",
+                "2.0.0",
+            )
+
+        # CASE: File must be retrieved again
+        data_conf.mismatch_policy = "refetch"
+        with self.assertLogs(level=logging.WARNING):
+            self.assertFalse(
+                data_conf.check_database_version(
+                    self.directory, "bigg", "2.0.0"
+                )
+            )
+        data_conf.set_database_version(
+            self.directory, "bigg", "2.0.0", overwrite=True
+        )
+        self.assertTrue(
+            data_conf.check_database_version(self.directory, "bigg", "2.0.0")
+        )
+
+        # CASE: Wrong policy
+        with self.assertRaises(ValueError):
+            data_conf.mismatch_policy = "input"
+
+    def test_multiple_directories(self):
+        data_conf.mismatch_policy = "raise"
+        self.assertTrue(
+            data_conf.check_database_version(self.directory, "bigg", "1.0.0")
+        )
+
+        # CASE: Version of another directory is checked against its file
+        with tempfile.TemporaryDirectory() as directory:
+            pd.DataFrame({"orgid": ["bigg"], "version": ["0.9.0"]}).to_csv(
+                Path(directory, "DatabaseVersions.csv"), index=False
+            )
+            with self.assertLogs(level=logging.WARNING):
+                self.assertRaises(
+                    DatabaseVersionError,
+                    data_conf.check_database_version,
+                    directory,
+                    "bigg",
+                    "1.0.0",
+                )
+
+        # CASE: First directory is still known
+        self.assertTrue(
+            data_conf.check_database_version(self.directory, "bigg", "1.0.0")
+        )
+
+    def test_multiple_processes(self):
+        # CASE: Each process adds a database to the same file
+        databases = [f"database_{number}" for number in range(8)]
+        with multiprocessing.Pool(4) as pool:
+            pool.starmap(
+                add_version,
+                [(self.directory, database) for database in databases],
+            )
+
+        versions = read_versions(Path(self.directory, "DatabaseVersions.csv"))
+        self.assertListEqual(sorted(versions), ["bigg"] + databases)
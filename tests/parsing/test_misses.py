@@ -0,0 +1,74 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from cobramod.parsing.misses import (
+    FILENAME,
+    TTL,
+    MissingIdentifiers,
+    is_not_found,
+    read_misses,
+)
+
+missing = MissingIdentifiers()
+
+
+class TestMissingIdentifiers(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        missing.ttl = TTL
+        self.directory.cleanup()
+
+    def test_is_not_found(self):
+        response = requests.Response()
+
+        for status, expected in ((404, True), (500, False)):
+            response.status_code = status
+            error = requests.HTTPError(response=response)
+            self.assertIs(is_not_found(error), expected)
+
+        self.assertFalse(is_not_found(requests.HTTPError("No response")))
+
+    def test_add(self):
+        missing.add(self.path, "BIGG", "e_coli_core", "Invalid")
+        missing.add(self.path, "KEGG", None, "C99999")
+
+        # CASE: Stored with database and model
+        self.assertTrue(
+            missing.is_missing(self.path, "BIGG", "e_coli_core", "Invalid")
+        )
+        self.assertFalse(
+            missing.is_missing(self.path, "BIGG", "universal", "Invalid")
+        )
+        self.assertTrue(missing.is_missing(self.path, "KEGG", None, "C99999"))
+        self.assertEqual(len(read_misses(self.path / FILENAME)), 2)
+
+        # CASE: Entries expire
+        with patch("time.time", return_value=time.time() + TTL):
+            self.assertFalse(
+                missing.is_missing(self.path, "KEGG", None, "C99999")
+            )
+            missing.add(self.path, "KEGG", None, "C00001")
+        self.assertEqual(len(read_misses(self.path / FILENAME)), 1)
+
+        # CASE: Disabled cache
+        missing.ttl = 0
+        missing.add(self.path, "KEGG", None, "C00002")
+        self.assertFalse(missing.is_missing(self.path, "KEGG", None, "C00001"))
+
+        # CASE: Removed entries
+        missing.ttl = TTL
+        missing.clear(self.path)
+        self.assertFalse((self.path / FILENAME).exists())
+        self.assertFalse(missing.is_missing(self.path, "KEGG", None, "C00001"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -13,6 +13,7 @@ separated in:
 import unittest
 from logging import DEBUG
 from pathlib import Path
+from unittest.mock import patch
 
 import cobra.core as cobra_core
 import cobramod.retrieval as cmod_retrieval
@@ -176,6 +177,24 @@ class SimpleFunctions(unittest.TestCase):
         self.assertEqual(first=test_metabolite.charge, second=0)
         self.assertEqual(first=test_metabolite.formula, second="C12H22O11")
 
+    def test_collect_identifiers(self):
+        # CASE: Custom reaction with replacement
+        test_set = cr.collect_identifiers(
+            line="RXN_1, Reaction 1 | 2 WATER_c + NAD_c <-> NADH_c",
+            replacement={"NAD": "NAD-P"},
+        )
+        self.assertSetEqual(test_set, {"WATER", "NAD-P", "NADH"})
+        # CASE: Reaction or metabolite from database
+        test_set = cr.collect_identifiers(
+            line="ACETALD-DEHYDROG-RXN, c", replacement={}
+        )
+        self.assertSetEqual(test_set, {"ACETALD-DEHYDROG-RXN"})
+        # CASE: Custom metabolite
+        test_set = cr.collect_identifiers(
+            line="Custom_c, Custom metabolite, c, H20, 0", replacement={}
+        )
+        self.assertSetEqual(test_set, set())
+
     def test_get_file_metabolites(self):
         test_model = cobra_core.Model(NAME)
         # CASE: Testing if file is not found
@@ -788,6 +807,33 @@ class ComplexFunctions(unittest.TestCase):
             container=[member.id for member in test_model.metabolites],
         )
 
+    @patch("cobramod.retrieval.prefetch_data", return_value={})
+    def test_add_metabolites_max_workers(self, mocked_prefetch):
+        # CASE: Objects are retrieved one by one by default
+        test_model = cobra_core.Model(NAME)
+        cr.add_metabolites(
+            model=test_model,
+            obj=["HOMOMETHIONINE, c"],
+            directory=dir_data,
+            database="META",
+        )
+        mocked_prefetch.assert_not_called()
+        # CASE: Concurrent retrieval is opt-in
+        cr.add_metabolites(
+            model=test_model,
+            obj=["MALTOSE, b"],
+            directory=dir_data,
+            database="META",
+            max_workers=2,
+        )
+        self.assertEqual(
+            first=mocked_prefetch.call_args_list[0].args[0], second={"MALTOSE"}
+        )
+        self.assertListEqual(
+            list1=[member.id for member in test_model.metabolites],
+            list2=["HOMOMETHIONINE_c", "MALTOSE_b"],
+        )
+
     def test_add_reactions(self):
         # CASE: From str
         test_model = cobra_core.Model(NAME)
@@ -981,6 +1027,72 @@ class ComplexFunctions(unittest.TestCase):
 
         self.assertTrue(test_model.reactions.has_id("PYR_MAL_pc"))
 
+    def test_add_reactions_chunks(self):
+        # Preparation
+        test_model = cobra_core.Model(NAME)
+        test_file = dir_input.joinpath("reactions_chunks.txt")
+        test_checkpoint = dir_input.joinpath("reactions_chunks.json")
+        test_lines = [
+            "# Custom reactions",
+            "R_1, Reaction 1 | chunk_a_c --> chunk_b_c",
+            "R_2, Reaction 2 | chunk_b_c --> chunk_c_c",
+            "",
+            "R_3, Reaction 3 | chunk_c_c --> chunk_a_c",
+            "R_4, Reaction 4 | chunk_a_c <-> chunk_c_c",
+            "R_5, Reaction 5 | chunk_b_c <-> chunk_c_c",
+        ]
+        # Missing delimiter between identifier and reaction
+        test_file.write_text(
+            "\n".join(test_lines[:4] + ["R_3 chunk_c_c --> chunk_a_c"])
+        )
+
+        try:
+            # CASE: Import is interrupted after the first chunk
+            self.assertRaises(
+                ValueError,
+                cr.add_reactions,
+                model=test_model,
+                obj=test_file,
+                directory=dir_data,
+                chunk_size=2,
+                checkpoint=test_checkpoint,
+            )
+            self.assertListEqual(
+                [reaction.id for reaction in test_model.reactions],
+                ["R_1", "R_2"],
+            )
+            # CASE: Import resumes after the last committed line
+            test_file.write_text("\n".join(test_lines))
+            with self.assertLogs(level=DEBUG) as cm:
+                cr.add_reactions(
+                    model=test_model,
+                    obj=test_file,
+                    directory=dir_data,
+                    chunk_size=2,
+                    checkpoint=str(test_checkpoint),
+                )
+            self.assertFalse(any("already present" in x for x in cm.output))
+            self.assertFalse(any("not in the model" in x for x in cm.output))
+            self.assertListEqual(
+                [reaction.id for reaction in test_model.reactions],
+                ["R_1", "R_2", "R_3", "R_4", "R_5"],
+            )
+            # CASE: Resume with a model that lost the committed lines
+            test_model = cobra_core.Model(NAME)
+            with self.assertLogs(level=DEBUG) as cm:
+                cr.add_reactions(
+                    model=test_model,
+                    obj=test_file,
+                    directory=dir_data,
+                    chunk_size=2,
+                    checkpoint=test_checkpoint,
+                )
+            self.assertTrue(any("['R_5']" in x for x in cm.output))
+            self.assertEqual(first=len(test_model.reactions), second=0)
+        finally:
+            test_file.unlink()
+            test_checkpoint.unlink()
+
 
 if __name__ == "__main__":
     print(f"CobraMod version: {cmod_version}")
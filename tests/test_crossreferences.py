@@ -30,7 +30,7 @@ data_conf.force_same_version = True
 
 
 class TestCrossReferences(TestCase):
-    @patch("requests.get")
+    @patch("cobramod.transport.get")
     def test_inchikey2pubchem_cid(self, mocked_post):
         with tempfile.TemporaryDirectory() as directory:
             directory = Path(directory)
@@ -68,7 +68,7 @@ class TestCrossReferences(TestCase):
 
             pd.testing.assert_frame_equal(result, df)
 
-    @patch("requests.post")
+    @patch("cobramod.transport.post")
     def test_get_crossreferences(self, mocked_post):
         with tempfile.TemporaryDirectory() as directory:
             directory = Path(directory)
@@ -128,10 +128,12 @@ class TestCrossReferences(TestCase):
             )
             self.assertEqual(value, expected)
 
+    @patch("cobramod.transport.get")
     @patch("pandas.read_csv")
-    def test_metanetx2ec(self, mock):
+    def test_metanetx2ec(self, mock, mocked_get):
         with tempfile.TemporaryDirectory() as directory:
             directory = Path(directory)
+            mocked_get.return_value.content = b""
             mock.return_value = pd.DataFrame(
                 data={
                     "ID": ["test1", "test2"],
@@ -158,10 +160,12 @@ class TestCrossReferences(TestCase):
             )
             self.assertEqual("test2", result)
 
+    @patch("cobramod.transport.get")
     @patch("pandas.read_csv")
-    def test_get_reac_prop_with_ec(self, mock):
+    def test_get_reac_prop_with_ec(self, mock, mocked_get):
         with tempfile.TemporaryDirectory() as directory:
             directory = Path(directory)
+            mocked_get.return_value.content = b""
             mock.return_value = pd.DataFrame(
                 data={
                     "ID": ["test1", "test2"],
@@ -214,9 +218,9 @@ class TestCrossReferences(TestCase):
         for key, value in expected.items():
             self.assertCountEqual(value, dictonary[key])
 
-    @patch("requests.get")
+    @patch("cobramod.transport.get")
     @patch("pandas.read_csv")
-    @patch("requests.post")
+    @patch("cobramod.transport.post")
     def test_add_crossreferences(self, mocked_post, mock_pandas, mock_get):
         metabolite = Metabolite()
         metabolite.annotation = {"hmdb": "HMDB62758"}
@@ -260,6 +264,7 @@ class TestCrossReferences(TestCase):
         )
 
         mock_get.return_value.text = "154"
+        mock_get.return_value.content = b""
 
         with tempfile.TemporaryDirectory() as directory:
             directory = Path(directory)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Unit test for the logging configuration
+
+The logging is configured in temporary directories. The configuration is
+reset at the end of each test.
+"""
+
+import logging
+import multiprocessing as mp
+import queue
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from cobra import __version__ as cobra_version
+from cobramod import __version__ as cmod_version
+from cobramod.debug import (
+    configure_logging,
+    configure_worker_logging,
+    debug_log,
+    visualization_log,
+)
+
+
+def log_from_worker(records, number: int):
+    configure_worker_logging(records)
+    debug_log.info("From worker %d", number)
+
+
+class TestLogging(unittest.TestCase):
+    def tearDown(self):
+        configure_logging(directory=None)
+
+    def test_import(self):
+        # CASE: No files are created at import
+        with tempfile.TemporaryDirectory() as directory:
+            subprocess.run(
+                [sys.executable, "-c", "import cobramod.debug"],
+                cwd=directory,
+                check=True,
+            )
+            self.assertListEqual(list(Path(directory).iterdir()), [])
+
+    def test_configure_logging(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # CASE: Files in given directory
+            configure_logging(directory, stream=False)
+            debug_log.info("Message %s", "cobramod")
+            visualization_log.info("Message %s", "visualization")
+            configure_logging(directory=None)
+
+            files = {
+                file.name.split("_")[0]: file.read_text()
+                for file in Path(directory).iterdir()
+            }
+            self.assertIn("Message cobramod", files["cobramod"])
+            self.assertIn("Message visualization", files["visualization"])
+            self.assertNotIn("visualization", files["cobramod"])
+
+            # CASE: Calling it again does not duplicate the records
+            configure_logging(directory, stream=False)
+            configure_logging(directory, stream=False)
+            debug_log.warning("Only once")
+            configure_logging(directory=None)
+
+            text = next(Path(directory).glob("cobramod_*.log")).read_text()
+            self.assertEqual(text.count("Only once"), 1)
+
+    def test_queue(self):
+        records: queue.Queue = queue.Queue()
+
+        with tempfile.TemporaryDirectory() as directory:
+            # CASE: Worker only puts records into the queue
+            configure_worker_logging(records, level=logging.DEBUG)
+            debug_log.debug("From worker %d", 1)
+            self.assertEqual(records.qsize(), 1)
+
+            # CASE: Listener of main process writes the records
+            listener = configure_logging(directory, queue=records)
+            self.assertIsNotNone(listener)
+            visualization_log.info("From main")
+            configure_logging(directory=None)
+
+            text = next(Path(directory).glob("cobramod_*.log")).read_text()
+            self.assertIn("From worker 1", text)
+            text = next(Path(directory).glob("visualization_*.log")).read_text()
+            self.assertIn("From main", text)
+
+    @unittest.skipUnless(
+        "fork" in mp.get_all_start_methods(), "Processes cannot be forked"
+    )
+    def test_forked_workers(self):
+        context = mp.get_context("fork")
+        records = context.Queue()
+
+        with tempfile.TemporaryDirectory() as directory:
+            # CASE: Workers inherit the listener of the main process
+            listener = configure_logging(directory, stream=False, queue=records)
+            workers = [
+                context.Process(target=log_from_worker, args=(records, number))
+                for number in range(3)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+                self.assertEqual(worker.exitcode, 0)
+
+            # CASE: Listener of the main process is still running
+            debug_log.info("From main")
+            listener.stop()  # type: ignore
+            configure_logging(directory=None)
+
+            text = next(Path(directory).glob("cobramod_*.log")).read_text()
+            for number in range(3):
+                self.assertIn(f"From worker {number}", text)
+            self.assertIn("From main", text)
+
+
+if __name__ == "__main__":
+    print(f"CobraMod version: {cmod_version}")
+    print(f"COBRApy version: {cobra_version}")
+
+    unittest.main(verbosity=2)
@@ -343,6 +343,27 @@ class AddingPathways(unittest.TestCase):
                 container=[reaction.id for reaction in test_model.reactions],
             )
 
+    def test_add_pathway_context(self):
+        # CASE: Context of the model reverts the pathway
+        test_model = textbook_biocyc.copy()
+        with test_model:
+            ex.add_pathway(
+                model=test_model,
+                pathway="PWY-1187",
+                compartment="c",
+                directory=dir_data,
+                database="ARA",
+                ignore_list=[],
+                show_imbalance=False,
+            )
+            self.assertIn("RXN_11438_c", test_model.reactions)
+        self.assertNotIn("RXN_11438_c", test_model.reactions)
+        self.assertNotIn("AT1G18590", test_model.genes)
+        self.assertEqual(
+            first=len(test_model.reactions),
+            second=len(textbook_biocyc.reactions),
+        )
+
     def test_add_pathway(self):
         # CASE: Regular Biocyc
         test_model = textbook_biocyc.copy()
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 import cobramod.core.graph as gr
+import cobramod.visualization.mapping as mp
 from cobra import __version__ as cobra_version
 from cobramod import __version__ as cmod_version
 from cobramod.debug import change_to_debug
@@ -347,6 +348,278 @@ class GraphTesting(unittest.TestCase):
         )
         self.assertListEqual(list1=test_list[1], list2=["R7", "R8", "R10"])
 
+    def test_CompactGraph(self):
+        # CASE: Round-trip with single children, tuples and None
+        test_dict: dict[str, Any] = {
+            "R1": ("R2", "R3"),
+            "R2": "R4",
+            "R3": ("R4",),
+            "R4": None,
+            "R5": "R6",
+        }
+        test_graph = gr.CompactGraph.from_dict(graph=test_dict)
+        self.assertEqual(len(test_graph), 5)
+        self.assertIn("R1", test_graph)
+        # Children, that are not keys, are also interned
+        self.assertNotIn("R6", test_graph)
+        self.assertEqual(test_graph.position["R6"], 5)
+        self.assertListEqual(list(test_graph.children(0)), [1, 2])
+        self.assertDictEqual(test_graph.to_dict(), test_dict)
+
+        # CASE: Cut keys
+        test_graph = test_graph.cut([0, 1])
+        self.assertIsNone(test_graph.to_dict()["R1"])
+        self.assertIsNone(test_graph.to_dict()["R2"])
+        self.assertEqual(test_graph.to_dict()["R3"], ("R4",))
+
+    def test_filter_graph(self):
+        test_dict = {
+            "R1": ("R2", "R3"),
+            "R2": ("R3", "R4", "R5"),
+            "R3": ("R4",),
+            "R4": "R5",
+            "R5": None,
+        }
+        test_dict = gr.filter_graph(graph=test_dict, avoid_list=["R2", "R5"])
+        self.assertDictEqual(test_dict, {"R1": "R3", "R3": ("R4",), "R4": None})
+
+    def test_find_components(self):
+        # CASE: Lineal
+        test_dict = {"R1": "R2", "R2": "R3", "R3": None}
+        test_list = gr.find_components(graph=test_dict)
+        self.assertCountEqual(test_list, [["R1"], ["R2"], ["R3"]])
+
+        # CASE: Graph with cycle, from Biocyc (GLUCONEO-PWY)
+        test_dict = {
+            "R1": "R13",
+            "R2": "R3",
+            "R3": ("R2", "R1"),
+            "R13": None,
+        }
+        test_list = gr.find_components(graph=test_dict)
+        self.assertEqual(len(test_list), 3)
+        self.assertIn(["R3", "R2"], test_list)
+
+        # CASE: Restricted to some nodes
+        test_list = gr.find_components(graph=test_dict, nodes=["R2", "R3"])
+        self.assertListEqual(test_list, [["R3", "R2"]])
+
+    def test_cut_cycles(self):
+        # CASE: Simple cut
+        test_dict: dict[str, Any] = {"R1": "R2", "R2": "R3", "R3": "R1"}
+        gr.cut_cycles(graph=test_dict)
+        self.assertDictEqual(
+            d1=test_dict, d2={"R1": None, "R2": "R3", "R3": "R1"}
+        )
+
+        # CASE: Complex Cycle (CALVIN-PWY)
+        test_dict = {
+            "R1": ("R11", "R2"),
+            "R2": "R10",
+            "R3": "R2",
+            "R4": "R7",
+            "R5": "R4",
+            "R6": "R5",
+            "R7": ("R8", "R13"),
+            "R8": "R9",
+            "R9": "R1",
+            "R10": "R6",
+            "R11": None,
+            "R12": "R3",
+            "R13": "R12",
+        }
+        gr.cut_cycles(graph=test_dict)
+        self.assertIsNone(test_dict["R1"])
+        self.assertIsNone(test_dict["R2"])
+        self.assertEqual(test_dict["R3"], "R2")
+        self.assertFalse(gr.return_cycles(graph=test_dict))
+
+    def test_get_graph_dict(self):
+        # CASE: Complex Lineal
+        test_dict = {
+            "R0": "R1",
+            "R1": ("R2", "R7"),
+            "R2": "R3",
+            "R3": "R4",
+            "R4": "R5",
+            "R5": ("R6", "R9"),
+            "R6": "R12",
+            "R7": ("R8", "R11"),
+            "R8": "R10",
+            "R9": None,
+            "R10": None,
+            "R11": None,
+            "R12": None,
+        }
+        test_list = gr.get_graph_dict(graph=test_dict)
+        self.assertListEqual(
+            test_list,
+            [
+                ["R0", "R1", "R2", "R3", "R4", "R5", "R6", "R12"],
+                ["R7", "R8", "R10"],
+                ["R9"],
+                ["R11"],
+            ],
+        )
+
+        # CASE: Graph with cycle, from Biocyc (GLUCONEO-PWY)
+        test_dict = {
+            "R1": "R13",
+            "R2": "R3",
+            "R3": ("R2", "R1"),
+            "R4": None,
+            "R5": "R4",
+            "R6": "R5",
+            "R7": "R6",
+            "R8": "R7",
+            "R9": "R8",
+            "R10": None,
+            "R11": "R10",
+            "R12": None,
+            "R13": None,
+        }
+        test_list = gr.get_graph_dict(graph=test_dict)
+        self.assertListEqual(
+            test_list,
+            [
+                ["R9", "R8", "R7", "R6", "R5", "R4"],
+                ["R3", "R1", "R13"],
+                ["R11", "R10"],
+                ["R2"],
+                ["R12"],
+            ],
+        )
+
+        # CASE: Complex Cycle (CALVIN-PWY)
+        test_dict = {
+            "R1": ("R11", "R2"),
+            "R2": "R10",
+            "R3": "R2",
+            "R4": "R7",
+            "R5": "R4",
+            "R6": "R5",
+            "R7": ("R8", "R13"),
+            "R8": "R9",
+            "R9": "R1",
+            "R10": "R6",
+            "R11": None,
+            "R12": "R3",
+            "R13": "R12",
+        }
+        test_list = gr.get_graph_dict(graph=test_dict)
+        self.assertListEqual(
+            test_list,
+            [
+                ["R10", "R6", "R5", "R4", "R7", "R13", "R12", "R3", "R2"],
+                ["R8", "R9", "R1"],
+                ["R11"],
+            ],
+        )
+
+        # CASE: Large graph with cycles. Recursion limit must not be reached
+        test_dict = {f"R{i}": f"R{i + 1}" for i in range(10_000)}
+        test_dict["R10000"] = None
+        for i in range(0, 10_000, 100):
+            test_dict[f"R{i + 50}"] = (f"R{i + 51}", f"R{i}")
+
+        test_list = gr.get_graph_dict(graph=test_dict)
+        self.assertEqual(sum(len(path) for path in test_list), 10_001)
+        self.assertTrue(
+            all(
+                len(component) == 1
+                for component in gr.find_components(graph=test_dict)
+            )
+        )
+
+    def test_MappingCache(self):
+        # Preparation: two unrelated parts
+        test_dict: dict[str, Any] = {
+            "R1": "R2",
+            "R2": "R3",
+            "R3": "R1",
+            "R4": "R5",
+            "R5": None,
+        }
+        test_cache = gr.MappingCache()
+
+        # CASE: First update is the same as get_graph_dict
+        self.assertTrue(test_cache.update(graph=test_dict))
+        self.assertListEqual(
+            test_cache.mapping, gr.get_graph_dict(graph=test_dict.copy())
+        )
+        self.assertIsNone(test_cache.cut_graph()["R1"])
+        # Given graph is not modified
+        self.assertEqual(test_dict["R1"], "R2")
+
+        # CASE: Nothing changed
+        self.assertFalse(test_cache.update(graph=test_dict))
+
+        # CASE: New edge only changes one part
+        test_paths = [path for path in test_cache.mapping if "R1" in path]
+        test_dict["R6"] = None
+        test_dict["R5"] = "R6"
+        self.assertTrue(test_cache.update(graph=test_dict))
+        self.assertListEqual(
+            test_cache.mapping, gr.get_graph_dict(graph=test_dict.copy())
+        )
+        self.assertIn(test_paths[0], test_cache.mapping)
+        self.assertIn(["R4", "R5", "R6"], test_cache.mapping)
+
+        # CASE: Joining both parts
+        test_dict["R6"] = "R2"
+        test_cache.update(graph=test_dict)
+        self.assertListEqual(
+            test_cache.mapping, gr.get_graph_dict(graph=test_dict.copy())
+        )
+
+        # CASE: Missing key does not modify the cache
+        test_dict["R6"] = "R7"
+        self.assertRaises(GraphKeyError, test_cache.update, graph=test_dict)
+        self.assertEqual(test_cache.graph["R6"], "R2")
+
+    def test_mapping_cyclic(self):
+        # Graphs with branches that start at the end of their parents or
+        # parents that are not the first path
+        test_graphs: list[dict[str, Any]] = [
+            {
+                "R0": "R3",
+                "R1": ("R3", "R2"),
+                "R2": ("R4", "R7"),
+                "R3": "R5",
+                "R4": "R6",
+                "R5": "R6",
+                "R6": "R7",
+                "R7": "R5",
+            },
+            {
+                "R0": "R4",
+                "R1": "R2",
+                "R2": ("R0", "R5"),
+                "R3": "R1",
+                "R4": ("R1", "R3"),
+                "R5": ("R0", "R3"),
+            },
+            {
+                "R0": "R3",
+                "R1": ("R9", "R5"),
+                "R2": ("R4", "R7"),
+                "R3": "R2",
+                "R4": ("R1", "R8"),
+                "R5": ("R3", "R10"),
+                "R6": ("R9", "R10"),
+                "R7": "R8",
+                "R8": "R0",
+                "R9": "R6",
+                "R10": "R2",
+            },
+        ]
+        for test_dict in test_graphs:
+            # CASE: Each node is placed once in a rectangular matrix
+            test_matrix = mp.get_mapping(graph=test_dict)
+            test_nodes = [node for row in test_matrix for node in row if node]
+            self.assertCountEqual(test_nodes, test_dict.keys())
+            self.assertEqual(len({len(row) for row in test_matrix}), 1)
+
 
 if __name__ == "__main__":
     print(f"CobraMod version: {cmod_version}")
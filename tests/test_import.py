@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Unit test for the import of CobraMod
+
+The imports are tested in new interpreters, so that modules from other tests
+are not loaded yet.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+from cobra import __version__ as cobra_version
+from cobramod import __version__ as cmod_version
+
+# Upper limit in seconds for "import cobramod". The modules are only imported
+# on first use
+IMPORT_BUDGET = 0.5
+
+HEAVY_MODULES = [
+    "anywidget",
+    "traitlets",
+    "escher",
+    "requests",
+    "cobramod.visualization",
+]
+
+
+def run_import(statement: str) -> dict:
+    """
+    Returns the time in seconds and the loaded modules of given import
+    statement in a new interpreter.
+    """
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"modules = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'time': elapsed, 'modules': modules}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class TestImport(unittest.TestCase):
+    def test_import_cobramod(self):
+        # CASE: Benchmark of the top-level import. Best of three runs
+        results = [run_import("import cobramod") for _ in range(3)]
+        self.assertLess(
+            min(result["time"] for result in results), IMPORT_BUDGET
+        )
+        self.assertListEqual(results[0]["modules"], [])
+
+    def test_lazy_attributes(self):
+        # CASE: Pathway without visualization
+        result = run_import("from cobramod import Pathway")
+        self.assertNotIn("cobramod.visualization", result["modules"])
+        self.assertNotIn("anywidget", result["modules"])
+
+        # CASE: Unknown attribute
+        import cobramod
+
+        self.assertRaises(AttributeError, getattr, cobramod, "not_available")
+        self.assertIn("add_pathway", dir(cobramod))
+
+
+if __name__ == "__main__":
+    print(f"CobraMod version: {cmod_version}")
+    print(f"COBRApy version: {cobra_version}")
+
+    unittest.main(verbosity=2)
@@ -18,6 +18,7 @@ import cobra.core as cobra_core
 import cobra.io as cobra_io
 import cobramod.error as cmod_error
 import cobramod.test as cmod_test
+import numpy as np
 import pandas as pd
 from cobra import __version__ as cobra_version
 from cobramod import __version__ as cmod_version
@@ -201,10 +202,59 @@ class TestGroup(unittest.TestCase):
         test_group.vertical = True
         test_builder = test_group.visualize(vis="escher-custom")
 
+        # CASE: Pathway pickled by a previous version without a cache
+        del test_group.__dict__["_mapping_cache"]
+        test_builder = test_group.visualize(vis="escher-custom")
+        self.assertIsInstance(test_group._mapping_cache, pt.MappingCache)
+
+        self.assertEqual(
+            first=len(loads(test_builder.map_json)[1]["reactions"]),  # type: ignore
+            second=5,
+        )
+        # CASE: Multiple solutions share one map
+        test_solutions = []
+        for bound in (-2, -5, -10):
+            test_model.reactions.EX_glc__D_e.lower_bound = bound
+            test_solutions.append(test_model.optimize())
+        test_builder = test_group.visualize(
+            solution_fluxes=test_solutions, vis="escher-custom"
+        )
+        self.assertEqual(first=test_builder.n_frames, second=3)  # type: ignore
+        self.assertEqual(
+            first=test_builder.reaction_data["EX_glc__D_e"], second=-2
+        )  # type: ignore
         self.assertEqual(
             first=len(loads(test_builder.map_json)[1]["reactions"]),  # type: ignore
             second=5,
         )
+        test_widget = test_group.visualize(
+            solution_fluxes=test_solutions, vis="3d-force"
+        )
+        self.assertEqual(first=test_widget.n_frames, second=3)  # type: ignore
+        # CASE: Array with a column for each member
+        test_matrix = np.array(
+            [
+                [solution.fluxes[member.id] for member in test_group.members]
+                for solution in test_solutions
+            ]
+        )
+        test_builder = test_group.visualize(
+            solution_fluxes=test_matrix, vis="escher-custom"
+        )
+        self.assertEqual(first=test_builder.n_frames, second=3)  # type: ignore
+        self.assertEqual(
+            first=test_builder.reaction_data["EX_glc__D_e"], second=-2
+        )  # type: ignore
+        test_widget = test_group.visualize(
+            solution_fluxes=test_matrix, vis="3d-force"
+        )
+        self.assertEqual(first=test_widget.n_frames, second=3)  # type: ignore
+        self.assertRaises(
+            ValueError,
+            test_group.visualize,
+            solution_fluxes=test_matrix[:, :2],
+            vis="escher-custom",
+        )
         # CASE: Members after initialization.
         test_model = cmod_test.textbook.copy()
         test_group = pt.Pathway(id="test_group")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Unit test for the instrumentation of CobraMod
+
+The pathway is added with the local data of the test directory.
+"""
+
+import json
+import tempfile
+import unittest
+from contextlib import nullcontext
+from pathlib import Path
+
+from cobra import __version__ as cobra_version
+
+import cobramod.profiling as cmod_profiling
+from cobramod import __version__ as cmod_version
+from cobramod.core.extension import add_pathway
+from cobramod.parsing.db_version import DataVersionConfigurator
+from cobramod.test import textbook_biocyc
+
+dir_data = Path(__file__).resolve().parent.joinpath("data")
+
+
+class TestProfiling(unittest.TestCase):
+    def test_disabled(self):
+        # CASE: Nothing is recorded without profile
+        self.assertFalse(cmod_profiling.enabled())
+        self.assertIsInstance(cmod_profiling.span("stage"), nullcontext)
+        cmod_profiling.count(cmod_profiling.SOLVER_CALLS)
+
+        with cmod_profiling.profile() as profiler:
+            self.assertTrue(cmod_profiling.enabled())
+        self.assertFalse(cmod_profiling.enabled())
+        self.assertListEqual(profiler.calls, [])
+
+    def test_profile(self):
+        with cmod_profiling.profile() as profiler:
+            with cmod_profiling.span("call", identifier="first"):
+                cmod_profiling.count(cmod_profiling.CACHE_HITS)
+
+                with cmod_profiling.span("stage"):
+                    cmod_profiling.count(cmod_profiling.SOLVER_CALLS, 2)
+
+                with cmod_profiling.span("stage"):
+                    pass
+
+            cmod_profiling.count(cmod_profiling.HTTP_REQUESTS)
+
+        # CASE: Report with counters of the whole call
+        report = profiler.report()
+        self.assertEqual(len(report["calls"]), 1)
+        call = report["calls"][0]
+        self.assertDictEqual(call["attributes"], {"identifier": "first"})
+        self.assertDictEqual(
+            call["counters"], {"cache_hits": 1, "solver_calls": 2}
+        )
+        self.assertEqual(call["stages"]["stage"]["calls"], 2)
+        self.assertLessEqual(call["stages"]["stage"]["time"], call["time"])
+        self.assertDictEqual(report["counters"], {"http_requests": 1})
+
+        # CASE: Spans of OpenTelemetry
+        spans = profiler.spans()
+        self.assertEqual(
+            [span["name"] for span in spans], ["call"] + 2 * ["stage"]
+        )
+        self.assertIsNone(spans[0]["parent_id"])
+        self.assertEqual(spans[1]["parent_id"], spans[0]["context"]["span_id"])
+        self.assertEqual(
+            spans[1]["context"]["trace_id"], spans[0]["context"]["trace_id"]
+        )
+        self.assertEqual(spans[1]["attributes"], {"cobramod.solver_calls": 2})
+
+        # CASE: Export as JSON
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("profile.json")
+            profiler.to_json(path)
+            self.assertEqual(json.loads(path.read_text()), report)
+            self.assertEqual(json.loads(profiler.to_json(spans=True)), spans)
+
+    def test_add_pathway(self):
+        configurator = DataVersionConfigurator()
+        configurator.mismatch_policy = "warn"
+        test_model = textbook_biocyc.copy()
+
+        try:
+            with cmod_profiling.profile() as profiler:
+                add_pathway(
+                    model=test_model,
+                    pathway="AMMOXID-PWY",
+                    compartment="c",
+                    directory=dir_data,
+                    database="META",
+                    show_imbalance=False,
+                )
+        finally:
+            configurator.mismatch_policy = "ask"
+
+        # CASE: Stages and counters of one call
+        call = profiler.report()["calls"][0]
+        self.assertEqual(call["name"], "add_pathway")
+        self.assertEqual(call["attributes"]["pathway"], "AMMOXID-PWY")
+
+        for stage in ("get_data", "parse_file", "create_object", "summary"):
+            self.assertIn(stage, call["stages"])
+
+        self.assertGreater(call["counters"]["cache_hits"], 0)
+        self.assertGreater(call["counters"]["solver_calls"], 0)
+        self.assertEqual(call["counters"]["sinks"], len(test_model.sinks))
+
+
+if __name__ == "__main__":
+    print(f"CobraMod version: {cmod_version}")
+    print(f"COBRApy version: {cobra_version}")
+
+    unittest.main(verbosity=2)
@@ -4,12 +4,17 @@ Unit-test for data retrieval and Data version configuration. It checks that
 the files are loaded and saved properly
 """
 
+import tempfile
 import unittest
+from multiprocessing import Pool
 from pathlib import Path
 
+import requests
 from cobra import __version__ as cobra_version
 
+import cobramod.profiling as cmod_profiling
 import cobramod.retrieval as cmod_retrieval
+import cobramod.transport as cmod_transport
 from cobramod import __version__ as cmod_version
 from cobramod.debug import change_to_debug
 from cobramod.parsing.db_version import DataVersionConfigurator
@@ -23,6 +28,17 @@ if not dir_data.exists():
     raise NotADirectoryError("Data for the test is missing")
 
 
+def retrieve_replayed(directory: Path, archive: Path) -> int:
+    """
+    Retrieves a KEGG compound from the archive and returns the number of
+    downloads. Used by worker processes.
+    """
+    cmod_transport.configure_transport("replay", archive)
+    with cmod_profiling.profile() as profiler:
+        cmod_retrieval.retrieve_file("C00001", directory, "KEGG")
+    return profiler.counters[cmod_profiling.CACHE_MISSES]
+
+
 class RetrievalTesting(unittest.TestCase):
     @classmethod
     def setUp(cls):
@@ -133,6 +149,121 @@ class RetrievalTesting(unittest.TestCase):
             ).exists(),
         )
 
+    def test_prefetch_data(self):
+        # CASE: Local files
+        test_dict = cmod_retrieval.prefetch_data(
+            identifiers=["ACETALD-DEHYDROG-RXN", "2-KETOGLUTARATE", "2-PG"],
+            directory=dir_data,
+            database="META",
+            max_workers=2,
+        )
+        self.assertDictEqual(
+            test_dict,
+            {
+                "ACETALD-DEHYDROG-RXN": dir_data.joinpath(
+                    "META", "ACETALD-DEHYDROG-RXN.xml"
+                ),
+                "2-KETOGLUTARATE": dir_data.joinpath(
+                    "META", "2-KETOGLUTARATE.xml"
+                ),
+                "2-PG": dir_data.joinpath("META", "2-PG.xml"),
+            },
+        )
+
+    def test_multiple_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            directory = Path(directory)
+            data = directory.joinpath("data")
+            data.mkdir()
+
+            # Archive with the only response of the server
+            archive = cmod_transport.Archive(directory.joinpath("kegg.zip"))
+            request = requests.Request(
+                "GET", f"{cmod_retrieval.KEGG}C00001"
+            ).prepare()
+            archive.put(
+                archive.key(request),
+                {
+                    "method": "GET",
+                    "url": request.url,
+                    "status": 200,
+                    "reason": "OK",
+                    "headers": {"Content-Type": "text/plain"},
+                },
+                dir_data.joinpath("KEGG", "C00001.txt").read_bytes(),
+            )
+
+            # CASE: Each identifier is downloaded only once
+            with Pool(4) as pool:
+                downloads = pool.starmap(
+                    retrieve_replayed, [(data, archive.path)] * 8
+                )
+
+            self.assertEqual(sum(downloads), 1)
+            self.assertListEqual(
+                [item.name for item in data.joinpath("KEGG").iterdir()],
+                ["C00001.txt"],
+            )
+            self.assertEqual(
+                data.joinpath("KEGG", "C00001.txt").read_bytes(),
+                dir_data.joinpath("KEGG", "C00001.txt").read_bytes(),
+            )
+
+    def test_missing_identifiers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            directory = Path(directory)
+
+            # Archive where the identifier does not exist
+            archive = cmod_transport.Archive(directory.joinpath("kegg.zip"))
+            request = requests.Request(
+                "GET", f"{cmod_retrieval.KEGG}C99999"
+            ).prepare()
+            archive.put(
+                archive.key(request),
+                {
+                    "method": "GET",
+                    "url": request.url,
+                    "status": 404,
+                    "reason": "Not Found",
+                    "headers": {"Content-Type": "text/plain"},
+                },
+                b"",
+            )
+            cmod_transport.configure_transport("replay", archive.path)
+
+            try:
+                # CASE: The server answers once with 404
+                for requests_sent in (1, 0):
+                    with cmod_profiling.profile() as profiler:
+                        self.assertRaises(
+                            requests.HTTPError,
+                            cmod_retrieval.retrieve_file,
+                            "C99999",
+                            directory,
+                            "KEGG",
+                        )
+                    self.assertEqual(
+                        profiler.counters[cmod_profiling.HTTP_REQUESTS],
+                        requests_sent,
+                    )
+
+                # CASE: Queried again after removing the entries
+                cmod_retrieval.missing_identifiers.clear(directory)
+                with cmod_profiling.profile() as profiler:
+                    self.assertRaises(
+                        requests.HTTPError,
+                        cmod_retrieval.retrieve_file,
+                        "C99999",
+                        directory,
+                        "KEGG",
+                    )
+                self.assertEqual(
+                    profiler.counters[cmod_profiling.HTTP_REQUESTS], 1
+                )
+
+            finally:
+                cmod_transport.configure_transport("live")
+
 
 if __name__ == "__main__":
     print(f"CobraMod version: {cmod_version}")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Unit test for the storage of the data directory
+
+The test data is copied into a temporary directory and converted into a
+pack. Data from the pack must be the same as from the files.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from cobra import __version__ as cobra_version
+
+import cobramod.retrieval as cmod_retrieval
+import cobramod.storage as cmod_storage
+from cobramod import __version__ as cmod_version
+from cobramod.parsing.db_version import DataVersionConfigurator
+
+dir_data = Path(__file__).resolve().parent.joinpath("data")
+
+# Identifier, database, model_id and genome
+QUERIES = [
+    ("PEPDEPHOS-RXN", "ECOLI", None, None),
+    ("ATP", "ECOLI", None, None),
+    ("R02736", "KEGG", None, "eco"),
+    ("C00001", "KEGG", None, None),
+    ("ACALD", "BIGG", "e_coli_core", None),
+]
+
+
+class TestStorage(unittest.TestCase):
+    def setUp(self):
+        self.temporary = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temporary.name).joinpath("data")
+        shutil.copytree(
+            dir_data, self.directory, ignore=shutil.ignore_patterns("XRef")
+        )
+        data_conf = DataVersionConfigurator()
+        data_conf.database_version = None
+        data_conf.mismatch_policy = "warn"
+
+    def tearDown(self):
+        cmod_storage.configure_storage(compression=False)
+        cmod_storage.clear_packs()
+        data_conf = DataVersionConfigurator()
+        data_conf.database_version = None
+        data_conf.mismatch_policy = "ask"
+        self.temporary.cleanup()
+
+    def get_attributes(self) -> list:
+        return [
+            cmod_retrieval.get_data(
+                identifier, self.directory, database, model_id, genome
+            ).attributes
+            for identifier, database, model_id, genome in QUERIES
+        ]
+
+    def test_import_export(self):
+        expected = self.get_attributes()
+        atp = self.directory.joinpath("ECOLI", "ATP.xml")
+        original = atp.read_bytes()
+
+        # CASE: Files are moved into the pack
+        number = cmod_storage.import_directory(
+            self.directory, remove_files=True
+        )
+        self.assertGreater(number, len(QUERIES))
+        self.assertFalse(atp.exists())
+        self.assertTrue(
+            self.directory.joinpath("DatabaseVersions.csv").exists()
+        )
+        self.assertTrue(cmod_storage.exists(atp))
+        self.assertIsNotNone(cmod_storage.find_pack(atp))
+
+        # CASE: Same data from the pack, including genes and versions
+        self.assertListEqual(self.get_attributes(), expected)
+        self.assertEqual(
+            cmod_retrieval.find_file("ATP", self.directory, "ECOLI"),
+            (atp, "ECOLI"),
+        )
+        self.assertEqual(
+            cmod_retrieval.find_file("ACALD", self.directory, None),
+            (
+                self.directory.joinpath("BIGG", "e_coli_core", "ACALD.json"),
+                "E_COLI_CORE",
+            ),
+        )
+
+        # CASE: New files are stored in the pack
+        new = self.directory.joinpath("META", "NEW.xml")
+        cmod_storage.write_text(new, "<new/>")
+        self.assertFalse(new.exists())
+        self.assertEqual(cmod_storage.read_text(new), "<new/>")
+        cmod_storage.unlink(new)
+        self.assertRaises(FileNotFoundError, cmod_storage.read_text, new)
+        self.assertRaises(FileNotFoundError, cmod_storage.unlink, new)
+
+        # CASE: Files are written back and the pack removed
+        cmod_storage.main(["export", str(self.directory), "--remove"])
+        self.assertFalse(self.directory.joinpath(cmod_storage.PACK).exists())
+        self.assertIsNone(cmod_storage.find_pack(atp))
+        self.assertEqual(atp.read_bytes(), original)
+        self.assertListEqual(self.get_attributes(), expected)
+
+    def test_compression(self):
+        expected = self.get_attributes()
+        atp = self.directory.joinpath("ECOLI", "ATP.xml")
+        original = atp.read_text()
+
+        # CASE: New files are compressed
+        cmod_storage.configure_storage(compression=True)
+        new = self.directory.joinpath("META", "NEW.xml")
+        cmod_storage.write_text(new, "<new/>")
+        self.assertFalse(new.exists())
+        self.assertTrue(new.with_name("NEW.xml.gz").exists())
+        self.assertTrue(cmod_storage.exists(new))
+        self.assertEqual(cmod_storage.read_text(new), "<new/>")
+
+        # CASE: Existing files are compressed and read as before
+        cmod_storage.main(["compress", str(self.directory)])
+        compressed = atp.with_name("ATP.xml.gz")
+        self.assertFalse(atp.exists())
+        self.assertLess(compressed.stat().st_size, len(original) / 3)
+        self.assertEqual(cmod_storage.read_text(atp), original)
+        self.assertEqual(
+            cmod_retrieval.find_file("ATP", self.directory, "ECOLI"),
+            (atp, "ECOLI"),
+        )
+        self.assertEqual(
+            cmod_storage.search(self.directory.joinpath("ECOLI"), "ATP"), atp
+        )
+        self.assertListEqual(self.get_attributes(), expected)
+
+        # CASE: Compressed content in the pack
+        cmod_storage.import_directory(self.directory, remove_files=True)
+        self.assertListEqual(self.get_attributes(), expected)
+        cmod_storage.unlink(new)
+        self.assertFalse(cmod_storage.exists(new))
+
+        cmod_storage.export_directory(self.directory, remove_pack=True)
+        self.assertTrue(compressed.exists())
+
+        # CASE: Both formats are read without compression
+        cmod_storage.configure_storage(compression=False)
+        cmod_storage.write_text(new, "<new/>")
+        self.assertTrue(new.exists())
+        self.assertEqual(cmod_storage.read_text(atp), original)
+        self.assertListEqual(self.get_attributes(), expected)
+
+
+if __name__ == "__main__":
+    print(f"CobraMod version: {cmod_version}")
+    print(f"COBRApy version: {cobra_version}")
+
+    unittest.main(verbosity=2)
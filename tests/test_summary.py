@@ -5,14 +5,21 @@ This modules checks functions responsable for the creation of txt, csv and xlsx
 files.
 """
 
+import json
 import tempfile
 from pathlib import Path
 from unittest import TestCase, main
 
 import numpy
 import pandas
-from cobra import Model
-from cobramod.core.summary import DataModel, summary
+from cobra import Metabolite, Model, Reaction
+from cobra.core import Group
+from cobramod.core.summary import (
+    ChangeTracker,
+    DataModel,
+    boundary_types,
+    summary,
+)
 from cobramod.debug import change_to_debug
 from cobramod.test import textbook
 
@@ -24,6 +31,12 @@ class TestSummary(TestCase):
         # Case 1 example cobra model
         data_model = DataModel.from_model(textbook)
         self.assertIsInstance(obj=data_model, cls=DataModel)
+        self.assertListEqual(
+            data_model.exchanges, textbook.exchanges.list_attr("id")
+        )
+        self.assertListEqual(
+            data_model.demands, textbook.demands.list_attr("id")
+        )
 
         # Case 2 Empty cobra model
         model = Model("0")
@@ -313,6 +326,124 @@ class TestSummary(TestCase):
             for _ in directory.iterdir():
                 self.fail("Summary created a file!")
 
+    def test_change_tracker(self):
+        # Preparation
+        test_model = textbook.copy()
+        original = DataModel.from_model(test_model)
+        metabolite = Metabolite("new_c", compartment="c")
+        reaction = Reaction("NEW")
+        reaction.add_metabolites({metabolite: -1})
+        reaction.gene_reaction_rule = "new_gene"
+
+        with ChangeTracker(test_model) as tracker:
+            test_model.add_reactions([reaction])
+            test_model.add_boundary(test_model.metabolites.glc__D_e, "sink")
+            test_model.add_groups([Group("new_group")])
+            test_model.remove_reactions(["PGK"], remove_orphans=True)
+
+            # CASE: Changes of a nested context are reverted
+            with test_model:
+                test_model.remove_reactions(["PFK"])
+
+        # CASE: Tracker is removed and changes are kept
+        self.assertListEqual(test_model._contexts, [])
+        self.assertIn("NEW", test_model.reactions)
+
+        # CASE: Same differences as snapshots
+        new_values = DataModel.from_model(test_model)
+        expected = {
+            "additions": vars(new_values - original),
+            "deletions": vars(original - new_values),
+        }
+        result = {
+            "additions": vars(tracker.additions()),
+            "deletions": vars(tracker.deletions()),
+        }
+        for change, values in expected.items():
+            for key, value in values.items():
+                self.assertCountEqual(result[change][key], value)
+
+        self.assertListEqual(tracker.additions().sinks, ["SK_glc__D_e"])
+        self.assertListEqual(tracker.deletions().reactions, ["PGK"])
+        self.assertListEqual(tracker.additions().genes, ["new_gene"])
+
+        # CASE: Summary without file
+        summary(test_model, tracker, filename=None)
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = Path(directory) / "summary.txt"
+            summary(test_model, tracker, filename=filename)
+            self.assertIn("NEW", filename.read_text())
+
+        # CASE: Journal in order of the changes
+        journal = [(change, obj.id) for change, _, obj in tracker.journal]
+        self.assertLess(
+            journal.index(("added", "NEW")), journal.index(("removed", "PGK"))
+        )
+
+    def test_tracker_in_context(self):
+        test_model = textbook.copy()
+        reaction = Reaction("NEW")
+        reaction.add_metabolites({test_model.metabolites.atp_c: -1})
+
+        # CASE: Enclosing context still reverts the changes
+        with test_model:
+            with ChangeTracker(test_model) as tracker:
+                test_model.add_reactions([reaction])
+                test_model.reactions.PGK.lower_bound = 0
+            self.assertIn("NEW", test_model.reactions)
+
+        self.assertListEqual(tracker.additions().reactions, ["NEW"])
+        self.assertNotIn("NEW", test_model.reactions)
+        self.assertEqual(test_model.reactions.PGK.lower_bound, -1000)
+        self.assertListEqual(test_model._contexts, [])
+
+    def test_journal_formats(self):
+        # Preparation
+        test_model = textbook.copy()
+        with ChangeTracker(test_model) as tracker:
+            test_model.add_boundary(test_model.metabolites.glc__D_e, "sink")
+            test_model.remove_reactions(["PGK"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            # CASE: JSON lines
+            filename = Path(directory) / "summary.jsonl"
+            summary(test_model, tracker, filename=filename)
+
+            with open(filename) as file:
+                records = [json.loads(line) for line in file]
+            self.assertListEqual(
+                records,
+                [
+                    {
+                        "model": "e_coli_core",
+                        "change": "added",
+                        "type": "sinks",
+                        "identifier": "SK_glc__D_e",
+                    },
+                    {
+                        "model": "e_coli_core",
+                        "change": "removed",
+                        "type": "reactions",
+                        "identifier": "PGK",
+                    },
+                ],
+            )
+
+            # CASE: Parquet
+            filename = Path(directory) / "summary.parquet"
+            summary(test_model, tracker, filename=filename)
+
+            table = pandas.read_parquet(filename)
+            self.assertListEqual(table.to_dict(orient="records"), records)
+
+    def test_boundary_types(self):
+        reactions = [textbook.reactions.EX_glc__D_e, textbook.reactions.PGK]
+        self.assertDictEqual(
+            boundary_types(textbook, reactions),
+            {"exchanges": ["EX_glc__D_e"], "demands": [], "sinks": []},
+        )
+
 
 if __name__ == "__main__":
     main(verbosity=2)
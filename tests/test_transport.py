@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Unit test for the transport of requests
+
+The responses are recorded from a local HTTP server in a separate thread.
+The transport is set to "live" at the end of each test.
+"""
+
+import tempfile
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from cobra import __version__ as cobra_version
+
+import cobramod.profiling as cmod_profiling
+import cobramod.transport as cmod_transport
+from cobramod import __version__ as cmod_version
+from cobramod.error import NotRecordedError
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _answer(self, body: bytes):
+        status = 404 if self.path.startswith("/missing") else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Set-Cookie", "session=secret")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._answer(b"same content")
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self._answer(self.rfile.read(length))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTransport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = Path(self.directory.name).joinpath("responses.zip")
+
+    def tearDown(self):
+        cmod_transport.configure_transport("live")
+        self.directory.cleanup()
+
+    def test_configure_transport(self):
+        # CASE: Unknown mode or missing archive
+        self.assertRaises(
+            ValueError, cmod_transport.configure_transport, "offline"
+        )
+        self.assertRaises(
+            ValueError, cmod_transport.configure_transport, "record"
+        )
+        self.assertRaises(
+            FileNotFoundError,
+            cmod_transport.configure_transport,
+            "replay",
+            self.archive,
+        )
+
+        # CASE: Live sessions do not use the archive
+        session = cmod_transport.session()
+        self.assertNotIsInstance(
+            session.get_adapter(self.url), cmod_transport.ArchiveAdapter
+        )
+
+    def test_record_replay(self):
+        # CASE: Record responses, including errors
+        cmod_transport.configure_transport("record", self.archive)
+        response = cmod_transport.get(f"{self.url}/first")
+        self.assertEqual(response.text, "same content")
+        cmod_transport.get(f"{self.url}/second")
+        cmod_transport.get(f"{self.url}/missing")
+        cmod_transport.post(f"{self.url}/form", data={"query": "water"})
+        cmod_transport.post(
+            f"{self.url}/credentials/login/",
+            data={"email": "user", "password": "secret"},
+        )
+
+        # Same content is only stored once. No cookies or credentials
+        with zipfile.ZipFile(self.archive) as archive:
+            names = archive.namelist()
+            content = b"".join(archive.read(name) for name in names)
+        self.assertEqual(len([n for n in names if "requests/" in n]), 5)
+        self.assertEqual(len([n for n in names if "objects/" in n]), 3)
+        self.assertNotIn(b"session=", content)
+        self.assertNotIn(b"password", content)
+
+        # CASE: Replay without the server. Replayed requests are counted
+        cmod_transport.configure_transport("replay", self.archive)
+        with cmod_profiling.profile() as profiler:
+            response = cmod_transport.get(f"{self.url}/second")
+        self.assertEqual(profiler.counters["http_requests"], 1)
+        self.assertEqual(response.text, "same content")
+        self.assertEqual(response.encoding, "utf-8")
+
+        response = cmod_transport.get(f"{self.url}/missing")
+        self.assertRaises(requests.HTTPError, response.raise_for_status)
+
+        response = cmod_transport.post(
+            f"{self.url}/form", data={"query": "water"}
+        )
+        self.assertEqual(response.text, "query=water")
+
+        # Login with other credentials
+        response = cmod_transport.post(
+            f"{self.url}/credentials/login/",
+            data={"email": "other", "password": "other"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        # CASE: Requests that were not recorded
+        self.assertRaises(
+            NotRecordedError, cmod_transport.get, f"{self.url}/third"
+        )
+        self.assertRaises(
+            requests.ConnectionError,
+            cmod_transport.post,
+            f"{self.url}/form",
+            data={"query": "other"},
+        )
+
+
+if __name__ == "__main__":
+    print(f"CobraMod version: {cmod_version}")
+    print(f"COBRApy version: {cobra_version}")
+
+    unittest.main(verbosity=2)
@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
 import logging
+import os
+import stat
+import sys
+import tempfile
 import unittest
 from contextlib import suppress
 from pathlib import Path
@@ -55,6 +59,84 @@ class UtilsTesting(unittest.TestCase):
             stop_imbalance=True,
         )
 
+    def test_check_imbalances(self):
+        # Configuration
+        h2o = cobra_core.Metabolite("h2o_c", formula="H2O", charge=0)
+        h2 = cobra_core.Metabolite("h2_c", formula="H2", charge=0)
+        o2 = cobra_core.Metabolite("o2_c", formula="O2", charge=0)
+        h = cobra_core.Metabolite("h_c", formula="H", charge=1)
+
+        balanced = cobra_core.Reaction("R_BALANCED")
+        balanced.add_metabolites({h2: -2, o2: -1, h2o: 2})
+        unbalanced = cobra_core.Reaction("R_UNBALANCED")
+        unbalanced.add_metabolites({h2: -1, o2: -1, h2o: 1})
+        charged = cobra_core.Reaction("R_CHARGED")
+        charged.add_metabolites({h2: -1, h: 2})
+
+        test_reactions = [balanced, unbalanced, charged]
+
+        # CASE: Nothing is examined without stopping or showing
+        test_dict = ui.check_imbalances(
+            reactions=test_reactions, stop_imbalance=False, show_imbalance=False
+        )
+        self.assertDictEqual(test_dict, {})
+
+        # CASE: Same result as COBRApy
+        with self.assertLogs(level=logging.WARNING):
+            test_dict = ui.check_imbalances(
+                reactions=test_reactions,
+                stop_imbalance=False,
+                show_imbalance=True,
+            )
+        self.assertCountEqual(test_dict.keys(), ["R_UNBALANCED", "R_CHARGED"])
+        for reaction in test_reactions:
+            self.assertDictEqual(
+                test_dict.get(reaction.id, {}), reaction.check_mass_balance()
+            )
+
+        # CASE: Showing all imbalances in one message
+        with self.assertLogs(level=logging.DEBUG) as cm:
+            ui.check_imbalances(
+                reactions=test_reactions,
+                stop_imbalance=False,
+                show_imbalance=True,
+            )
+        self.assertIn("R_UNBALANCED", cm.output[-1])
+        self.assertIn("R_CHARGED", cm.output[-1])
+
+        # CASE: Stopping at imbalance
+        self.assertRaises(
+            cmod_error.UnbalancedReaction,
+            ui.check_imbalances,
+            reactions=test_reactions,
+            stop_imbalance=True,
+            show_imbalance=False,
+        )
+
+        # CASE: Reactions with formulas that cannot be parsed are skipped
+        wrong = cobra_core.Reaction("R_WRONG")
+        wrong.add_metabolites(
+            {cobra_core.Metabolite("poly_c", formula="(HPO3)n"): -1}
+        )
+        self.assertDictEqual(
+            ui.check_imbalances(
+                reactions=[wrong], stop_imbalance=False, show_imbalance=False
+            ),
+            {},
+        )
+        test_dict = ui.check_imbalances(
+            reactions=[wrong, unbalanced],
+            stop_imbalance=False,
+            show_imbalance=True,
+        )
+        self.assertCountEqual(test_dict.keys(), ["R_UNBALANCED"])
+        self.assertDictEqual(
+            ui.check_imbalances(
+                reactions=[wrong], stop_imbalance=True, show_imbalance=True
+            ),
+            {},
+        )
+
     def test_read_lines(self):
         # CASE 0: Comments and blank lines
         with open(file=dir_input.joinpath("test_reading_lines.txt")) as f:
@@ -128,6 +210,56 @@ class UtilsTesting(unittest.TestCase):
             self.assertEqual(first=2, second=sum(1 for _ in e))
         test_filename.unlink()
 
+    def test_atomic_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            test_filename = Path(directory).joinpath("data.txt")
+            ui.write_text(test_filename, "first")
+
+            # CASE: Errors keep the previous file
+            with self.assertRaises(ValueError):
+                with ui.atomic_file(test_filename) as temporary:
+                    temporary.write_text("partial")
+                    raise ValueError
+
+            self.assertEqual(test_filename.read_text(), "first")
+            self.assertListEqual(
+                list(Path(directory).iterdir()), [test_filename]
+            )
+
+            # CASE: Replaced at once
+            with ui.atomic_file(test_filename) as temporary:
+                self.assertTrue(temporary.name.startswith("."))
+                temporary.write_text("second")
+                self.assertEqual(test_filename.read_text(), "first")
+
+            self.assertEqual(test_filename.read_text(), "second")
+            self.assertListEqual(
+                list(Path(directory).iterdir()), [test_filename]
+            )
+
+    @unittest.skipIf(sys.platform == "win32", "No permissions of POSIX")
+    def test_atomic_file_mode(self):
+        with tempfile.TemporaryDirectory() as directory:
+            test_filename = Path(directory).joinpath("data.txt")
+            umask = os.umask(0o022)
+            try:
+                ui._umask.cache_clear()
+                # CASE: New files are created as with open
+                ui.write_text(test_filename, "first")
+                self.assertEqual(
+                    stat.S_IMODE(test_filename.stat().st_mode), 0o644
+                )
+
+                # CASE: Replaced files keep their permissions
+                test_filename.chmod(0o640)
+                ui.write_text(test_filename, "second")
+                self.assertEqual(
+                    stat.S_IMODE(test_filename.stat().st_mode), 0o640
+                )
+            finally:
+                os.umask(umask)
+                ui._umask.cache_clear()
+
     def test_find_intersection(self):
         # CASE 1: Reactions Not found
         test_dict = {"A": "No", "B": "NotFound"}
@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 """Unit test for sub-package visualization
 
-This module includes two TestCases:
+This module includes the TestCases:
 
 - TestItems: Creation and behavior of JSON objects for the Escher-schema
 - TestJsonDictionary: Testing the methods inside the JsonDictionary
+- TestMapping: Testing the mapping of the graphs
+- TestFrames: Multiple solutions for the same visualization
+- TestLayoutCache: Stored layouts of the visualizations
 """
 
+import os
 import unittest
 from contextlib import suppress
+from io import StringIO
+from json import loads
 from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
 
 import cobramod.visualization.mapping as mp
 from cobramod.error import FoundInPairError
@@ -17,8 +27,11 @@ from cobramod.visualization.converter import (
     JsonDictionary,
     Position,
     _convert_string,
+    interpolate_colors,
 )
 from cobramod.visualization.escher import EscherIntegration
+from cobramod.visualization.frames import encode_frames, flux_frames
+from cobramod.visualization.layout import LayoutCache, layout_key
 from cobramod.visualization.items import Node, Reaction, Segment
 from cobramod.visualization.pair import PairDictionary
 
@@ -84,6 +97,13 @@ class TestItems(unittest.TestCase):
         )
         self.assertIn(member="label_x", container=test_class.keys())
         self.assertEqual(first=test_class["node_type"], second="metabolite")
+        # CASE 2: Only keys from the JSON schema
+        self.assertRaises(KeyError, test_class.__setitem__, "x_label", 1)
+        self.assertFalse(hasattr(test_class, "__dict__"))
+        self.assertDictEqual(
+            d1=Node(node_type="midmarker", x=1, y=2).as_dict(),
+            d2={"node_type": "midmarker", "x": 1, "y": 2},
+        )
 
     def test_Segment(self):
         # CASE 0: Check instance behavior.
@@ -181,6 +201,20 @@ class TestJsonDictionary(unittest.TestCase):
         self.assertEqual(
             first=2, second=test_class._get_last_number(item="nodes")
         )
+        self.assertEqual(
+            first=1, second=test_class._get_last_number(item="segments")
+        )
+        # CASE 2: Counter increases with new nodes
+        test_class.add_marker(x=1, y=2, node_type="midmarker")
+        self.assertIn(member="2", container=test_class["nodes"])
+        self.assertEqual(
+            first=3, second=test_class._get_last_number(item="nodes")
+        )
+        # CASE 3: Counter is synchronized with new data
+        test_class["nodes"] = {"7": Node(node_type="midmarker", x=1, y=2)}
+        self.assertEqual(
+            first=8, second=test_class._get_last_number(item="nodes")
+        )
 
     def test_get_column_reactions(self):
         # Preparing tests
@@ -575,6 +609,50 @@ class TestJsonDictionary(unittest.TestCase):
             msg="Calculated color scale differs from the expected one",
         )
 
+    def test_interpolate_colors(self):
+        reaction_scale = [
+            {"type": "value", "value": 2.0, "color": "rgb(255,165,0)"},
+            {"type": "value", "value": 0, "color": "rgb(220,220,220)"},
+            {"type": "value", "value": -2.0, "color": "rgb(0,128,0)"},
+        ]
+        # CASE 1: Values in, between and outside of the scale
+        test_array = interpolate_colors(
+            fluxes=np.array([-3, -2, -1, 0, 1, 2, 3]),
+            reaction_scale=reaction_scale,
+        )
+        self.assertEqual(first=test_array.shape, second=(7, 3))
+        self.assertListEqual(
+            list1=test_array.tolist(),
+            list2=[
+                [0, 128, 0],
+                [0, 128, 0],
+                [110, 174, 110],
+                [220, 220, 220],
+                [237, 192, 110],
+                [255, 165, 0],
+                [255, 165, 0],
+            ],
+        )
+
+        # CASE 2: Colors of the solution after the grading
+        test_class = JsonDictionary()
+        test_class.flux_solution = pd.Series({"A": -2, "B": 0, "C": 2})
+        test_class.color_grading(color=["orange", "green"])
+        test_array = interpolate_colors(
+            fluxes=test_class.flux_solution.to_numpy(),
+            reaction_scale=test_class.reaction_scale,
+        )
+        self.assertListEqual(
+            list1=test_array.tolist(),
+            list2=[[0, 128, 0], [220, 220, 220], [255, 165, 0]],
+        )
+
+        # CASE 3: Empty scale
+        test_array = interpolate_colors(
+            fluxes=np.array([1.0]), reaction_scale=[]
+        )
+        self.assertListEqual(list1=test_array.tolist(), list2=[[220, 220, 220]])
+
     def test_json_dump(self):
         # CASE 1: Simple HTML and JSON with 4 reactions
         test_class = JsonDictionary()
@@ -615,6 +693,10 @@ class TestJsonDictionary(unittest.TestCase):
         )
         # Writing the JSON
         test_string = test_class.json_dump(indent=4)
+        # Streaming writer returns the same JSON
+        test_file = StringIO()
+        test_class.write_json(f=test_file, indent=4)
+        self.assertEqual(first=test_file.getvalue(), second=test_string)
         # Load the JSON and save the builder. Remove previous files.
         test_builder.map_json = test_string
         test_path = Path.cwd().joinpath("test_map.html")
@@ -660,6 +742,16 @@ class TestJsonDictionary(unittest.TestCase):
         self.assertEqual(first=test_builder.reaction_data["R1"], second=2)
         self.assertTrue(expr=test_path.exists())
 
+        # CASE 3: Map is only created as string when it is needed
+        self.assertFalse(expr=test_builder.trait_has_value("map_json"))
+        self.assertNotIn(member="map_json", container=test_builder.get_state())
+        test_map = test_builder.map_json
+        self.assertIn(member=test_map, container=test_path.read_text())
+        self.assertEqual(
+            first=loads(test_map)[1]["reactions"]["0"]["bigg_id"], second="R1"
+        )
+        self.assertIn(member="map_json", container=test_builder.get_state())
+
 
 class TestMapping(unittest.TestCase):
     """
@@ -915,5 +1007,124 @@ class TestMapping(unittest.TestCase):
         )
 
 
+class TestFrames(unittest.TestCase):
+    def test_flux_frames(self):
+        # CASE 1: Dictionaries with different reactions
+        test_frames = flux_frames(
+            solutions=[{"R1": 1, "R2": -2}, {"R2": 3, "R3": 4}]
+        )
+        self.assertEqual(first=test_frames.shape, second=(2, 3))
+        self.assertTrue(expr=np.isnan(test_frames.loc[0, "R3"]))
+        # CASE 2: Array with given reactions
+        test_frames = flux_frames(
+            solutions=np.arange(6).reshape(3, 2), reactions=["R1", "R2"]
+        )
+        self.assertListEqual(
+            list1=test_frames["R2"].tolist(), list2=[1.0, 3.0, 5.0]
+        )
+        self.assertRaises(ValueError, flux_frames, np.arange(6))
+        self.assertRaises(
+            ValueError, flux_frames, np.arange(6), reactions=["R1"]
+        )
+        # CASE 3: Binary buffer
+        test_reactions, test_buffer = encode_frames(test_frames)
+        self.assertListEqual(list1=test_reactions, list2=["R1", "R2"])
+        self.assertListEqual(
+            list1=np.frombuffer(test_buffer, dtype="<f4").tolist(),
+            list2=[0, 1, 2, 3, 4, 5],
+        )
+        # CASE 4: Widget
+        test_widget = EscherIntegration(map_json="[]")
+        self.assertEqual(first=test_widget.n_frames, second=0)
+        test_widget.set_frames(test_frames)
+        self.assertEqual(first=test_widget.n_frames, second=3)
+        self.assertEqual(first=test_widget.frame_fluxes, second=test_buffer)
+
+
+class TestLayoutCache(unittest.TestCase):
+    def test_layout_key(self):
+        # CASE 1: Tuples and lists are equal, order of keys is irrelevant
+        self.assertEqual(
+            first=layout_key({"R1": ("R2", "R3"), "R2": None}),
+            second=layout_key({"R2": None, "R1": ["R2", "R3"]}),
+        )
+        self.assertNotEqual(
+            first=layout_key({"R1": "R2"}, True),
+            second=layout_key({"R1": "R2"}, False),
+        )
+
+    def test_set(self):
+        with TemporaryDirectory() as directory:
+            test_cache = LayoutCache(
+                directory=directory, name="test", max_layouts=2
+            )
+            for number in range(4):
+                test_cache.set(key=f"key{number}", layout={"number": number})
+                os.utime(
+                    test_cache.path.joinpath(f"key{number}.json"),
+                    ns=(number, number),
+                )
+
+            # CASE 1: Oldest layouts are removed
+            self.assertListEqual(
+                list1=sorted(file.name for file in test_cache.path.iterdir()),
+                list2=["key2.json", "key3.json"],
+            )
+            self.assertEqual(first=test_cache.latest(), second={"number": 3})
+
+            # CASE 2: Kinds of visualizations do not share layouts
+            test_other = LayoutCache(
+                directory=directory, name="test", kind="force-graph"
+            )
+            self.assertNotEqual(first=test_other.path, second=test_cache.path)
+            self.assertIsNone(test_other.latest())
+            test_other.set(key="key4", layout={"number": 4})
+            self.assertEqual(first=test_cache.latest(), second={"number": 3})
+
+    def test_visualize(self):
+        with TemporaryDirectory() as directory:
+            test_cache = LayoutCache(directory=directory, name="test/group")
+            self.assertIsNone(test_cache.latest())
+            test_path = Path(directory).joinpath("test.html")
+
+            def visualize(graph: dict) -> str:
+                test_class = JsonDictionary()
+                test_class.graph = graph
+                test_class.reaction_strings = {
+                    "R1": "A_c --> B_c",
+                    "R2": "B_c --> C_c",
+                    "R3": "B_c --> D_c",
+                }
+                test_class.layout_cache = test_cache
+                test_builder = test_class.visualize(
+                    filepath=test_path, custom_integration=True
+                )
+                return test_builder.map_json  # type: ignore
+
+            # CASE 1: Stored layout gives the same map
+            test_graph = {"R1": ("R2", "R3"), "R2": None, "R3": None}
+            test_map = visualize(test_graph)
+            test_key = next(test_cache.path.glob("*.json")).stem
+            self.assertEqual(first=test_map, second=visualize(test_graph))
+            self.assertEqual(
+                first=len(list(test_cache.path.iterdir())), second=1
+            )
+
+            # CASE 2: Stored layout is used
+            test_layout = test_cache.get(test_key)
+            test_layout["canvas"] = [1, 2]  # type: ignore
+            test_cache.set(key=test_key, layout=test_layout)  # type: ignore
+            self.assertEqual(
+                first=loads(visualize(test_graph))[1]["canvas"]["width"],
+                second=1,
+            )
+
+            # CASE 3: Changed graph
+            visualize({"R1": "R2", "R2": None})
+            self.assertEqual(
+                first=len(list(test_cache.path.iterdir())), second=2
+            )
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
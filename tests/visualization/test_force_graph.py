@@ -1,11 +1,14 @@
 import json
 import unittest
+from tempfile import TemporaryDirectory
 
 import cobra.core
+import numpy as np
 
 from cobramod.test import textbook_biocyc
 from cobramod.visualization.force_graph import (
     Nodes,
+    GraphArrays,
     GraphData,
     Links,
     ForceGraphIntegration,
@@ -123,6 +126,37 @@ class TestGraphData(unittest.TestCase):
         self.assertIsInstance(data.links, set)
 
 
+class TestGraphArrays(unittest.TestCase):
+    def test_to_buffers(self):
+        data = GraphArrays(
+            ids=["R1", "A", "B"],
+            groups=np.array([1, 0, 0]),
+            source=np.array([1, 0]),
+            target=np.array([0, 2]),
+            value=np.array([1.0, 2.5]),
+        )
+        buffers = data.to_buffers()
+        self.assertEqual(["R1", "A", "B"], buffers["ids"])
+        self.assertEqual(bytes([1, 0, 0]), buffers["groups"])
+        self.assertEqual(
+            [1, 0], np.frombuffer(buffers["source"], "<i4").tolist()
+        )
+        self.assertEqual(
+            [0, 2], np.frombuffer(buffers["target"], "<i4").tolist()
+        )
+        self.assertEqual(
+            [1.0, 2.5], np.frombuffer(buffers["value"], "<f8").tolist()
+        )
+
+        self.assertEqual(
+            {
+                Links(source="A", target="R1", value=1.0),
+                Links(source="R1", target="B", value=2.5),
+            },
+            data.to_graph_data().links,
+        )
+
+
 class TestForceGraphIntegration(unittest.TestCase):
     def test_create(self):
         f_graph = ForceGraphIntegration()
@@ -197,7 +231,134 @@ class TestForceGraphIntegration(unittest.TestCase):
                 {"source": "NAD_c", "target": "ACALD", "value": 1.0},
             ],
         }
-        actual = json.loads(f_graph._model_rep)
+        actual = json.loads(f_graph._data.to_graph_data().to_json())
 
         self.assertCountEqual(expected["nodes"], actual["nodes"])
         self.assertCountEqual(expected["links"], actual["links"])
+
+        # Links are scaled by the solution
+        f_graph.solution = {"ACALD": -2}
+        actual = json.loads(f_graph._data.to_graph_data().to_json())
+        self.assertIn(
+            {"source": "ACALD", "target": "ACETALD_c", "value": 2.0},
+            actual["links"],
+        )
+        self.assertIn(
+            {"source": "ACETYL_COA_c", "target": "ACALD", "value": 2.0},
+            actual["links"],
+        )
+
+    def test_model_mode(self):
+        f_graph = ForceGraphIntegration()
+        test_model = textbook_biocyc.copy()
+        for reaction in test_model.reactions[:10]:
+            reaction.subsystem = "Subsystem"
+        test_model.groups.add(
+            cobra.core.Group(id="testGroup", members=test_model.reactions[5:15])
+        )
+        f_graph.model = test_model
+
+        groups = dict(zip(f_graph._data.ids, f_graph._data.groups.tolist()))
+        # Clusters replace their reactions
+        self.assertEqual(2, groups["Subsystem"])
+        self.assertEqual(2, groups["testGroup"])
+        for reaction in test_model.reactions[:15]:
+            self.assertNotIn(reaction.id, groups)
+        self.assertEqual(1, groups[test_model.reactions[15].id])
+        # Hub metabolites are removed
+        self.assertNotIn("PROTON_c", groups)
+
+        # CASE: Expanding and collapsing from the front end
+        reaction = test_model.reactions[7].id
+        f_graph._handle_custom_msg({"type": "expand", "id": "testGroup"}, [])
+        self.assertNotIn("testGroup", f_graph._data.ids)
+        self.assertNotIn(reaction, f_graph._data.ids)
+        f_graph._handle_custom_msg({"type": "expand", "id": "Subsystem"}, [])
+        self.assertIn(reaction, f_graph._data.ids)
+        f_graph._handle_custom_msg({"type": "collapse", "id": reaction}, [])
+        self.assertIn("testGroup", f_graph._data.ids)
+        self.assertIn("Subsystem", f_graph._data.ids)
+
+        # CASE: Threshold for hub metabolites
+        f_graph.max_degree = 1000
+        self.assertIn("PROTON_c", f_graph._data.ids)
+
+    def test_frames(self):
+        f_graph = ForceGraphIntegration()
+        test_model = textbook_biocyc.copy()
+        members = [reaction.id for reaction in test_model.reactions[:3]]
+        test_model.groups.add(
+            cobra.core.Group(id="testGroup", members=test_model.reactions[:3])
+        )
+        f_graph.model = test_model
+        f_graph.set_frames(
+            [{members[0]: 1, members[1]: 2}, {members[0]: -4, members[2]: 1}]
+        )
+
+        # CASE: Clusters are scaled by the sum of their reactions
+        self.assertEqual(2, f_graph.n_frames)
+        self.assertIn("testGroup", f_graph.frame_reactions)
+        fluxes = np.frombuffer(f_graph.frame_fluxes, dtype="<f4").reshape(2, -1)
+        column = f_graph.frame_reactions.index("testGroup")
+        self.assertEqual([3, -3], fluxes[:, column].tolist())
+        # Links produced and consumed by the cluster are scaled by its column
+        cluster = f_graph._data.ids.index("testGroup")
+        self.assertIn(cluster, f_graph._data.source.tolist())
+        self.assertIn(cluster, f_graph._data.target.tolist())
+
+        # CASE: Expanded clusters are not sent
+        f_graph.expand("testGroup")
+        self.assertNotIn("testGroup", f_graph.frame_reactions)
+        self.assertEqual(2, f_graph.n_frames)
+        f_graph.collapse("testGroup")
+        self.assertIn("testGroup", f_graph.frame_reactions)
+
+        # CASE: A solution replaces the frames
+        f_graph.solution = {members[0]: 1}
+        self.assertEqual(0, f_graph.n_frames)
+        f_graph.expand("testGroup")
+        self.assertEqual(0, f_graph.n_frames)
+
+    def test_layout_cache(self):
+        test_model = textbook_biocyc.copy()
+        group = cobra.core.Group(
+            id="testGroup", members=test_model.reactions[:2]
+        )
+        with TemporaryDirectory() as directory:
+            f_graph = ForceGraphIntegration()
+            f_graph.directory = directory
+            f_graph.model = group
+            self.assertIsNone(f_graph._data.positions)
+
+            # CASE: Front end sends the positions after the simulation
+            positions = {
+                identifier: [index, 0, 0]
+                for index, identifier in enumerate(f_graph._data.ids)
+            }
+            f_graph._handle_custom_msg(
+                {
+                    "type": "cache_layout",
+                    "key": f_graph._data.key,
+                    "positions": positions,
+                },
+                [],
+            )
+
+            # CASE: Same structure with another solution
+            f_graph.solution = {"ACALD": -3}
+            self.assertEqual(
+                list(range(len(positions))),
+                f_graph._data.positions[:, 0].tolist(),  # type: ignore
+            )
+
+            # CASE: New members are positioned by the front end
+            group.add_members([test_model.reactions[2]])
+            f_graph.model = group
+            known = [
+                identifier in positions for identifier in f_graph._data.ids
+            ]
+            self.assertEqual(
+                known,
+                (~np.isnan(f_graph._data.positions[:, 0])).tolist(),  # type: ignore
+            )
+            self.assertIn(False, known)